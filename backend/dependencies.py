@@ -1,29 +1,84 @@
-from collections.abc import Generator
+import os
+import socket
+from collections.abc import AsyncGenerator
 from pathlib import Path
+from datetime import timedelta
 from typing import Annotated
-from sqlmodel import Session
 from fastapi import Depends
 
-from backend.src.infrastructure.audio import AudioRegistry
-from backend.src.infrastructure.persistence.database import db_config
-from backend.src.infrastructure.persistence.repository import SQLiteAlarmRepository
+from backend.response_cache import ResponseCache
+from backend.src.application.alarm_scheduler import AlarmScheduler
+from backend.src.application.dispatch_metrics import (
+    DispatchMetricsSink,
+    RegistryDispatchMetrics,
+)
+from backend.src.application.event_dispatcher import EventDispatcher
+from backend.src.application.use_cases import (
+    CancelAlarmUseCase,
+    DeleteAlarmUseCase,
+    RunLeasedAlarmUseCase,
+    ScheduleAlarmUseCase,
+    TriggerScheduledAlarmUseCase,
+    UpdateScheduledAlarmUseCase,
+)
+from backend.src.domain.repository import AsyncAlarmRepository
+from backend.src.infrastructure.adapters import HueifyRoomService
+from backend.src.infrastructure.audio import AudioPlayer, AudioRegistry
+from backend.src.infrastructure.event_handlers import (
+    AlarmAudioContextRegistry,
+    AlarmAudioHandler,
+    AlarmStartedHandler,
+    AudioOnAlarmCancelledHandler,
+    AudioOnAlarmCompletedHandler,
+    AudioOnAlarmStartedHandler,
+    BrightnessChangeRequestedHandler,
+    EventHandler,
+    WaitRequestedHandler,
+)
+from backend.src.infrastructure.event_stream import AlarmEventBroadcaster
+from backend.src.infrastructure.persistence.read_models import AlarmQueries
+from backend.src.infrastructure.room_catalog import (
+    FakeRoomCatalogBackend,
+    HueifyRoomCatalogBackend,
+    RoomCatalog,
+    RoomCatalogBackend,
+)
+from backend.src.infrastructure.sound_profiles import SoundProfileRepository
+from backend.src.shared.metrics import EventLoopLagMonitor, MetricsRegistry, metrics
+from backend.src.shared.tracing import JsonlSpanExporter, Tracer, tracer
 
+_ASSETS_DIR = Path(__file__).parent.parent / "assets"
 
-def get_database_session() -> Generator[Session, None, None]:
-    yield from db_config.get_session()
 
+# The persistence stack (SQLModel, SQLAlchemy) is imported by the providers on
+# first use instead of at module level, so importing the API stays cheap.
+# FastAPI evaluates provider annotations eagerly, hence the protocol types.
+async def get_async_alarm_repository() -> AsyncGenerator[AsyncAlarmRepository, None]:
+    from backend.src.infrastructure.persistence.database import db_config
+    from backend.src.infrastructure.persistence.repository import (
+        AsyncSQLiteAlarmRepository,
+    )
 
-def get_alarm_repository(
-    session: Session = Depends(get_database_session),
-) -> SQLiteAlarmRepository:
-    return SQLiteAlarmRepository(session)
+    async for session in db_config.get_async_session():
+        yield AsyncSQLiteAlarmRepository(session, get_sound_profiles())
 
 
-InjectedAlarmRepository = Annotated[
-    SQLiteAlarmRepository, Depends(get_alarm_repository)
+InjectedAsyncAlarmRepository = Annotated[
+    AsyncAlarmRepository, Depends(get_async_alarm_repository)
 ]
 
 
+async def get_alarm_query_service() -> AsyncGenerator[AlarmQueries, None]:
+    from backend.src.infrastructure.persistence.database import db_config
+    from backend.src.infrastructure.persistence.queries import AlarmQueryService
+
+    async for session in db_config.get_async_session():
+        yield AlarmQueryService(session)
+
+
+InjectedAlarmQueryService = Annotated[AlarmQueries, Depends(get_alarm_query_service)]
+
+
 _audio_registry: AudioRegistry | None = None
 
 
@@ -31,10 +86,282 @@ def get_audio_registry() -> AudioRegistry:
     global _audio_registry
 
     if _audio_registry is None:
-        sounds_dir = Path(__file__).parent.parent / "assets"
-        _audio_registry = AudioRegistry(sounds_dir)
+        _audio_registry = AudioRegistry(_ASSETS_DIR)
 
     return _audio_registry
 
 
 InjectedAudioRegistry = Annotated[AudioRegistry, Depends(get_audio_registry)]
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _response_cache
+
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+
+    return _response_cache
+
+
+InjectedResponseCache = Annotated[ResponseCache, Depends(get_response_cache)]
+
+
+_room_catalog: RoomCatalog | None = None
+
+
+def _create_room_catalog_backend() -> RoomCatalogBackend:
+    # Without bridge credentials the catalog serves fake rooms, so the API
+    # stays usable offline
+    if os.getenv("HUE_BRIDGE_IP") and os.getenv("HUE_APP_KEY"):
+        return HueifyRoomCatalogBackend()
+    return FakeRoomCatalogBackend()
+
+
+def get_room_catalog() -> RoomCatalog:
+    global _room_catalog
+
+    if _room_catalog is None:
+        _room_catalog = RoomCatalog(_create_room_catalog_backend())
+
+    return _room_catalog
+
+
+InjectedRoomCatalog = Annotated[RoomCatalog, Depends(get_room_catalog)]
+
+
+_sound_profiles: SoundProfileRepository | None = None
+
+
+def get_sound_profiles() -> SoundProfileRepository:
+    global _sound_profiles
+
+    if _sound_profiles is None:
+        _sound_profiles = SoundProfileRepository(_ASSETS_DIR)
+
+    return _sound_profiles
+
+
+InjectedSoundProfiles = Annotated[SoundProfileRepository, Depends(get_sound_profiles)]
+
+
+_alarm_scheduler: AlarmScheduler | None = None
+
+
+def get_alarm_scheduler() -> AlarmScheduler:
+    global _alarm_scheduler
+
+    if _alarm_scheduler is None:
+        _alarm_scheduler = AlarmScheduler()
+
+    return _alarm_scheduler
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return metrics
+
+
+InjectedMetricsRegistry = Annotated[MetricsRegistry, Depends(get_metrics_registry)]
+
+
+_tracer_configured = False
+
+
+def get_tracer() -> Tracer:
+    global _tracer_configured
+
+    if not _tracer_configured:
+        # Every sampled ramp writes a few hundred spans; a small share of the
+        # alarms is enough to see where time goes without filling the disk
+        sample_rate = float(os.getenv("DAYLIGHT_ALARM_TRACE_SAMPLE_RATE", "0.05"))
+        trace_file = os.getenv(
+            "DAYLIGHT_ALARM_TRACE_FILE", "data/traces/alarm_traces.jsonl"
+        )
+        tracer.configure(JsonlSpanExporter(Path(trace_file)), sample_rate)
+        _tracer_configured = True
+
+    return tracer
+
+
+_event_loop_lag_monitor: EventLoopLagMonitor | None = None
+
+
+def get_event_loop_lag_monitor() -> EventLoopLagMonitor:
+    global _event_loop_lag_monitor
+
+    if _event_loop_lag_monitor is None:
+        _event_loop_lag_monitor = EventLoopLagMonitor(get_metrics_registry())
+
+    return _event_loop_lag_monitor
+
+
+_event_broadcaster: AlarmEventBroadcaster | None = None
+
+
+def get_event_broadcaster() -> AlarmEventBroadcaster:
+    global _event_broadcaster
+
+    if _event_broadcaster is None:
+        _event_broadcaster = AlarmEventBroadcaster()
+        get_metrics_registry().gauge(
+            "event_stream_subscribers", "Clients connected to the alarm event stream"
+        ).set_function(lambda: _event_broadcaster.subscriber_count)
+
+    return _event_broadcaster
+
+
+InjectedEventBroadcaster = Annotated[
+    AlarmEventBroadcaster, Depends(get_event_broadcaster)
+]
+
+
+_audio_contexts: AlarmAudioContextRegistry | None = None
+
+
+def get_audio_contexts() -> AlarmAudioContextRegistry:
+    global _audio_contexts
+
+    if _audio_contexts is None:
+        _audio_contexts = AlarmAudioContextRegistry()
+
+    return _audio_contexts
+
+
+_event_handlers: list[EventHandler] | None = None
+
+
+def get_event_handlers() -> list[EventHandler]:
+    global _event_handlers
+
+    if _event_handlers is None:
+        room_service = HueifyRoomService()
+        audio_player = AudioPlayer(_ASSETS_DIR)
+        audio_contexts = get_audio_contexts()
+        _event_handlers = [
+            AlarmStartedHandler(room_service),
+            BrightnessChangeRequestedHandler(room_service),
+            WaitRequestedHandler(),
+            AudioOnAlarmStartedHandler(audio_player, audio_contexts),
+            AudioOnAlarmCompletedHandler(audio_player, audio_contexts),
+            AudioOnAlarmCancelledHandler(audio_player, audio_contexts),
+            get_event_broadcaster(),
+        ]
+
+    return _event_handlers
+
+
+def get_audio_handlers() -> list[AlarmAudioHandler]:
+    return [get_audio_contexts()]
+
+
+_dispatch_metrics: DispatchMetricsSink | None = None
+
+
+def get_dispatch_metrics() -> DispatchMetricsSink:
+    global _dispatch_metrics
+
+    if _dispatch_metrics is None:
+        _dispatch_metrics = RegistryDispatchMetrics(get_metrics_registry())
+
+    return _dispatch_metrics
+
+
+def _slow_handler_budget_seconds() -> float | None:
+    budget_ms = os.getenv("DAYLIGHT_ALARM_SLOW_HANDLER_MS", "250")
+    return float(budget_ms) / 1000 if budget_ms else None
+
+
+_event_dispatcher: EventDispatcher | None = None
+
+
+def get_event_dispatcher() -> EventDispatcher:
+    global _event_dispatcher
+
+    if _event_dispatcher is None:
+        _event_dispatcher = EventDispatcher(
+            get_event_handlers(),
+            metrics=get_dispatch_metrics(),
+            slow_handler_budget_seconds=_slow_handler_budget_seconds(),
+        )
+
+    return _event_dispatcher
+
+
+_leased_alarm_runner: RunLeasedAlarmUseCase | None = None
+
+
+def get_leased_alarm_runner() -> RunLeasedAlarmUseCase:
+    global _leased_alarm_runner
+
+    if _leased_alarm_runner is None:
+        from backend.src.infrastructure.persistence.database import db_config
+        from backend.src.infrastructure.persistence.leases import SQLiteAlarmLeaseStore
+
+        lease_seconds = float(os.getenv("DAYLIGHT_ALARM_LEASE_SECONDS", "30"))
+        _leased_alarm_runner = RunLeasedAlarmUseCase(
+            SQLiteAlarmLeaseStore(db_config.async_engine, get_sound_profiles()),
+            TriggerScheduledAlarmUseCase(get_event_dispatcher()),
+            worker_id=f"{socket.gethostname()}:{os.getpid()}",
+            audio_handlers=get_audio_handlers(),
+            lease_duration=timedelta(seconds=lease_seconds),
+        )
+
+    return _leased_alarm_runner
+
+
+def get_schedule_alarm_use_case(
+    repository: InjectedAsyncAlarmRepository,
+) -> ScheduleAlarmUseCase:
+    return ScheduleAlarmUseCase(
+        event_dispatcher=get_event_dispatcher(),
+        alarm_scheduler=get_alarm_scheduler(),
+        audio_handlers=get_audio_handlers(),
+        repository=repository,
+    )
+
+
+def get_update_alarm_use_case(
+    repository: InjectedAsyncAlarmRepository,
+) -> UpdateScheduledAlarmUseCase:
+    return UpdateScheduledAlarmUseCase(
+        event_dispatcher=get_event_dispatcher(),
+        alarm_scheduler=get_alarm_scheduler(),
+        repository=repository,
+        audio_handlers=get_audio_handlers(),
+    )
+
+
+def get_cancel_alarm_use_case(
+    repository: InjectedAsyncAlarmRepository,
+) -> CancelAlarmUseCase:
+    return CancelAlarmUseCase(
+        event_dispatcher=get_event_dispatcher(),
+        alarm_scheduler=get_alarm_scheduler(),
+        repository=repository,
+    )
+
+
+def get_delete_alarm_use_case(
+    repository: InjectedAsyncAlarmRepository,
+) -> DeleteAlarmUseCase:
+    return DeleteAlarmUseCase(
+        event_dispatcher=get_event_dispatcher(),
+        alarm_scheduler=get_alarm_scheduler(),
+        repository=repository,
+    )
+
+
+InjectedScheduleAlarmUseCase = Annotated[
+    ScheduleAlarmUseCase, Depends(get_schedule_alarm_use_case)
+]
+InjectedUpdateAlarmUseCase = Annotated[
+    UpdateScheduledAlarmUseCase, Depends(get_update_alarm_use_case)
+]
+InjectedCancelAlarmUseCase = Annotated[
+    CancelAlarmUseCase, Depends(get_cancel_alarm_use_case)
+]
+InjectedDeleteAlarmUseCase = Annotated[
+    DeleteAlarmUseCase, Depends(get_delete_alarm_use_case)
+]
@@ -1,16 +1,85 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
-from backend.src.infrastructure.persistence.database import db_config
+from backend.serialization import FastJSONResponse
+from backend.dependencies import (
+    get_alarm_scheduler,
+    get_audio_handlers,
+    get_event_loop_lag_monitor,
+    get_leased_alarm_runner,
+    get_room_catalog,
+    get_sound_profiles,
+    get_tracer,
+)
+from backend.src.application.use_cases import RestoreScheduledAlarmsUseCase
+from backend.src.shared.logging import (
+    load_environment,
+    logger,
+    start_queue_logging,
+    stop_queue_logging,
+)
 
 from backend.routers import api_v1
 
+# Restore only looks one day ahead, so weekly alarms (and alarms created on
+# another worker) are picked up by re-running it periodically.
+_RESTORE_INTERVAL_SECONDS = 3600
+
+
+async def _restore_scheduled_alarms() -> None:
+    from backend.src.infrastructure.persistence.database import db_config
+    from backend.src.infrastructure.persistence.repository import (
+        AsyncSQLiteAlarmRepository,
+    )
+
+    async for session in db_config.get_async_session():
+        repository = AsyncSQLiteAlarmRepository(session, get_sound_profiles())
+        await RestoreScheduledAlarmsUseCase(
+            repository, get_alarm_scheduler(), get_audio_handlers()
+        ).execute()
+
+
+async def _restore_periodically() -> None:
+    while True:
+        await asyncio.sleep(_RESTORE_INTERVAL_SECONDS)
+        try:
+            await _restore_scheduled_alarms()
+        except Exception:
+            logger.exception("Periodic restore of scheduled alarms failed")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    db_config.create_tables()
+    # Deferred so that importing the app does not load the database stack
+    from backend.src.infrastructure.persistence.database import db_config
+
+    load_environment()
+    start_queue_logging()
+    await db_config.create_tables_async()
+    await _restore_scheduled_alarms()
+    await get_room_catalog().start()
+    get_event_loop_lag_monitor().start()
+    get_tracer()
+
+    # Every worker runs a scheduler; leases make exactly one of them drive
+    # each due alarm and let the others take over if that worker dies.
+    runner = get_leased_alarm_runner()
+    background = [
+        asyncio.create_task(get_alarm_scheduler().run(runner.execute)),
+        asyncio.create_task(runner.take_over_stale_leases()),
+        asyncio.create_task(_restore_periodically()),
+    ]
     yield
-    db_config.engine.dispose()
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    await get_event_loop_lag_monitor().stop()
+    await get_room_catalog().stop()
+    get_tracer().shutdown()
+    await db_config.dispose_async()
+    db_config.dispose()
+    stop_queue_logging()
 
 
 app = FastAPI(
@@ -18,6 +87,7 @@ app = FastAPI(
     version="1.0.0",
     description="API for managing sunrise alarms with Philips Hue",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 app.include_router(api_v1)
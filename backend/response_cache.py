@@ -0,0 +1,61 @@
+import hashlib
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response
+
+from backend.serialization import dumps
+
+
+@dataclass(frozen=True)
+class _CachedBody:
+    version: Hashable
+    body: bytes
+    etag: str
+
+
+class ResponseCache:
+    def __init__(self):
+        self._entries: dict[str, _CachedBody] = {}
+
+    def respond(
+        self,
+        request: Request,
+        key: str,
+        version: Hashable,
+        build: Callable[[], Any],
+    ) -> Response:
+        entry = self._entries.get(key)
+        if entry is None or entry.version != version:
+            entry = self._encode(version, build())
+            self._entries[key] = entry
+
+        headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+
+        # Revalidation hits answer from the stored ETag without touching the body
+        if self._matches(request.headers.get("if-none-match"), entry.etag):
+            return Response(status_code=304, headers=headers)
+
+        return Response(
+            content=entry.body, media_type="application/json", headers=headers
+        )
+
+    def invalidate(self, key_prefix: str = "") -> None:
+        for key in [key for key in self._entries if key.startswith(key_prefix)]:
+            del self._entries[key]
+
+    def _encode(self, version: Hashable, payload: Any) -> _CachedBody:
+        body = dumps(payload)
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return _CachedBody(version=version, body=body, etag=etag)
+
+    def _matches(self, if_none_match: str | None, etag: str) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        candidates = (
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        )
+        return etag in candidates
@@ -2,6 +2,7 @@ from .alarm import router as alarm_router
 from .rooms import router as room_router
 from .sounds import router as sound_router
 from .sonos import router as sonos_router
+from .metrics import router as metrics_router
 
 from fastapi import APIRouter
 
@@ -11,5 +12,6 @@ api_v1.include_router(alarm_router)
 api_v1.include_router(room_router)
 api_v1.include_router(sound_router)
 api_v1.include_router(sonos_router)
+api_v1.include_router(metrics_router)
 
 __all__ = ["api_v1"]
@@ -1,61 +1,242 @@
-from uuid import UUID, uuid4
-
-from fastapi import APIRouter, HTTPException
-
-from backend.dependencies import InjectedAlarmRepository
+from datetime import date, datetime
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from backend.dependencies import (
+    InjectedAlarmQueryService,
+    InjectedAsyncAlarmRepository,
+    InjectedCancelAlarmUseCase,
+    InjectedDeleteAlarmUseCase,
+    InjectedEventBroadcaster,
+    InjectedScheduleAlarmUseCase,
+    InjectedSoundProfiles,
+    InjectedUpdateAlarmUseCase,
+)
+from backend.serialization import FastJSONResponse, serialize_alarm
+from backend.src.domain.easing import EasingCurve, easing_registry
+from backend.src.domain.value_objects import (
+    AlarmStatus,
+    EasingType,
+    SoundProfile,
+    SoundProfileName,
+)
+from backend.src.infrastructure.sound_profiles import SoundProfileRepository
+from backend.src.infrastructure.persistence.read_models import (
+    MAX_CHANGES_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    AlarmChanges,
+    AlarmCursor,
+    AlarmFilter,
+    AlarmPage,
+)
 
 router = APIRouter(prefix="/alarms", tags=["Alarms"])
 
-alarms_store: dict[UUID, dict] = {}
-
-
-@router.get("")
-def list_alarms(repository: InjectedAlarmRepository):
-    alarms = repository.find_all()
-
-    return {"alarms": alarms}
-
-
-@router.post("", status_code=201)
-def create_alarm(alarm_data: dict):
-    alarm_id = uuid4()
-    alarm = {"id": str(alarm_id), "status": "scheduled", **alarm_data}
-    alarms_store[alarm_id] = alarm
-    return alarm
 
-
-@router.get("/{alarm_id}")
-def get_alarm(alarm_id: UUID):
-    if alarm_id not in alarms_store:
+class AlarmCreateRequest(BaseModel):
+    room_name: str = Field(min_length=1, max_length=100)
+    scene_name: str = Field(default="Tageslichtwecker", min_length=1, max_length=100)
+    hour: int = Field(ge=0, le=23)
+    minute: int = Field(ge=0, le=59)
+    duration_minutes: int = Field(default=7, ge=1, le=60)
+    easing: EasingType = EasingType.EASE_IN_CUBIC
+    # Required by the parametric curves: [gamma] or bezier [x1, y1, x2, y2]
+    easing_params: list[float] = Field(default_factory=list, max_length=4)
+    sound_profile: SoundProfileName | None = None
+    # 0 is Monday ... 6 is Sunday; empty fires once
+    weekdays: list[int] = Field(default_factory=list)
+    timezone: str | None = Field(default=None, max_length=64)
+    skip_dates: list[date] = Field(default_factory=list)
+
+
+class AlarmUpdateRequest(BaseModel):
+    scene_name: str | None = Field(default=None, min_length=1, max_length=100)
+    hour: int | None = Field(default=None, ge=0, le=23)
+    minute: int | None = Field(default=None, ge=0, le=59)
+    duration_minutes: int | None = Field(default=None, ge=1, le=60)
+    easing: EasingType | None = None
+    easing_params: list[float] = Field(default_factory=list, max_length=4)
+    sound_profile: SoundProfileName | None = None
+    weekdays: list[int] | None = None
+    timezone: str | None = Field(default=None, max_length=64)
+    skip_dates: list[date] | None = None
+
+
+class AlarmResponse(BaseModel):
+    id: UUID
+    room_name: str
+    scene_name: str
+    status: AlarmStatus
+    scheduled_hour: int | None
+    scheduled_minute: int | None
+    duration_minutes: int
+    brightness_start: int
+    brightness_end: int
+    steps: int
+    current_step: int
+    easing: str
+    easing_params: list[float]
+    sound_profile: str | None
+    weekdays: list[int]
+    timezone: str | None
+    skip_dates: list[date]
+    next_fire_at: datetime | None
+
+
+class AlarmCancelResponse(BaseModel):
+    message: str
+    alarm: AlarmResponse
+
+
+def _resolve_easing(easing: EasingType, params: list[float]) -> EasingCurve:
+    return easing_registry.curve(easing, *params)
+
+
+def _resolve_sound_profile(
+    sound_profiles: SoundProfileRepository, name: SoundProfileName | None
+) -> SoundProfile | None:
+    return sound_profiles.get(name) if name is not None else None
+
+
+@router.get("", response_model=AlarmPage)
+async def list_alarms(
+    query_service: InjectedAlarmQueryService,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = 50,
+    status: AlarmStatus | None = None,
+    room: str | None = None,
+    fire_from: datetime | None = None,
+    fire_until: datetime | None = None,
+) -> FastJSONResponse:
+    try:
+        decoded_cursor = AlarmCursor.decode(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    alarm_filter = AlarmFilter(
+        status=status,
+        room_name=room,
+        fire_from=fire_from,
+        fire_until=fire_until,
+    )
+    # The page is encoded straight from its dataclasses; response_model only
+    # documents the schema and is not re-validated for every row.
+    page = await query_service.list_page(alarm_filter, decoded_cursor, limit)
+    return FastJSONResponse(page)
+
+
+@router.get("/changes", response_model=AlarmChanges)
+async def list_alarm_changes(
+    query_service: InjectedAlarmQueryService,
+    since: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=MAX_CHANGES_PAGE_SIZE)] = 500,
+) -> FastJSONResponse:
+    return FastJSONResponse(await query_service.list_changes(since, limit))
+
+
+@router.get("/events")
+async def stream_alarm_events(
+    broadcaster: InjectedEventBroadcaster, alarm_id: UUID | None = None
+) -> StreamingResponse:
+    return StreamingResponse(
+        broadcaster.stream(alarm_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("", status_code=201, response_model=AlarmResponse)
+async def create_alarm(
+    request: AlarmCreateRequest,
+    use_case: InjectedScheduleAlarmUseCase,
+    sound_profiles: InjectedSoundProfiles,
+) -> FastJSONResponse:
+    try:
+        alarm = await use_case.execute(
+            room_name=request.room_name,
+            scene_name=request.scene_name,
+            hour=request.hour,
+            minute=request.minute,
+            duration_minutes=request.duration_minutes,
+            easing=_resolve_easing(request.easing, request.easing_params),
+            sound_profile=_resolve_sound_profile(sound_profiles, request.sound_profile),
+            weekdays=request.weekdays,
+            timezone=request.timezone,
+            skip_dates=request.skip_dates,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return FastJSONResponse(serialize_alarm(alarm), status_code=201)
+
+
+@router.get("/{alarm_id}", response_model=AlarmResponse)
+async def get_alarm(
+    alarm_id: UUID, repository: InjectedAsyncAlarmRepository
+) -> FastJSONResponse:
+    alarm = await repository.find_by_id(alarm_id)
+    if alarm is None:
         raise HTTPException(status_code=404, detail="Alarm not found")
-    return alarms_store[alarm_id]
-
-
-@router.put("/{alarm_id}")
-def update_alarm(alarm_id: UUID, alarm_data: dict):
-    if alarm_id not in alarms_store:
+    return FastJSONResponse(serialize_alarm(alarm))
+
+
+@router.put("/{alarm_id}", response_model=AlarmResponse)
+async def update_alarm(
+    alarm_id: UUID,
+    request: AlarmUpdateRequest,
+    use_case: InjectedUpdateAlarmUseCase,
+    sound_profiles: InjectedSoundProfiles,
+) -> FastJSONResponse:
+    try:
+        alarm = await use_case.execute(
+            alarm_id,
+            hour=request.hour,
+            minute=request.minute,
+            scene_name=request.scene_name,
+            duration_minutes=request.duration_minutes,
+            easing=(
+                _resolve_easing(request.easing, request.easing_params)
+                if request.easing
+                else None
+            ),
+            sound_profile=_resolve_sound_profile(sound_profiles, request.sound_profile),
+            weekdays=request.weekdays,
+            timezone=request.timezone,
+            skip_dates=request.skip_dates,
+            # An omitted field keeps the profile; an explicit null removes it
+            clear_sound_profile=(
+                "sound_profile" in request.model_fields_set
+                and request.sound_profile is None
+            ),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if alarm is None:
         raise HTTPException(status_code=404, detail="Alarm not found")
-
-    alarms_store[alarm_id].update(alarm_data)
-    return alarms_store[alarm_id]
+    return FastJSONResponse(serialize_alarm(alarm))
 
 
 @router.delete("/{alarm_id}", status_code=204)
-def delete_alarm(alarm_id: UUID):
-    if alarm_id not in alarms_store:
+async def delete_alarm(alarm_id: UUID, use_case: InjectedDeleteAlarmUseCase):
+    if not await use_case.execute(alarm_id):
         raise HTTPException(status_code=404, detail="Alarm not found")
 
-    del alarms_store[alarm_id]
 
+@router.post("/{alarm_id}/cancel", response_model=AlarmCancelResponse)
+async def cancel_alarm(
+    alarm_id: UUID, use_case: InjectedCancelAlarmUseCase
+) -> FastJSONResponse:
+    try:
+        alarm = await use_case.execute(alarm_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-@router.post("/{alarm_id}/cancel")
-def cancel_alarm(alarm_id: UUID):
-    if alarm_id not in alarms_store:
+    if alarm is None:
         raise HTTPException(status_code=404, detail="Alarm not found")
-
-    alarm = alarms_store[alarm_id]
-    if alarm["status"] != "running":
-        raise HTTPException(status_code=400, detail="Alarm is not running")
-
-    alarm["status"] = "cancelled"
-    return {"message": "Alarm cancelled", "alarm": alarm}
+    return FastJSONResponse(
+        {"message": "Alarm cancelled", "alarm": serialize_alarm(alarm)}
+    )
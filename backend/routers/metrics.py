@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.dependencies import InjectedMetricsRegistry
+
+router = APIRouter(tags=["Metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics(registry: InjectedMetricsRegistry) -> PlainTextResponse:
+    return PlainTextResponse(
+        registry.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
@@ -1,46 +1,59 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from backend.dependencies import InjectedResponseCache, InjectedRoomCatalog
+from backend.src.infrastructure.room_catalog import CatalogRoom, RoomCatalogSnapshot
 
 router = APIRouter(prefix="/rooms", tags=["Rooms"])
 
-MOCK_ROOMS = [
-    {"name": "Zimmer 1", "id": "room-1", "type": "Bedroom"},
-    {"name": "Wohnzimmer", "id": "room-2", "type": "Living room"},
-    {"name": "Küche", "id": "room-3", "type": "Kitchen"},
-]
-
-MOCK_SCENES = {
-    "Zimmer 1": [
-        {"name": "Tageslichtwecker", "id": "scene-1"},
-        {"name": "Entspannen", "id": "scene-2"},
-        {"name": "Konzentrieren", "id": "scene-3"},
-    ],
-    "Wohnzimmer": [
-        {"name": "Gemütlich", "id": "scene-4"},
-        {"name": "Hell", "id": "scene-5"},
-    ],
-    "Küche": [
-        {"name": "Kochen", "id": "scene-6"},
-    ],
-}
+
+def _room_to_dict(room: CatalogRoom) -> dict:
+    return {"name": room.name, "id": room.id, "type": room.type}
+
+
+def _find_room_or_404(snapshot: RoomCatalogSnapshot, room_name: str) -> CatalogRoom:
+    room = snapshot.find_room(room_name)
+    if room is None:
+        raise HTTPException(status_code=404, detail=f"Room '{room_name}' not found")
+    return room
 
 
 @router.get("")
-def list_rooms():
-    return {"rooms": MOCK_ROOMS}
+async def list_rooms(
+    request: Request,
+    catalog: InjectedRoomCatalog,
+    response_cache: InjectedResponseCache,
+) -> Response:
+    snapshot = catalog.snapshot()
+    return response_cache.respond(
+        request,
+        key="rooms",
+        version=snapshot.version,
+        build=lambda: {"rooms": [_room_to_dict(room) for room in snapshot.rooms]},
+    )
 
 
 @router.get("/{room_name}")
-def get_room(room_name: str):
-    room = next((r for r in MOCK_ROOMS if r["name"] == room_name), None)
-    if not room:
-        raise HTTPException(status_code=404, detail=f"Room '{room_name}' not found")
-    return room
+async def get_room(room_name: str, catalog: InjectedRoomCatalog):
+    return _room_to_dict(_find_room_or_404(catalog.snapshot(), room_name))
 
 
 @router.get("/{room_name}/scenes")
-def list_room_scenes(room_name: str):
+async def list_room_scenes(
+    room_name: str,
+    request: Request,
+    catalog: InjectedRoomCatalog,
+    response_cache: InjectedResponseCache,
+) -> Response:
     """Liste Szenen für einen Raum."""
-    if room_name not in MOCK_SCENES:
-        raise HTTPException(status_code=404, detail=f"Room '{room_name}' not found")
-
-    return {"room_name": room_name, "scenes": MOCK_SCENES[room_name]}
+    snapshot = catalog.snapshot()
+    room = _find_room_or_404(snapshot, room_name)
+
+    return response_cache.respond(
+        request,
+        key=f"rooms:{room_name}:scenes",
+        version=snapshot.version,
+        build=lambda: {
+            "room_name": room_name,
+            "scenes": [{"name": scene.name, "id": scene.id} for scene in room.scenes],
+        },
+    )
@@ -1,14 +1,12 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
-from backend.dependencies import InjectedAudioRegistry
+from backend.dependencies import InjectedAudioRegistry, InjectedResponseCache
 from backend.src.infrastructure.audio import RegisteredSound
 
 router = APIRouter(prefix="/sounds", tags=["Sounds"])
 
 
-@router.get("", response_model=list[RegisteredSound])
-def list_all_sounds(audio_registry: InjectedAudioRegistry):
-    sounds = audio_registry.get_all()
+def _to_response(sounds: list[RegisteredSound]) -> list[RegisteredSound]:
     return [
         RegisteredSound(
             name=sound.name,
@@ -19,27 +17,43 @@ def list_all_sounds(audio_registry: InjectedAudioRegistry):
     ]
 
 
+@router.get("", response_model=list[RegisteredSound])
+def list_all_sounds(
+    request: Request,
+    audio_registry: InjectedAudioRegistry,
+    response_cache: InjectedResponseCache,
+) -> Response:
+    return response_cache.respond(
+        request,
+        key="sounds:all",
+        version=audio_registry.version,
+        build=lambda: _to_response(audio_registry.get_all()),
+    )
+
+
 @router.get("/wake-up", response_model=list[RegisteredSound])
-def list_wake_up_sounds(audio_registry: InjectedAudioRegistry):
-    sounds = audio_registry.get_wake_up_sounds()
-    return [
-        RegisteredSound(
-            name=sound.name,
-            relative_path=sound.relative_path,
-            category=sound.category,
-        )
-        for sound in sounds
-    ]
+def list_wake_up_sounds(
+    request: Request,
+    audio_registry: InjectedAudioRegistry,
+    response_cache: InjectedResponseCache,
+) -> Response:
+    return response_cache.respond(
+        request,
+        key="sounds:wake-up",
+        version=audio_registry.version,
+        build=lambda: _to_response(audio_registry.get_wake_up_sounds()),
+    )
 
 
 @router.get("/get-up", response_model=list[RegisteredSound])
-def list_get_up_sounds(audio_registry: InjectedAudioRegistry):
-    sounds = audio_registry.get_get_up_sounds()
-    return [
-        RegisteredSound(
-            name=sound.name,
-            relative_path=sound.relative_path,
-            category=sound.category,
-        )
-        for sound in sounds
-    ]
+def list_get_up_sounds(
+    request: Request,
+    audio_registry: InjectedAudioRegistry,
+    response_cache: InjectedResponseCache,
+) -> Response:
+    return response_cache.respond(
+        request,
+        key="sounds:get-up",
+        version=audio_registry.version,
+        build=lambda: _to_response(audio_registry.get_get_up_sounds()),
+    )
@@ -0,0 +1,72 @@
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+from backend.src.domain.aggregates import SunriseAlarm
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def serialize_alarm(alarm: SunriseAlarm) -> dict[str, Any]:
+    scheduled_time = alarm.scheduled_time
+    sound_profile = alarm.sound_profile
+    recurrence = alarm.recurrence
+    return {
+        "id": str(alarm.id),
+        "room_name": alarm.room_name,
+        "scene_name": alarm.scene_name,
+        "status": alarm.status.value,
+        "scheduled_hour": scheduled_time.hour if scheduled_time else None,
+        "scheduled_minute": scheduled_time.minute if scheduled_time else None,
+        "duration_minutes": alarm.duration.minutes,
+        "brightness_start": alarm.brightness_range.start,
+        "brightness_end": alarm.brightness_range.end,
+        "steps": alarm.steps.count,
+        "current_step": alarm.current_step,
+        "easing": alarm.easing_function.id,
+        "easing_params": list(alarm.easing_function.params),
+        "sound_profile": sound_profile.key if sound_profile else None,
+        "weekdays": recurrence.weekday_list,
+        "timezone": recurrence.timezone,
+        "skip_dates": sorted(recurrence.skip_dates),
+        "next_fire_at": alarm.next_fire_at(datetime.now()),
+    }
+
+
+# Types the encoders do not understand natively. Value objects are frozen
+# dataclasses, which both encoders handle natively; serialize_alarm flattens
+# them into the API shape itself.
+_SERIALIZERS: dict[type, Callable[[Any], Any]] = {
+    SunriseAlarm: serialize_alarm,
+}
+
+
+def _fallback(obj: Any) -> Any:
+    serializer = _SERIALIZERS.get(type(obj))
+    if serializer is None:
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    return serializer(obj)
+
+
+if orjson is not None:
+
+    def dumps(content: Any) -> bytes:
+        return orjson.dumps(content, default=_fallback, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+    # pydantic_core ships with FastAPI and also encodes dataclasses, UUIDs
+    # and datetimes natively, so even without orjson nothing goes through
+    # jsonable_encoder.
+    def dumps(content: Any) -> bytes:
+        return pydantic_core.to_json(content, fallback=_fallback)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,50 +1,134 @@
-from datetime import datetime
+import asyncio
+import heapq
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 from backend.src.domain.aggregates import SunriseAlarm
+from backend.src.domain.clock import Clock, system_clock
+from backend.src.domain.value_objects import AlarmStatus
+from backend.src.shared.metrics import metrics
+
+_SCHEDULED_ALARMS = metrics.gauge(
+    "scheduler_alarms_registered", "Alarms registered with the scheduler"
+)
+_TRIGGERED_ALARMS = metrics.counter(
+    "scheduler_alarms_triggered", "Alarms fired by the scheduler"
+)
+_FIRE_LATENESS = metrics.histogram(
+    "scheduler_fire_lateness_seconds",
+    "Delay between an alarm's fire instant and the scheduler handing it off",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 60.0),
+)
+
+# The wall clock is re-read at least this often, so a suspended host or a
+# clock step is noticed without waiting for the next armed alarm.
+_MAX_SLEEP_SECONDS = 60.0
+
+_NEXT_OCCURRENCE = timedelta(minutes=1)
 
 
 class AlarmScheduler:
-    def __init__(self):
+    def __init__(self, clock: Clock = system_clock):
+        self._clock = clock
         self._scheduled_alarms: dict[UUID, SunriseAlarm] = {}
-        self._triggered_alarms: set[UUID] = set()
+        # Min-heap of (fire instant, alarm id). Entries that no longer match
+        # _next_fire (re-registered or unregistered alarms) are skipped on pop.
+        self._queue: list[tuple[datetime, UUID]] = []
+        self._next_fire: dict[UUID, datetime] = {}
+        self._rearmed = asyncio.Event()
+        self._running_ramps: set[asyncio.Task] = set()
 
     def register_alarm(self, alarm: SunriseAlarm) -> None:
         if alarm.scheduled_time is None:
             raise ValueError("Cannot register alarm without scheduled_time")
 
         self._scheduled_alarms[alarm.id] = alarm
+        self._arm(alarm, self._now())
+        _SCHEDULED_ALARMS.set(len(self._scheduled_alarms))
+
+    def is_registered(self, alarm_id: UUID) -> bool:
+        return alarm_id in self._scheduled_alarms
 
     def unregister_alarm(self, alarm_id: UUID) -> None:
         self._scheduled_alarms.pop(alarm_id, None)
-        self._triggered_alarms.discard(alarm_id)
+        self._next_fire.pop(alarm_id, None)
+        _SCHEDULED_ALARMS.set(len(self._scheduled_alarms))
+
+    def next_fire_at(self, alarm_id: UUID) -> datetime | None:
+        return self._next_fire.get(alarm_id)
 
-    def check_and_trigger_alarms(self) -> list[SunriseAlarm]:
-        triggered = []
-        current_time = datetime.now()
-        current_hour = current_time.hour
-        current_minute = current_time.minute
+    def pop_due_alarms(self) -> list[SunriseAlarm]:
+        # Only looks at the head of the queue, so a check costs O(log n) per
+        # due alarm instead of a scan over every registered alarm.
+        now = self._now()
+        due = []
 
-        for alarm_id, alarm in list(self._scheduled_alarms.items()):
-            if alarm_id in self._triggered_alarms:
+        while self._queue and self._queue[0][0] <= now:
+            fire_at, alarm_id = heapq.heappop(self._queue)
+            if self._next_fire.get(alarm_id) != fire_at:
                 continue
 
-            scheduled = alarm.scheduled_time
-            if scheduled is None:
+            alarm = self._scheduled_alarms[alarm_id]
+            if alarm.recurrence.is_recurring:
+                self._arm(alarm, fire_at + _NEXT_OCCURRENCE)
+            else:
+                # A one-shot alarm never fires again; keeping it would pin the
+                # aggregate for the lifetime of the process
+                self.unregister_alarm(alarm_id)
+
+            # Woken up later than the ramp would have lasted (e.g. after a
+            # suspend): the sunrise is already over, so this occurrence is skipped
+            lateness = (now - fire_at).total_seconds()
+            if lateness > alarm.duration.seconds:
                 continue
+            if alarm.status != AlarmStatus.SCHEDULED:
+                continue
+
+            _FIRE_LATENESS.observe(lateness)
+            _TRIGGERED_ALARMS.inc()
+            due.append(alarm)
+
+        return due
+
+    async def run(self, on_due: Callable[[SunriseAlarm], Awaitable[object]]) -> None:
+        try:
+            while True:
+                for alarm in self.pop_due_alarms():
+                    task = asyncio.create_task(on_due(alarm))
+                    self._running_ramps.add(task)
+                    task.add_done_callback(self._running_ramps.discard)
+
+                await self._wait_for_next_fire()
+        finally:
+            for task in tuple(self._running_ramps):
+                task.cancel()
+
+    async def _wait_for_next_fire(self) -> None:
+        # Cleared before the delay is computed, so an alarm registered while
+        # waiting (possibly firing earlier than the current head) wakes the loop
+        self._rearmed.clear()
+        delay = _MAX_SLEEP_SECONDS
+        if self._queue:
+            until_head = (self._queue[0][0] - self._now()).total_seconds()
+            delay = min(delay, max(0.0, until_head))
 
-            if scheduled.hour == current_hour and scheduled.minute == current_minute:
-                try:
-                    alarm.trigger()
-                    triggered.append(alarm)
-                    self._triggered_alarms.add(alarm_id)
-                except ValueError:
-                    pass
+        sleeper = asyncio.ensure_future(self._clock.sleep(delay))
+        waker = asyncio.ensure_future(self._rearmed.wait())
+        try:
+            await asyncio.wait((sleeper, waker), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sleeper.cancel()
+            waker.cancel()
 
-        return triggered
+    def _arm(self, alarm: SunriseAlarm, after: datetime) -> None:
+        fire_at = alarm.recurrence.next_fire(alarm.scheduled_time, after)
+        self._next_fire[alarm.id] = fire_at
+        heapq.heappush(self._queue, (fire_at, alarm.id))
+        self._rearmed.set()
 
-    def reset_daily_triggers(self) -> None:
-        self._triggered_alarms.clear()
+    def _now(self) -> datetime:
+        return self._clock.now().astimezone(UTC)
 
     def get_active_alarms(self) -> list[SunriseAlarm]:
         return list(self._scheduled_alarms.values())
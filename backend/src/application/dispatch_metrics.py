@@ -0,0 +1,65 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from backend.src.shared.metrics import (
+    DEFAULT_LATENCY_BUCKETS,
+    Histogram,
+    MetricsRegistry,
+)
+
+
+class DispatchMetricsSink(Protocol):
+    def record(self, handler_name: str, event_type: str, seconds: float) -> None: ...
+
+
+@dataclass
+class HandlerTimingStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    bucket_counts: list[int] = field(
+        default_factory=lambda: [0] * (len(DEFAULT_LATENCY_BUCKETS) + 1)
+    )
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self.bucket_counts[bisect_left(DEFAULT_LATENCY_BUCKETS, seconds)] += 1
+
+
+class InMemoryDispatchMetrics:
+    def __init__(self):
+        self._stats: dict[tuple[str, str], HandlerTimingStats] = {}
+
+    def record(self, handler_name: str, event_type: str, seconds: float) -> None:
+        key = (handler_name, event_type)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = HandlerTimingStats()
+        stats.observe(seconds)
+
+    def snapshot(self) -> dict[tuple[str, str], HandlerTimingStats]:
+        return dict(self._stats)
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+
+class RegistryDispatchMetrics:
+    def __init__(self, registry: MetricsRegistry):
+        self._seconds: Histogram = registry.histogram(
+            "event_handler_seconds",
+            "Time spent per event handler invocation",
+            ["handler", "event"],
+            buckets=DEFAULT_LATENCY_BUCKETS,
+        )
+
+    def record(self, handler_name: str, event_type: str, seconds: float) -> None:
+        self._seconds.labels(handler_name, event_type).observe(seconds)
@@ -1,12 +1,32 @@
+from time import perf_counter
+
+from backend.src.application.dispatch_metrics import DispatchMetricsSink
 from backend.src.domain.events import DomainEvent
 from backend.src.infrastructure.event_handlers import EventHandler
+from backend.src.shared.logging import LoggingMixin, log_fields
+from backend.src.shared.tracing import tracer
+
+# Recorded as the handler name for time spent in the dispatcher itself
+DISPATCHER_OVERHEAD = "EventDispatcher"
 
 
-class EventDispatcher:
-    def __init__(self, handlers: list[EventHandler]):
+class EventDispatcher(LoggingMixin):
+    def __init__(
+        self,
+        handlers: list[EventHandler],
+        metrics: DispatchMetricsSink | None = None,
+        slow_handler_budget_seconds: float | None = None,
+    ):
         self._handlers = handlers
+        self._metrics = metrics
+        self._slow_handler_budget_seconds = slow_handler_budget_seconds
+        self._timed = metrics is not None or slow_handler_budget_seconds is not None
 
     async def dispatch(self, event: DomainEvent) -> None:
+        if self._timed or tracer.recording:
+            await self._dispatch_instrumented(event)
+            return
+
         for handler in self._handlers:
             if handler.can_handle(event):
                 await handler.handle(event)
@@ -14,3 +34,54 @@ class EventDispatcher:
     async def dispatch_all(self, events: list[DomainEvent]) -> None:
         for event in events:
             await self.dispatch(event)
+
+    async def _dispatch_instrumented(self, event: DomainEvent) -> None:
+        event_type = type(event).__name__
+        dispatch_started = perf_counter()
+        handler_seconds = 0.0
+
+        with tracer.span(
+            "dispatch", event=event_type, step=getattr(event, "step_number", None)
+        ):
+            for handler in self._handlers:
+                if not handler.can_handle(event):
+                    continue
+
+                handler_name = type(handler).__name__
+                started = perf_counter()
+                try:
+                    with tracer.span("handler", handler=handler_name):
+                        await handler.handle(event)
+                finally:
+                    elapsed = perf_counter() - started
+                    handler_seconds += elapsed
+                    self._record(handler, handler_name, event, event_type, elapsed)
+
+        if self._metrics is not None:
+            overhead = perf_counter() - dispatch_started - handler_seconds
+            self._metrics.record(DISPATCHER_OVERHEAD, event_type, overhead)
+
+    def _record(
+        self,
+        handler: EventHandler,
+        handler_name: str,
+        event: DomainEvent,
+        event_type: str,
+        elapsed: float,
+    ) -> None:
+        if self._metrics is not None:
+            self._metrics.record(handler_name, event_type, elapsed)
+
+        budget = self._slow_handler_budget_seconds
+        if budget is not None and elapsed > budget and not handler.blocks_by_design:
+            self.logger.warning(
+                "Slow handler %s took %.1f ms for %s (budget %.0f ms)",
+                handler_name,
+                elapsed * 1000,
+                event_type,
+                budget * 1000,
+                extra=log_fields(
+                    alarm_id=event.aggregate_id,
+                    step=getattr(event, "step_number", None),
+                ),
+            )
@@ -1,17 +1,47 @@
+import asyncio
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
 from typing import Callable
+from uuid import UUID
 
 from backend.src.application.alarm_scheduler import AlarmScheduler
 from backend.src.application.event_dispatcher import EventDispatcher
 from backend.src.domain.aggregates import SunriseAlarm
+from backend.src.domain.clock import Clock, system_clock
 from backend.src.domain.easing import ease_in_cubic
+from backend.src.domain.repository import AlarmLeaseStore, AsyncAlarmRepository
 from backend.src.domain.value_objects import (
+    AlarmLease,
+    AlarmStatus,
     BrightnessRange,
     Duration,
+    Recurrence,
     ScheduledTime,
     SoundProfile,
     TransitionSteps,
 )
 from backend.src.infrastructure.event_handlers import AlarmAudioHandler
+from backend.src.shared.logging import log_context
+from backend.src.shared.metrics import metrics
+from backend.src.shared.tracing import tracer
+
+_RAMPS_RUNNING = metrics.gauge("ramps_running", "Sunrise ramps currently running")
+_RAMP_STEPS = metrics.counter("ramp_steps", "Brightness steps executed by ramps")
+_RAMP_OUTCOMES = metrics.counter(
+    "ramps_finished", "Ramps that ended, by outcome", ["outcome"]
+)
+_RAMP_OVERRUN = metrics.histogram(
+    "ramp_overrun_seconds",
+    "How much longer a ramp took than its configured duration",
+    buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+_LEASE_EVENTS = metrics.counter(
+    "alarm_leases", "Alarm lease transitions seen by this worker", ["event"]
+)
+_LEASES_CLAIMED = _LEASE_EVENTS.labels("claimed")
+_LEASES_CONTENDED = _LEASE_EVENTS.labels("claimed_elsewhere")
+_LEASES_TAKEN_OVER = _LEASE_EVENTS.labels("taken_over")
+_LEASES_LOST = _LEASE_EVENTS.labels("lost")
 
 
 class StartSunriseAlarmUseCase:
@@ -58,10 +88,12 @@ class ScheduleAlarmUseCase:
         event_dispatcher: EventDispatcher,
         alarm_scheduler: AlarmScheduler,
         audio_handlers: list[AlarmAudioHandler] = None,
+        repository: AsyncAlarmRepository | None = None,
     ):
         self.event_dispatcher = event_dispatcher
         self.alarm_scheduler = alarm_scheduler
         self.audio_handlers = audio_handlers if audio_handlers is not None else []
+        self.repository = repository
 
     async def execute(
         self,
@@ -71,17 +103,25 @@ class ScheduleAlarmUseCase:
         duration_minutes: int = 7,
         easing: Callable[[float], float] = ease_in_cubic,
         sound_profile: SoundProfile | None = None,
+        scene_name: str = "Tageslichtwecker",
+        weekdays: Iterable[int] = (),
+        timezone: str | None = None,
+        skip_dates: Iterable[date] = (),
+        steps: int = 70,
     ) -> SunriseAlarm:
         scheduled_time = ScheduledTime(hour=hour, minute=minute)
+        recurrence = Recurrence.on(weekdays, timezone, skip_dates)
 
         alarm = SunriseAlarm(
             room_name=room_name,
+            scene_name=scene_name,
             duration=Duration(minutes=duration_minutes),
             brightness_range=BrightnessRange(start=1, end=100),
-            steps=TransitionSteps(count=70),
+            steps=TransitionSteps(count=steps),
             easing_function=easing,
             sound_profile=sound_profile,
             scheduled_time=scheduled_time,
+            recurrence=recurrence,
         )
 
         for handler in self.audio_handlers:
@@ -89,6 +129,9 @@ class ScheduleAlarmUseCase:
 
         alarm.schedule()
 
+        if self.repository is not None:
+            alarm = await self.repository.save(alarm)
+
         self.alarm_scheduler.register_alarm(alarm)
 
         await self.event_dispatcher.dispatch_all(alarm.collect_events())
@@ -96,6 +139,151 @@ class ScheduleAlarmUseCase:
         return alarm
 
 
+class UpdateScheduledAlarmUseCase:
+    def __init__(
+        self,
+        event_dispatcher: EventDispatcher,
+        alarm_scheduler: AlarmScheduler,
+        repository: AsyncAlarmRepository,
+        audio_handlers: list[AlarmAudioHandler] = None,
+    ):
+        self.event_dispatcher = event_dispatcher
+        self.alarm_scheduler = alarm_scheduler
+        self.repository = repository
+        self.audio_handlers = audio_handlers if audio_handlers is not None else []
+
+    async def execute(
+        self,
+        alarm_id: UUID,
+        hour: int | None = None,
+        minute: int | None = None,
+        scene_name: str | None = None,
+        duration_minutes: int | None = None,
+        easing: Callable[[float], float] | None = None,
+        sound_profile: SoundProfile | None = None,
+        weekdays: Iterable[int] | None = None,
+        timezone: str | None = None,
+        skip_dates: Iterable[date] | None = None,
+        clear_sound_profile: bool = False,
+    ) -> SunriseAlarm | None:
+        alarm = await self.repository.find_by_id(alarm_id)
+        if alarm is None:
+            return None
+
+        # The aggregate is shared through the identity map, so everything that
+        # can reject the request is built before the alarm is touched
+        duration = Duration(minutes=duration_minutes) if duration_minutes else None
+        recurrence = self._merge_recurrence(alarm, weekdays, timezone, skip_dates)
+        scheduled_time = None
+        if hour is not None or minute is not None or recurrence is not None:
+            scheduled_time = self._merge_scheduled_time(alarm, hour, minute)
+
+        alarm.reconfigure(
+            scene_name=scene_name,
+            duration=duration,
+            easing_function=easing,
+            sound_profile=sound_profile,
+            clear_sound_profile=clear_sound_profile,
+        )
+        if scheduled_time is not None:
+            alarm.reschedule(scheduled_time, recurrence)
+
+        alarm = await self.repository.save(alarm)
+
+        for handler in self.audio_handlers:
+            handler.register_alarm(alarm)
+
+        # Re-registering re-arms the alarm from its new time and recurrence
+        self.alarm_scheduler.unregister_alarm(alarm.id)
+        if alarm.scheduled_time is not None:
+            self.alarm_scheduler.register_alarm(alarm)
+
+        await self.event_dispatcher.dispatch_all(alarm.collect_events())
+
+        return alarm
+
+    def _merge_scheduled_time(
+        self, alarm: SunriseAlarm, hour: int | None, minute: int | None
+    ) -> ScheduledTime:
+        current = alarm.scheduled_time
+        if current is None and (hour is None or minute is None):
+            raise ValueError("Both hour and minute are required for unscheduled alarms")
+
+        return ScheduledTime(
+            hour=hour if hour is not None else current.hour,
+            minute=minute if minute is not None else current.minute,
+        )
+
+    def _merge_recurrence(
+        self,
+        alarm: SunriseAlarm,
+        weekdays: Iterable[int] | None,
+        timezone: str | None,
+        skip_dates: Iterable[date] | None,
+    ) -> Recurrence | None:
+        if weekdays is None and timezone is None and skip_dates is None:
+            return None
+
+        current = alarm.recurrence
+        return Recurrence.on(
+            weekdays if weekdays is not None else current.weekday_list,
+            timezone if timezone is not None else current.timezone,
+            skip_dates if skip_dates is not None else current.skip_dates,
+        )
+
+
+class CancelAlarmUseCase:
+    def __init__(
+        self,
+        event_dispatcher: EventDispatcher,
+        alarm_scheduler: AlarmScheduler,
+        repository: AsyncAlarmRepository,
+    ):
+        self.event_dispatcher = event_dispatcher
+        self.alarm_scheduler = alarm_scheduler
+        self.repository = repository
+
+    async def execute(self, alarm_id: UUID) -> SunriseAlarm | None:
+        alarm = await self.repository.find_by_id(alarm_id)
+        if alarm is None:
+            return None
+
+        alarm.cancel()
+        alarm = await self.repository.save(alarm)
+        self.alarm_scheduler.unregister_alarm(alarm.id)
+
+        await self.event_dispatcher.dispatch_all(alarm.collect_events())
+
+        return alarm
+
+
+class DeleteAlarmUseCase:
+    def __init__(
+        self,
+        event_dispatcher: EventDispatcher,
+        alarm_scheduler: AlarmScheduler,
+        repository: AsyncAlarmRepository,
+    ):
+        self.event_dispatcher = event_dispatcher
+        self.alarm_scheduler = alarm_scheduler
+        self.repository = repository
+
+    async def execute(self, alarm_id: UUID) -> bool:
+        alarm = await self.repository.find_by_id(alarm_id)
+        if alarm is None:
+            return False
+
+        if alarm.status == AlarmStatus.RUNNING:
+            alarm.cancel()
+
+        self.alarm_scheduler.unregister_alarm(alarm_id)
+        deleted = await self.repository.delete(alarm_id)
+
+        await self.event_dispatcher.dispatch_all(alarm.collect_events())
+
+        return deleted
+
+
 class TriggerScheduledAlarmUseCase:
     def __init__(
         self,
@@ -107,11 +295,191 @@ class TriggerScheduledAlarmUseCase:
         if alarm.scheduled_time is None:
             raise ValueError("Alarm is not scheduled")
 
-        alarm.trigger()
-        await self.event_dispatcher.dispatch_all(alarm.collect_events())
+        # A taken-over ramp arrives already running and resumes at its step
+        if alarm.status == AlarmStatus.SCHEDULED:
+            alarm.trigger()
 
-        while not alarm.is_finished:
-            alarm.progress_step()
-            await self.event_dispatcher.dispatch_all(alarm.collect_events())
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        _RAMPS_RUNNING.inc()
+        with (
+            log_context(alarm_id=alarm.id) as context,
+            tracer.start_trace(
+                "alarm.ramp",
+                alarm.id,
+                room=alarm.room_name,
+                scene=alarm.scene_name,
+                steps=alarm.steps.count,
+                duration_seconds=alarm.duration.seconds,
+            ),
+        ):
+            try:
+                await self.event_dispatcher.dispatch_all(alarm.collect_events())
+
+                while not alarm.is_finished:
+                    alarm.progress_step()
+                    context["step"] = alarm.current_step
+                    _RAMP_STEPS.inc()
+                    await self.event_dispatcher.dispatch_all(alarm.collect_events())
+            except BaseException:
+                _RAMP_OUTCOMES.labels("failed").inc()
+                raise
+            finally:
+                _RAMPS_RUNNING.dec()
+
+        _RAMP_OUTCOMES.labels(alarm.status.value).inc()
+        if alarm.status == AlarmStatus.COMPLETED:
+            overrun = loop.time() - started - alarm.duration.seconds
+            _RAMP_OVERRUN.observe(max(0.0, overrun))
+
+            if alarm.recurrence.is_recurring:
+                alarm.rearm()
+                await self.event_dispatcher.dispatch_all(alarm.collect_events())
 
         return alarm
+
+
+class RunLeasedAlarmUseCase:
+    # With several workers each one runs its own AlarmScheduler; the lease
+    # decides which of them drives a due alarm, so the ramp runs exactly once.
+    def __init__(
+        self,
+        lease_store: AlarmLeaseStore,
+        trigger_use_case: TriggerScheduledAlarmUseCase,
+        worker_id: str,
+        audio_handlers: list[AlarmAudioHandler] = None,
+        lease_duration: timedelta = timedelta(seconds=30),
+        clock: Clock = system_clock,
+    ):
+        self.lease_store = lease_store
+        self.trigger_use_case = trigger_use_case
+        self.worker_id = worker_id
+        self.audio_handlers = audio_handlers if audio_handlers is not None else []
+        self.lease_duration = lease_duration
+        self.clock = clock
+        self._running: set[asyncio.Task] = set()
+
+    async def execute(self, alarm: SunriseAlarm) -> SunriseAlarm | None:
+        # The trace starts at the scheduler's hand-off, so the claim round trip
+        # and losing a race to another worker show up next to the ramp itself
+        with tracer.start_trace("alarm.run", alarm.id, worker=self.worker_id):
+            with tracer.span("lease.claim"):
+                claimed = await self.lease_store.claim(
+                    alarm.id, self.worker_id, self.clock.now(), self.lease_duration
+                )
+
+            if claimed is None:
+                # Another worker owns this ramp; drop the locally raised events
+                alarm.collect_events()
+                _LEASES_CONTENDED.inc()
+                return None
+
+            _LEASES_CLAIMED.inc()
+            lease, claimed_alarm = claimed
+            return await self._drive(claimed_alarm, lease)
+
+    async def take_over_stale_leases(self) -> None:
+        # A lease only goes stale when its owner stopped heartbeating, i.e. the
+        # worker crashed or was stopped mid-ramp; the ramp resumes at its step.
+        try:
+            while True:
+                taken_over = await self.lease_store.take_over_stale(
+                    self.worker_id, self.clock.now(), self.lease_duration
+                )
+                for lease, alarm in taken_over:
+                    _LEASES_TAKEN_OVER.inc()
+                    task = asyncio.create_task(self._drive(alarm, lease))
+                    self._running.add(task)
+                    task.add_done_callback(self._running.discard)
+
+                await self.clock.sleep(self.lease_duration.total_seconds() / 2)
+        finally:
+            for task in tuple(self._running):
+                task.cancel()
+
+    async def _drive(
+        self, alarm: SunriseAlarm, lease: AlarmLease
+    ) -> SunriseAlarm | None:
+        # The alarm may have been scheduled on another worker, whose audio
+        # context this one never saw
+        for handler in self.audio_handlers:
+            handler.register_alarm(alarm)
+
+        ramp = asyncio.create_task(self.trigger_use_case.execute(alarm))
+        heartbeat = asyncio.create_task(self._keep_alive(lease, alarm, ramp))
+        try:
+            await ramp
+        except asyncio.CancelledError:
+            if not heartbeat.done():
+                # This worker is shutting down: the lease is left to expire so
+                # another worker takes the ramp over.
+                raise
+            _LEASES_LOST.inc()
+            return None
+        except Exception:
+            # Released as running without an owner, so it is not retried
+            # by a takeover that would most likely fail the same way.
+            await self.lease_store.release(lease, alarm, self.clock.now())
+            raise
+        finally:
+            heartbeat.cancel()
+
+        await self.lease_store.release(lease, alarm, self.clock.now())
+        return alarm
+
+    async def _keep_alive(
+        self, lease: AlarmLease, alarm: SunriseAlarm, ramp: asyncio.Task
+    ) -> None:
+        interval = self.lease_duration.total_seconds() / 3
+        while True:
+            await self.clock.sleep(interval)
+            try:
+                renewed = await self.lease_store.renew(
+                    lease, alarm, self.clock.now(), self.lease_duration
+                )
+            except Exception:
+                # Transient (e.g. database is locked): keep ramping while the
+                # lease is still ours, stop once another worker may take over
+                if not lease.is_expired(self.clock.now().astimezone(UTC)):
+                    continue
+                renewed = None
+
+            if renewed is None:
+                # Cancelled or deleted elsewhere, or taken over after a stall
+                ramp.cancel()
+                return
+            lease = renewed
+
+
+class RestoreScheduledAlarmsUseCase:
+    def __init__(
+        self,
+        repository: AsyncAlarmRepository,
+        alarm_scheduler: AlarmScheduler,
+        audio_handlers: list[AlarmAudioHandler] = None,
+        lookahead: timedelta = timedelta(days=1),
+        clock: Clock = system_clock,
+    ):
+        self.repository = repository
+        self.alarm_scheduler = alarm_scheduler
+        self.audio_handlers = audio_handlers if audio_handlers is not None else []
+        self.lookahead = lookahead
+        self.clock = clock
+
+    async def execute(self) -> list[SunriseAlarm]:
+        # Overdue rows are included so that alarms missed while the process was
+        # down are re-armed; refreshing them rolls next_fire_at forward.
+        horizon = self.clock.now().astimezone(UTC) + self.lookahead
+        due_alarms = await self.repository.find_due_between(datetime.min, horizon)
+
+        restored = []
+        for alarm in due_alarms:
+            if self.alarm_scheduler.is_registered(alarm.id):
+                continue
+            for handler in self.audio_handlers:
+                handler.register_alarm(alarm)
+            self.alarm_scheduler.register_alarm(alarm)
+            restored.append(alarm)
+
+        await self.repository.refresh_next_fire_at(restored)
+        return restored
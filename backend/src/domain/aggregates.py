@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import Callable
 from uuid import UUID, uuid4
 
+from backend.src.domain.clock import Clock, EventTime, system_clock
+from backend.src.domain.easing import LINEAR, EasingCurve, as_easing_curve
 from backend.src.domain.events import (
     AlarmCancelled,
     AlarmCompleted,
@@ -17,6 +19,7 @@ from backend.src.domain.value_objects import (
     Brightness,
     BrightnessRange,
     Duration,
+    Recurrence,
     ScheduledTime,
     SoundProfile,
     TransitionSteps,
@@ -34,6 +37,8 @@ class SunriseAlarm:
         easing_function: Callable[[float], float] = None,
         sound_profile: SoundProfile = None,
         scheduled_time: ScheduledTime | None = None,
+        recurrence: Recurrence | None = None,
+        clock: Clock = system_clock,
     ):
         self._id = uuid4()
         self._room_name = room_name
@@ -45,16 +50,20 @@ class SunriseAlarm:
             else BrightnessRange(start=1, end=100)
         )
         self._steps = steps if steps is not None else TransitionSteps(count=70)
+        self._step_seconds = self._duration.seconds / self._steps.count
         self._easing_function = (
-            easing_function if easing_function is not None else (lambda t: t)
+            as_easing_curve(easing_function) if easing_function is not None else LINEAR
         )
         self._sound_profile = sound_profile
         self._scheduled_time = scheduled_time
+        self._recurrence = recurrence if recurrence is not None else Recurrence()
 
         # Status depends on whether alarm is scheduled or immediate
         self._status = AlarmStatus.SCHEDULED if scheduled_time else AlarmStatus.PENDING
         self._current_step = 0
         self._domain_events: list[DomainEvent] = []
+        self._batch_time: EventTime | None = None
+        self._clock = clock
 
     @property
     def id(self) -> UUID:
@@ -81,7 +90,7 @@ class SunriseAlarm:
         return self._steps
 
     @property
-    def easing_function(self) -> Callable[[float], float]:
+    def easing_function(self) -> EasingCurve:
         return self._easing_function
 
     @property
@@ -104,22 +113,78 @@ class SunriseAlarm:
     def scheduled_time(self) -> ScheduledTime | None:
         return self._scheduled_time
 
+    @property
+    def recurrence(self) -> Recurrence:
+        return self._recurrence
+
+    def next_fire_at(self, after: datetime) -> datetime | None:
+        if self._scheduled_time is None or self._status != AlarmStatus.SCHEDULED:
+            return None
+        return self._recurrence.next_fire(self._scheduled_time, after)
+
     def collect_events(self) -> list[DomainEvent]:
-        events = self._domain_events.copy()
-        self._domain_events.clear()
+        events = self._domain_events
+        self._domain_events = []
+        self._batch_time = None
         return events
 
     def schedule(self) -> None:
-        if self._status != AlarmStatus.PENDING:
+        # Alarms constructed with a scheduled_time already start as SCHEDULED
+        if not self._can_reconfigure():
             raise ValueError(f"Cannot schedule alarm in status {self._status}")
         if self._scheduled_time is None:
             raise ValueError("Cannot schedule alarm without scheduled_time")
 
         self._status = AlarmStatus.SCHEDULED
+        self._raise_scheduled_event()
+
+    def reschedule(
+        self, scheduled_time: ScheduledTime, recurrence: Recurrence | None = None
+    ) -> None:
+        if not self._can_reconfigure():
+            raise ValueError(f"Cannot reschedule alarm in status {self._status}")
+
+        self._scheduled_time = scheduled_time
+        if recurrence is not None:
+            self._recurrence = recurrence
+        self._status = AlarmStatus.SCHEDULED
+        self._raise_scheduled_event()
+
+    def reconfigure(
+        self,
+        scene_name: str | None = None,
+        duration: Duration | None = None,
+        easing_function: Callable[[float], float] | None = None,
+        sound_profile: SoundProfile | None = None,
+        clear_sound_profile: bool = False,
+    ) -> None:
+        if not self._can_reconfigure():
+            raise ValueError(f"Cannot reconfigure alarm in status {self._status}")
+        # Validated before anything changes, so a rejected call leaves no trace
+        easing_curve = (
+            as_easing_curve(easing_function) if easing_function is not None else None
+        )
+
+        if scene_name is not None:
+            self._scene_name = scene_name
+        if duration is not None:
+            self._duration = duration
+            self._step_seconds = duration.seconds / self._steps.count
+        if easing_curve is not None:
+            self._easing_function = easing_curve
+        if sound_profile is not None:
+            self._sound_profile = sound_profile
+        elif clear_sound_profile:
+            self._sound_profile = None
+
+    def _can_reconfigure(self) -> bool:
+        return self._status in {AlarmStatus.PENDING, AlarmStatus.SCHEDULED}
+
+    def _raise_scheduled_event(self) -> None:
         self._raise_event(
             AlarmScheduled(
                 aggregate_id=self._id,
-                occurred_at=datetime.now(),
+                time=self._event_time(),
                 room_name=self._room_name,
                 scene_name=self._scene_name,
                 scheduled_hour=self._scheduled_time.hour,
@@ -135,7 +200,7 @@ class SunriseAlarm:
         self._raise_event(
             AlarmTriggered(
                 aggregate_id=self._id,
-                occurred_at=datetime.now(),
+                time=self._event_time(),
                 room_name=self._room_name,
                 scene_name=self._scene_name,
             )
@@ -143,7 +208,7 @@ class SunriseAlarm:
         self._raise_event(
             AlarmStarted(
                 aggregate_id=self._id,
-                occurred_at=datetime.now(),
+                time=self._event_time(),
                 room_name=self._room_name,
                 scene_name=self._scene_name,
             )
@@ -152,6 +217,13 @@ class SunriseAlarm:
     def _raise_event(self, event: DomainEvent) -> None:
         self._domain_events.append(event)
 
+    def _event_time(self) -> EventTime:
+        # Read once per batch: every event until the next collect_events
+        # shares the timestamp of the first one
+        if self._batch_time is None:
+            self._batch_time = EventTime(self._clock)
+        return self._batch_time
+
     def progress_step(self) -> None:
         if not self._can_progress():
             raise ValueError(f"Cannot progress alarm in status {self._status}")
@@ -161,21 +233,20 @@ class SunriseAlarm:
         self._raise_event(
             BrightnessChangeRequested(
                 aggregate_id=self._id,
-                occurred_at=datetime.now(),
+                time=self._event_time(),
                 room_name=self._room_name,
-                brightness=Brightness(percentage=brightness),
+                brightness=Brightness.of(brightness),
                 step_number=self._current_step,
                 total_steps=self._steps.count,
             )
         )
 
         if self._current_step < self._steps.count:
-            step_duration = self._duration.seconds / self._steps.count
             self._raise_event(
                 WaitRequested(
                     aggregate_id=self._id,
-                    occurred_at=datetime.now(),
-                    duration_seconds=step_duration,
+                    time=self._event_time(),
+                    duration_seconds=self._step_seconds,
                 )
             )
 
@@ -192,12 +263,21 @@ class SunriseAlarm:
         self._raise_event(
             AlarmCompleted(
                 aggregate_id=self._id,
-                occurred_at=datetime.now(),
+                time=self._event_time(),
                 room_name=self._room_name,
                 total_steps=self._steps.count,
             )
         )
 
+    def rearm(self) -> None:
+        # A recurring alarm goes back to SCHEDULED once its ramp has completed
+        if self._status != AlarmStatus.COMPLETED or not self._recurrence.is_recurring:
+            raise ValueError(f"Cannot re-arm alarm in status {self._status}")
+
+        self._status = AlarmStatus.SCHEDULED
+        self._current_step = 0
+        self._raise_scheduled_event()
+
     def cancel(self) -> None:
         if not self._can_cancel():
             raise ValueError(f"Cannot cancel alarm in status {self._status}")
@@ -206,7 +286,7 @@ class SunriseAlarm:
         self._raise_event(
             AlarmCancelled(
                 aggregate_id=self._id,
-                occurred_at=datetime.now(),
+                time=self._event_time(),
                 room_name=self._room_name,
                 at_step=self._current_step,
             )
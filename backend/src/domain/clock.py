@@ -0,0 +1,66 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Protocol
+
+
+class Clock(Protocol):
+    def now(self) -> datetime: ...
+
+    def monotonic_ns(self) -> int: ...
+
+    def wall_time(self, monotonic_ns: int) -> datetime: ...
+
+    async def sleep(self, seconds: float) -> None: ...
+
+
+class SystemClock:
+    def __init__(self):
+        # Monotonic readings are mapped onto the epoch once; converting through
+        # a timestamp keeps local time correct across DST changes.
+        self._epoch_ns = time.time_ns()
+        self._monotonic_origin_ns = time.monotonic_ns()
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def monotonic_ns(self) -> int:
+        return time.monotonic_ns()
+
+    def wall_time(self, monotonic_ns: int) -> datetime:
+        elapsed_ns = monotonic_ns - self._monotonic_origin_ns
+        return datetime.fromtimestamp((self._epoch_ns + elapsed_ns) / 1_000_000_000)
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+class EventTime:
+    # Shared by every event of one collect_events batch. Handlers rarely look
+    # at the wall time, so it is only built on first access.
+    __slots__ = ("monotonic_ns", "_clock", "_wall_time")
+
+    def __init__(self, clock: Clock):
+        self.monotonic_ns = clock.monotonic_ns()
+        self._clock = clock
+        self._wall_time: datetime | None = None
+
+    @property
+    def wall_time(self) -> datetime:
+        if self._wall_time is None:
+            self._wall_time = self._clock.wall_time(self.monotonic_ns)
+        return self._wall_time
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EventTime):
+            return NotImplemented
+        return self.monotonic_ns == other.monotonic_ns
+
+    def __hash__(self) -> int:
+        return hash(self.monotonic_ns)
+
+    def __repr__(self) -> str:
+        return f"EventTime({self.wall_time.isoformat()})"
+
+
+system_clock = SystemClock()
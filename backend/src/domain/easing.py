@@ -1,3 +1,24 @@
+import math
+from collections.abc import Callable
+from math import acos, pi
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from backend.src.domain.value_objects import EasingType
+
+# Curves are sampled at this many segments and linearly interpolated in
+# between. The samples crowd towards both ends, where gamma below 1 or a bezier
+# with a vertical tangent bends sharply; the error stays below 0.2 brightness
+# percent for every curve the registry accepts.
+_TABLE_SEGMENTS = 256
+_SEGMENTS_PER_RADIAN = _TABLE_SEGMENTS / math.pi
+
+# Flatter starts than this are too steep at t=0 for the table to follow
+_MIN_GAMMA = 0.2
+
+_BEZIER_ITERATIONS = 40
+
+
 def ease_linear(t: float) -> float:
     return t
 
@@ -12,3 +33,154 @@ def ease_in_cubic(t: float) -> float:
 
 def ease_out_cubic(t: float) -> float:
     return 1 - pow(1 - t, 3)
+
+
+def gamma(exponent: float) -> Callable[[float], float]:
+    if exponent < _MIN_GAMMA:
+        raise ValueError(f"Gamma must be at least {_MIN_GAMMA}")
+    return lambda t: t**exponent
+
+
+def cubic_bezier(
+    x1: float, y1: float, x2: float, y2: float
+) -> Callable[[float], float]:
+    # Same control points as CSS cubic-bezier(); x must be monotonic so that
+    # every progress value has exactly one eased value
+    if not (0 <= x1 <= 1 and 0 <= x2 <= 1):
+        raise ValueError("Bezier x control points must be between 0 and 1")
+
+    def coordinate(s: float, p1: float, p2: float) -> float:
+        return 3 * (1 - s) ** 2 * s * p1 + 3 * (1 - s) * s * s * p2 + s**3
+
+    def evaluate(t: float) -> float:
+        if t <= 0.0 or t >= 1.0:
+            return 0.0 if t <= 0.0 else 1.0
+
+        low, high = 0.0, 1.0
+        for _ in range(_BEZIER_ITERATIONS):
+            s = (low + high) / 2
+            if coordinate(s, x1, x2) < t:
+                low = s
+            else:
+                high = s
+        return coordinate((low + high) / 2, y1, y2)
+
+    return evaluate
+
+
+def _grid_to_progress(u: float) -> float:
+    # Cosine spacing applied twice: near either end the sampled progress grows
+    # with the fourth power of the distance from it
+    for _ in range(2):
+        u = (1 - math.cos(math.pi * u)) / 2
+    return u
+
+
+@lru_cache(maxsize=128)
+def _lookup_table(
+    factory: Callable[..., Callable[[float], float]], params: tuple[float, ...]
+) -> tuple[float, ...]:
+    function = factory(*params)
+    table = tuple(
+        float(function(_grid_to_progress(index / _TABLE_SEGMENTS)))
+        for index in range(_TABLE_SEGMENTS + 1)
+    )
+    if not all(0.0 <= value <= 1.0 for value in table):
+        raise ValueError("Easing curve must stay between 0 and 1")
+    return table
+
+
+@dataclass(frozen=True, slots=True)
+class EasingCurve:
+    id: str
+    params: tuple[float, ...] = ()
+    _table: tuple[float, ...] = field(default=(), repr=False, compare=False)
+
+    def __call__(self, t: float) -> float:
+        table = self._table
+        if t <= 0.0:
+            return table[0]
+        if t >= 1.0:
+            return table[-1]
+
+        # Inverse of _grid_to_progress, inlined since this runs once per step
+        position = acos(1 - 2 * acos(1 - 2 * t) / pi) * _SEGMENTS_PER_RADIAN
+        index = min(int(position), _TABLE_SEGMENTS - 1)
+        low = table[index]
+        return low + (table[index + 1] - low) * (position - index)
+
+
+@dataclass(frozen=True, slots=True)
+class _EasingDefinition:
+    factory: Callable[..., Callable[[float], float]]
+    param_count: int
+
+
+class EasingRegistry:
+    # An id names a curve family for good: it is what gets persisted, so a
+    # registered id must keep producing the same curve for the same params.
+    def __init__(self):
+        self._definitions: dict[str, _EasingDefinition] = {}
+
+    def register(
+        self,
+        easing_id: str,
+        factory: Callable[..., Callable[[float], float]],
+        param_count: int = 0,
+    ) -> None:
+        easing_id = str(easing_id)
+        if easing_id in self._definitions:
+            raise ValueError(f"Easing '{easing_id}' is already registered")
+        self._definitions[easing_id] = _EasingDefinition(factory, param_count)
+
+    def ids(self) -> list[str]:
+        return list(self._definitions)
+
+    def curve(self, easing_id: str, *params: float) -> EasingCurve:
+        definition = self._definitions.get(easing_id)
+        if definition is None:
+            raise ValueError(f"Unknown easing: {easing_id}")
+        if len(params) != definition.param_count:
+            raise ValueError(
+                f"Easing '{easing_id}' takes {definition.param_count} "
+                f"parameter(s), got {len(params)}"
+            )
+
+        params = tuple(float(param) for param in params)
+        table = _lookup_table(definition.factory, params)
+        return EasingCurve(id=str(easing_id), params=params, _table=table)
+
+
+def _constant(function: Callable[[float], float]):
+    return lambda: function
+
+
+easing_registry = EasingRegistry()
+easing_registry.register(EasingType.LINEAR, _constant(ease_linear))
+easing_registry.register(EasingType.EASE_IN_QUAD, _constant(ease_in_quad))
+easing_registry.register(EasingType.EASE_IN_CUBIC, _constant(ease_in_cubic))
+easing_registry.register(EasingType.EASE_OUT_CUBIC, _constant(ease_out_cubic))
+easing_registry.register(EasingType.GAMMA, gamma, param_count=1)
+easing_registry.register(EasingType.CUBIC_BEZIER, cubic_bezier, param_count=4)
+
+LINEAR = easing_registry.curve(EasingType.LINEAR)
+
+_CURVES_BY_FUNCTION: dict[Callable[[float], float], EasingCurve] = {
+    ease_linear: LINEAR,
+    ease_in_quad: easing_registry.curve(EasingType.EASE_IN_QUAD),
+    ease_in_cubic: easing_registry.curve(EasingType.EASE_IN_CUBIC),
+    ease_out_cubic: easing_registry.curve(EasingType.EASE_OUT_CUBIC),
+}
+
+
+def as_easing_curve(easing: Callable[[float], float]) -> EasingCurve:
+    # Anything else could not be persisted, so it is rejected up front
+    # instead of being stored as some other curve
+    if isinstance(easing, EasingCurve):
+        return easing
+    curve = _CURVES_BY_FUNCTION.get(easing)
+    if curve is None:
+        raise ValueError(
+            "Easing must be a registered curve; use easing_registry.curve()"
+        )
+    return curve
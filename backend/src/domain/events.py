@@ -2,22 +2,32 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
+from backend.src.domain.clock import EventTime
 from backend.src.domain.value_objects import Brightness
 
 
-@dataclass(frozen=True)
+# Slotted: a long ramp raises two events per step, so they carry no __dict__
+@dataclass(frozen=True, slots=True)
 class DomainEvent:
     aggregate_id: UUID
-    occurred_at: datetime
+    time: EventTime
 
+    @property
+    def occurred_at(self) -> datetime:
+        return self.time.wall_time
 
-@dataclass(frozen=True)
+    @property
+    def occurred_ns(self) -> int:
+        return self.time.monotonic_ns
+
+
+@dataclass(frozen=True, slots=True)
 class AlarmStarted(DomainEvent):
     room_name: str
     scene_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrightnessChangeRequested(DomainEvent):
     room_name: str
     brightness: Brightness
@@ -25,24 +35,24 @@ class BrightnessChangeRequested(DomainEvent):
     total_steps: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WaitRequested(DomainEvent):
     duration_seconds: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlarmCompleted(DomainEvent):
     room_name: str
     total_steps: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlarmCancelled(DomainEvent):
     room_name: str
     at_step: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlarmScheduled(DomainEvent):
     room_name: str
     scene_name: str
@@ -50,7 +60,7 @@ class AlarmScheduled(DomainEvent):
     scheduled_minute: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlarmTriggered(DomainEvent):
     room_name: str
     scene_name: str
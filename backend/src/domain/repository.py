@@ -1,16 +1,47 @@
+from collections.abc import Iterable
+from datetime import datetime, timedelta
 from typing import Protocol
 from uuid import UUID
 
 from backend.src.domain.aggregates import SunriseAlarm
+from backend.src.domain.value_objects import AlarmLease
 
 
-class AlarmRepository(Protocol):
-    def save(self, alarm: SunriseAlarm) -> SunriseAlarm: ...
+class AsyncAlarmRepository(Protocol):
+    async def save(self, alarm: SunriseAlarm) -> SunriseAlarm: ...
 
-    def find_by_id(self, alarm_id: UUID) -> SunriseAlarm | None: ...
+    async def save_many(self, alarms: Iterable[SunriseAlarm]) -> int: ...
 
-    def find_all(self) -> list[SunriseAlarm]: ...
+    async def refresh_next_fire_at(self, alarms: Iterable[SunriseAlarm]) -> int: ...
 
-    def delete(self, alarm_id: UUID) -> bool: ...
+    async def find_by_id(self, alarm_id: UUID) -> SunriseAlarm | None: ...
 
-    def exists(self, alarm_id: UUID) -> bool: ...
+    async def find_all(self) -> list[SunriseAlarm]: ...
+
+    async def find_due_between(
+        self, start: datetime, end: datetime
+    ) -> list[SunriseAlarm]: ...
+
+    async def delete(self, alarm_id: UUID) -> bool: ...
+
+    async def delete_many(self, alarm_ids: Iterable[UUID]) -> int: ...
+
+    async def exists(self, alarm_id: UUID) -> bool: ...
+
+
+class AlarmLeaseStore(Protocol):
+    async def claim(
+        self, alarm_id: UUID, owner: str, now: datetime, duration: timedelta
+    ) -> tuple[AlarmLease, SunriseAlarm] | None: ...
+
+    async def take_over_stale(
+        self, owner: str, now: datetime, duration: timedelta
+    ) -> list[tuple[AlarmLease, SunriseAlarm]]: ...
+
+    async def renew(
+        self, lease: AlarmLease, alarm: SunriseAlarm, now: datetime, duration: timedelta
+    ) -> AlarmLease | None: ...
+
+    async def release(
+        self, lease: AlarmLease, alarm: SunriseAlarm, now: datetime
+    ) -> bool: ...
@@ -1,7 +1,13 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta, tzinfo
 from enum import StrEnum
+from functools import cache
 from pathlib import Path
+import os
 import random
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 
 @dataclass(frozen=True)
@@ -44,7 +50,7 @@ class TransitionSteps:
             raise ValueError("Steps must be positive")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Brightness:
     percentage: int
 
@@ -52,11 +58,26 @@ class Brightness:
         if not (0 <= self.percentage <= 100):
             raise ValueError("Brightness must be between 0 and 100")
 
+    @classmethod
+    def of(cls, percentage: int) -> "Brightness":
+        # Ramps request the same 101 levels over and over, so they are shared
+        if 0 <= percentage <= 100:
+            return _BRIGHTNESS_LEVELS[percentage]
+        return cls(percentage)
+
+
+_BRIGHTNESS_LEVELS = tuple(Brightness(percentage) for percentage in range(101))
+
 
 class EasingType(StrEnum):
+    # Ids of the built-in curves in easing_registry; GAMMA and CUBIC_BEZIER
+    # take parameters
     LINEAR = "linear"
     EASE_IN_QUAD = "ease_in_quad"
     EASE_IN_CUBIC = "ease_in_cubic"
+    EASE_OUT_CUBIC = "ease_out_cubic"
+    GAMMA = "gamma"
+    CUBIC_BEZIER = "cubic_bezier"
 
 
 @dataclass(frozen=True)
@@ -72,6 +93,9 @@ class AudioFile:
 
 @dataclass(frozen=True)
 class SoundProfile:
+    # Stable identifier (a SoundProfileName for the built-in profiles); name
+    # is only the display name and may change
+    key: str
     name: str
     wake_up_sound: AudioFile
     get_up_sound: AudioFile
@@ -151,3 +175,98 @@ class ScheduledTime:
 
     def __str__(self) -> str:
         return f"{self.hour:02d}:{self.minute:02d}"
+
+
+EVERY_DAY = 0b1111111
+
+
+@cache
+def _zone(name: str | None) -> tzinfo:
+    if name is not None:
+        return ZoneInfo(name)
+
+    # Server local time, which hour/minute alarms have always been read in
+    local_name = os.environ.get("TZ", "").lstrip(":")
+    try:
+        if local_name:
+            return ZoneInfo(local_name)
+        with open("/etc/localtime", "rb") as localtime:
+            return ZoneInfo.from_file(localtime, key="localtime")
+    except (OSError, ValueError, ZoneInfoNotFoundError):
+        return UTC
+
+
+@dataclass(frozen=True)
+class Recurrence:
+    # Bit 0 is Monday ... bit 6 is Sunday; no bits set fires once
+    weekdays: int = 0
+    # IANA name such as "Europe/Berlin"; None is the server's local time
+    timezone: str | None = None
+    skip_dates: frozenset[date] = frozenset()
+
+    def __post_init__(self):
+        if not (0 <= self.weekdays <= EVERY_DAY):
+            raise ValueError("Weekday mask must be between 0 and 127")
+        try:
+            _zone(self.timezone)
+        except (ValueError, ZoneInfoNotFoundError):
+            raise ValueError(f"Unknown timezone: {self.timezone}")
+
+    @classmethod
+    def on(
+        cls,
+        weekdays: Iterable[int],
+        timezone: str | None = None,
+        skip_dates: Iterable[date] = (),
+    ) -> "Recurrence":
+        mask = 0
+        for weekday in weekdays:
+            if not (0 <= weekday <= 6):
+                raise ValueError("Weekdays must be between 0 (Monday) and 6 (Sunday)")
+            mask |= 1 << weekday
+        return cls(weekdays=mask, timezone=timezone, skip_dates=frozenset(skip_dates))
+
+    @property
+    def is_recurring(self) -> bool:
+        return self.weekdays != 0
+
+    @property
+    def weekday_list(self) -> list[int]:
+        return [day for day in range(7) if self.weekdays & (1 << day)]
+
+    def next_fire(self, time: ScheduledTime, after: datetime) -> datetime:
+        # Returns the first fire instant (aware, UTC) at or after the minute of
+        # `after`; a naive `after` is read as server local time. Each step of
+        # the loop either returns or passes one skip date, so apart from skip
+        # dates this is constant time.
+        zone = _zone(self.timezone)
+        not_before = after.astimezone(UTC).replace(second=0, microsecond=0)
+        day = not_before.astimezone(zone).date()
+
+        while True:
+            day = self._next_matching_day(day)
+            if day not in self.skip_dates:
+                # fold=0: a wall time skipped by DST fires just after the gap,
+                # one that occurs twice fires only at its first occurrence
+                fire_at = datetime(
+                    day.year, day.month, day.day, time.hour, time.minute, tzinfo=zone
+                ).astimezone(UTC)
+                if fire_at >= not_before:
+                    return fire_at
+            day += timedelta(days=1)
+
+    def _next_matching_day(self, day: date) -> date:
+        mask = self.weekdays or EVERY_DAY
+        weekday = day.weekday()
+        rotated = ((mask >> weekday) | (mask << (7 - weekday))) & EVERY_DAY
+        return day + timedelta(days=(rotated & -rotated).bit_length() - 1)
+
+
+@dataclass(frozen=True)
+class AlarmLease:
+    alarm_id: UUID
+    owner: str
+    expires_at: datetime
+
+    def is_expired(self, now: datetime) -> bool:
+        return now >= self.expires_at
@@ -1,7 +1,5 @@
 from .hue_lights import HueifyRoomService
-from .audio_apapter import PygameAudioPlayer
 
 __all__ = [
     "HueifyRoomService",
-    "PygameAudioPlayer",
 ]
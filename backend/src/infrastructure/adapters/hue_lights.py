@@ -1,12 +1,61 @@
-from hueify import Room
+from functools import cache
+from time import perf_counter
+
 from backend.src.domain.value_objects import Brightness
+from backend.src.shared.metrics import metrics
+from backend.src.shared.tracing import tracer
+
+_COMMAND_SECONDS = metrics.histogram(
+    "hue_command_seconds", "Hue bridge command latency", ["command"]
+)
+_COMMAND_ERRORS = metrics.counter(
+    "hue_command_errors", "Hue bridge commands that raised", ["command"]
+)
+_COMMANDS_IN_FLIGHT = metrics.gauge(
+    "hue_commands_in_flight", "Hue bridge commands awaiting a response"
+)
+
+_ACTIVATE_SCENE_SECONDS = _COMMAND_SECONDS.labels("activate_scene")
+_ACTIVATE_SCENE_ERRORS = _COMMAND_ERRORS.labels("activate_scene")
+_SET_BRIGHTNESS_SECONDS = _COMMAND_SECONDS.labels("set_brightness")
+_SET_BRIGHTNESS_ERRORS = _COMMAND_ERRORS.labels("set_brightness")
+
+
+@cache
+def _room_class() -> type:
+    # hueify pulls in its MCP server on import, which dominates cold start
+    from hueify import Room
+
+    return Room
 
 
 class HueifyRoomService:
     async def activate_scene(self, room_name: str, scene_name: str) -> None:
-        room = await Room.from_name(room_name)
-        await room.activate_scene(scene_name)
+        started = perf_counter()
+        _COMMANDS_IN_FLIGHT.inc()
+        try:
+            with tracer.span("hue.activate_scene", room=room_name, scene=scene_name):
+                room = await _room_class().from_name(room_name)
+                await room.activate_scene(scene_name)
+        except Exception:
+            _ACTIVATE_SCENE_ERRORS.inc()
+            raise
+        finally:
+            _COMMANDS_IN_FLIGHT.dec()
+            _ACTIVATE_SCENE_SECONDS.observe(perf_counter() - started)
 
     async def set_brightness(self, room_name: str, brightness: Brightness) -> None:
-        room = await Room.from_name(room_name)
-        await room.set_brightness_percentage(brightness.percentage)
+        started = perf_counter()
+        _COMMANDS_IN_FLIGHT.inc()
+        try:
+            with tracer.span(
+                "hue.set_brightness", room=room_name, brightness=brightness.percentage
+            ):
+                room = await _room_class().from_name(room_name)
+                await room.set_brightness_percentage(brightness.percentage)
+        except Exception:
+            _SET_BRIGHTNESS_ERRORS.inc()
+            raise
+        finally:
+            _COMMANDS_IN_FLIGHT.dec()
+            _SET_BRIGHTNESS_SECONDS.observe(perf_counter() - started)
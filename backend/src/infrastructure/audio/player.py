@@ -1,8 +1,17 @@
 from pathlib import Path
+from time import perf_counter
 
 from backend.src.infrastructure.audio.ports import AudioPlayerStrategy
-from backend.src.infrastructure.audio.strategies import PygameStrategy
 from backend.src.shared.logging import LoggingMixin
+from backend.src.shared.metrics import HistogramChild, metrics
+
+_COMMAND_SECONDS = metrics.histogram(
+    "audio_command_seconds",
+    "Audio strategy call latency, including SoCo round-trips",
+    ["strategy", "command"],
+)
+
+_DEFAULT_STRATEGY_NAME = "PygameStrategy"
 
 
 class AudioPlayer(LoggingMixin):
@@ -12,29 +21,52 @@ class AudioPlayer(LoggingMixin):
         default_strategy: AudioPlayerStrategy | None = None,
     ):
         self._sounds_directory = sounds_directory
-        self._current_strategy: AudioPlayerStrategy = (
-            default_strategy or PygameStrategy(sounds_directory)
-        )
+        # Without a strategy the pygame one is created on the first play, so
+        # building the player neither loads pygame nor opens an audio device
+        self._current_strategy: AudioPlayerStrategy | None = default_strategy
+        self._bind_metrics()
+
+    def _bind_metrics(self) -> None:
+        # Resolved once per strategy so recording a call is a plain update
+        strategy = self.current_strategy
+        self._play_seconds = _COMMAND_SECONDS.labels(strategy, "play")
+        self._stop_seconds = _COMMAND_SECONDS.labels(strategy, "stop")
+        self._volume_seconds = _COMMAND_SECONDS.labels(strategy, "set_volume")
 
     @property
     def current_strategy(self) -> str:
+        if self._current_strategy is None:
+            return _DEFAULT_STRATEGY_NAME
         return self._current_strategy.__class__.__name__
 
-    async def play(self, relative_path: str, volume: int = 25) -> None:
-        if not self._current_strategy:
-            raise RuntimeError("No strategy initialized")
+    def _strategy(self) -> AudioPlayerStrategy:
+        if self._current_strategy is None:
+            from backend.src.infrastructure.audio.strategies import PygameStrategy
+
+            self._current_strategy = PygameStrategy(self._sounds_directory)
+        return self._current_strategy
 
-        audio_file = self._current_strategy._resolve_audio_file(relative_path)
-        await self._current_strategy.set_volume(volume)
-        await self._current_strategy.play(audio_file)
+    async def play(self, relative_path: str | Path, volume: int = 25) -> None:
+        # An absolute path (e.g. from a sound profile) is used as is
+        strategy = self._strategy()
+        audio_file = strategy._resolve_audio_file(relative_path)
+        await self._timed(self._volume_seconds, strategy.set_volume(volume))
+        await self._timed(self._play_seconds, strategy.play(audio_file))
 
     async def stop(self) -> None:
-        if self._current_strategy:
-            await self._current_strategy.stop()
+        # Nothing can be playing before the first play
+        if self._current_strategy is not None:
+            await self._timed(self._stop_seconds, self._current_strategy.stop())
 
     async def set_volume(self, volume: int) -> None:
-        if self._current_strategy:
-            await self._current_strategy.set_volume(volume)
+        await self._timed(self._volume_seconds, self._strategy().set_volume(volume))
+
+    async def _timed(self, histogram: HistogramChild, call) -> None:
+        started = perf_counter()
+        try:
+            await call
+        finally:
+            histogram.observe(perf_counter() - started)
 
     async def switch_strategy(self, strategy: AudioPlayerStrategy) -> None:
         new_strategy_name = strategy.__class__.__name__
@@ -47,18 +79,22 @@ class AudioPlayer(LoggingMixin):
             f"Switching from {self.current_strategy} to {new_strategy_name}"
         )
 
-        await self._current_strategy.cleanup()
+        if self._current_strategy is not None:
+            await self._current_strategy.cleanup()
 
         self._current_strategy = strategy
+        self._bind_metrics()
         await self._current_strategy.initialize()
 
         self.logger.info(f"Successfully switched to {new_strategy_name}")
 
     async def __aenter__(self):
-        await self._current_strategy.initialize()
+        await self._strategy().initialize()
         self.logger.debug(f"Initialized {self.current_strategy} strategy")
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._current_strategy is None:
+            return
         await self._current_strategy.cleanup()
         self.logger.debug(f"Cleaned up {self.current_strategy} strategy")
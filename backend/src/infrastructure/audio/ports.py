@@ -25,7 +25,7 @@ class AudioPlayerStrategy(ABC):
     async def cleanup(self) -> None:
         pass
 
-    def _resolve_audio_file(self, relative_path: str) -> AudioFile:
+    def _resolve_audio_file(self, relative_path: str | Path) -> AudioFile:
         full_path = self._sounds_directory / relative_path
         if not full_path.exists():
             raise FileNotFoundError(f"Audio file not found: {full_path}")
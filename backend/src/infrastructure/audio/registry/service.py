@@ -8,9 +8,20 @@ class AudioRegistry(LoggingMixin):
     def __init__(self, sounds_directory: Path):
         self._sounds_directory = sounds_directory
         self._sounds: list[RegisteredSound] = []
+        self._version = 0
+        self._scan_sounds()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def rescan(self) -> None:
+        self._sounds = []
         self._scan_sounds()
 
     def _scan_sounds(self) -> None:
+        self._version += 1
+
         if not self._sounds_directory.exists():
             self.logger.warning(f"Sounds directory not found: {self._sounds_directory}")
             return
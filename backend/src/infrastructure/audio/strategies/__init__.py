@@ -1,5 +1,26 @@
-from .py_audio import PygameStrategy
-from .sonos.service import SonosStrategy
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .py_audio import PygameStrategy
+    from .sonos.service import SonosStrategy
+
+# pygame, soco and hypercorn are imported on first access, not with the package
+_LAZY_EXPORTS = {
+    "PygameStrategy": ".py_audio",
+    "SonosStrategy": ".sonos.service",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "PygameStrategy",
@@ -1,6 +1,27 @@
-from .service import SonosStrategy
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .discovery import SonosDevice, discover_sonos_devices
 
+if TYPE_CHECKING:
+    from .service import SonosStrategy
+
+# soco and hypercorn are imported on first access, not with the package
+_LAZY_EXPORTS = {
+    "SonosStrategy": ".service",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "SonosStrategy",
     "SonosDevice",
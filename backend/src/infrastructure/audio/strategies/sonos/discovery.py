@@ -1,6 +1,9 @@
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel
-from soco import SoCo
-from soco.discovery import discover
+
+if TYPE_CHECKING:
+    from soco import SoCo
 
 
 class SonosDevice(BaseModel):
@@ -10,6 +13,8 @@ class SonosDevice(BaseModel):
 
 
 def discover_sonos_devices(timeout: int = 5) -> list[SonosDevice]:
+    from soco.discovery import discover
+
     devices = discover(timeout=timeout)
 
     if not devices:
@@ -18,7 +23,7 @@ def discover_sonos_devices(timeout: int = 5) -> list[SonosDevice]:
     return [_extract_info(device) for device in devices]
 
 
-def _extract_info(device: SoCo) -> SonosDevice:
+def _extract_info(device: "SoCo") -> SonosDevice:
     info = device.get_speaker_info()
 
     return SonosDevice(
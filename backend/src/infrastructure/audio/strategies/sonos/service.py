@@ -9,6 +9,7 @@ from fastapi.responses import FileResponse
 from backend.src.domain.value_objects import AudioFile
 from backend.src.infrastructure.audio.ports import AudioPlayerStrategy
 from backend.src.shared.logging import LoggingMixin
+from backend.src.shared.tracing import tracer
 
 
 class SonosStrategy(AudioPlayerStrategy, LoggingMixin):
@@ -107,11 +108,14 @@ class SonosStrategy(AudioPlayerStrategy, LoggingMixin):
 
     async def play(self, audio_file: AudioFile) -> None:
         url = self._build_url(audio_file)
-        self.logger.info(f"Playing: {url}")
-        self.speaker.play_uri(url)
+        self.logger.info("Playing: %s", url)
+        with tracer.span("sonos.play_uri", url=url):
+            self.speaker.play_uri(url)
 
     async def stop(self) -> None:
-        self.speaker.stop()
+        with tracer.span("sonos.stop"):
+            self.speaker.stop()
 
     async def set_volume(self, volume: int) -> None:
-        self.speaker.volume = volume
+        with tracer.span("sonos.set_volume", volume=volume):
+            self.speaker.volume = volume
@@ -1,9 +1,12 @@
+import weakref
 from abc import ABC, abstractmethod
-import asyncio
-from typing import Protocol
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar, Protocol
 from uuid import UUID
 
 from backend.src.domain.aggregates import SunriseAlarm
+from backend.src.domain.clock import Clock, system_clock
 from backend.src.domain.events import (
     AlarmCancelled,
     AlarmCompleted,
@@ -14,6 +17,11 @@ from backend.src.domain.events import (
 )
 from backend.src.domain.value_objects import Brightness
 from backend.src.infrastructure.audio import AudioPlayer
+from backend.src.shared.metrics import metrics
+
+_AUDIO_CONTEXTS = metrics.gauge(
+    "alarm_audio_contexts", "Alarms whose sounds the audio handlers keep"
+)
 
 
 class RoomService(Protocol):
@@ -22,6 +30,9 @@ class RoomService(Protocol):
 
 
 class EventHandler(ABC):
+    # Handlers that wait on purpose are timed but never reported as slow
+    blocks_by_design: ClassVar[bool] = False
+
     @abstractmethod
     def can_handle(self, event: DomainEvent) -> bool:
         pass
@@ -60,6 +71,11 @@ class BrightnessChangeRequestedHandler(EventHandler):
 
 
 class WaitRequestedHandler(EventHandler):
+    blocks_by_design = True
+
+    def __init__(self, clock: Clock = system_clock):
+        self._clock = clock
+
     def can_handle(self, event: DomainEvent) -> bool:
         return isinstance(event, WaitRequested)
 
@@ -67,20 +83,71 @@ class WaitRequestedHandler(EventHandler):
         if not isinstance(event, WaitRequested):
             return
 
-        await asyncio.sleep(event.duration_seconds)
+        await self._clock.sleep(event.duration_seconds)
 
 
 class AlarmAudioHandler(Protocol):
     def register_alarm(self, alarm: SunriseAlarm) -> None: ...
 
 
-class AudioOnAlarmStartedHandler(EventHandler, AlarmAudioHandler):
-    def __init__(self, audio_service: AudioPlayer):
-        self._audio_service = audio_service
-        self._alarms: dict[UUID, SunriseAlarm] = {}
+@dataclass(frozen=True, slots=True)
+class AlarmAudioContext:
+    wake_up_sound: Path
+    get_up_sound: Path
+    # Recurring alarms start again after completing, so they keep their entry
+    recurring: bool
+
+
+class AlarmAudioContextRegistry(AlarmAudioHandler):
+    # Shared by the audio handlers. Only the sound paths are kept and the
+    # alarm itself is watched through a weak reference, so an entry never
+    # outlives its aggregate; terminal events evict it earlier.
+    def __init__(self):
+        self._contexts: dict[UUID, AlarmAudioContext] = {}
+        self._watches: dict[UUID, weakref.ref] = {}
+
+    def __len__(self) -> int:
+        return len(self._contexts)
 
     def register_alarm(self, alarm: SunriseAlarm) -> None:
-        self._alarms[alarm.id] = alarm
+        profile = alarm.sound_profile
+        if profile is None:
+            self.evict(alarm.id)
+            return
+
+        self._contexts[alarm.id] = AlarmAudioContext(
+            wake_up_sound=profile.wake_up_sound.path,
+            get_up_sound=profile.get_up_sound.path,
+            recurring=alarm.recurrence.is_recurring,
+        )
+        self._watch(alarm)
+        _AUDIO_CONTEXTS.set(len(self._contexts))
+
+    def get(self, alarm_id: UUID) -> AlarmAudioContext | None:
+        return self._contexts.get(alarm_id)
+
+    def evict(self, alarm_id: UUID) -> AlarmAudioContext | None:
+        self._watches.pop(alarm_id, None)
+        context = self._contexts.pop(alarm_id, None)
+        _AUDIO_CONTEXTS.set(len(self._contexts))
+        return context
+
+    def _watch(self, alarm: SunriseAlarm) -> None:
+        alarm_id = alarm.id
+
+        # A replaced watch is dropped without its callback ever running, so
+        # re-registering a reloaded copy of the alarm is not undone later
+        def collected(watch: weakref.ref) -> None:
+            if self._watches.get(alarm_id) is watch:
+                self.evict(alarm_id)
+
+        self._watches[alarm_id] = weakref.ref(alarm, collected)
+
+
+class AudioOnAlarmStartedHandler(EventHandler):
+    def __init__(self, audio_service: AudioPlayer, contexts: AlarmAudioContextRegistry):
+        self._audio_service = audio_service
+        self._contexts = contexts
 
     def can_handle(self, event: DomainEvent) -> bool:
         return isinstance(event, AlarmStarted)
@@ -89,19 +156,15 @@ class AudioOnAlarmStartedHandler(EventHandler, AlarmAudioHandler):
         if not isinstance(event, AlarmStarted):
             return
 
-        alarm = self._alarms.get(event.aggregate_id)
-        if alarm and alarm.sound_profile:
-            audio_file = alarm.sound_profile.wake_up_sound
-            await self._audio_service.play(audio_file)
+        context = self._contexts.get(event.aggregate_id)
+        if context is not None:
+            await self._audio_service.play(context.wake_up_sound)
 
 
-class AudioOnAlarmCompletedHandler(EventHandler, AlarmAudioHandler):
-    def __init__(self, audio_service: AudioPlayer):
+class AudioOnAlarmCompletedHandler(EventHandler):
+    def __init__(self, audio_service: AudioPlayer, contexts: AlarmAudioContextRegistry):
         self._audio_service = audio_service
-        self._alarms: dict[UUID, SunriseAlarm] = {}
-
-    def register_alarm(self, alarm: SunriseAlarm) -> None:
-        self._alarms[alarm.id] = alarm
+        self._contexts = contexts
 
     def can_handle(self, event: DomainEvent) -> bool:
         return isinstance(event, AlarmCompleted)
@@ -110,15 +173,18 @@ class AudioOnAlarmCompletedHandler(EventHandler, AlarmAudioHandler):
         if not isinstance(event, AlarmCompleted):
             return
 
-        alarm = self._alarms.get(event.aggregate_id)
-        if alarm and alarm.sound_profile:
-            audio_file = alarm.sound_profile.get_up_sound
-            await self._audio_service.play(audio_file)
+        context = self._contexts.get(event.aggregate_id)
+        if context is None:
+            return
+        if not context.recurring:
+            self._contexts.evict(event.aggregate_id)
+        await self._audio_service.play(context.get_up_sound)
 
 
 class AudioOnAlarmCancelledHandler(EventHandler):
-    def __init__(self, audio_service: AudioPlayer):
+    def __init__(self, audio_service: AudioPlayer, contexts: AlarmAudioContextRegistry):
         self._audio_service = audio_service
+        self._contexts = contexts
 
     def can_handle(self, event: DomainEvent) -> bool:
         return isinstance(event, AlarmCancelled)
@@ -127,4 +193,5 @@ class AudioOnAlarmCancelledHandler(EventHandler):
         if not isinstance(event, AlarmCancelled):
             return
 
+        self._contexts.evict(event.aggregate_id)
         await self._audio_service.stop()
@@ -0,0 +1,104 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from dataclasses import asdict, fields, is_dataclass
+from uuid import UUID
+
+from backend.src.domain.events import (
+    AlarmCancelled,
+    AlarmCompleted,
+    AlarmStarted,
+    BrightnessChangeRequested,
+    DomainEvent,
+)
+from backend.src.infrastructure.event_handlers import EventHandler
+from backend.src.shared.logging import LoggingMixin
+
+_HEARTBEAT_FRAME = ": heartbeat\n\n"
+
+
+def encode_sse_frame(event: DomainEvent) -> str:
+    # Built field by field: asdict would also copy the event's shared EventTime
+    payload = {
+        "type": type(event).__name__,
+        "aggregate_id": event.aggregate_id,
+        "occurred_at": event.occurred_at,
+    }
+    for field in fields(event):
+        if field.name not in payload and field.name != "time":
+            value = getattr(event, field.name)
+            payload[field.name] = asdict(value) if is_dataclass(value) else value
+    data = json.dumps(payload, default=str, separators=(",", ":"))
+    return f"event: {type(event).__name__}\ndata: {data}\n\n"
+
+
+class EventSubscription:
+    def __init__(self, alarm_id: UUID | None, max_queue_size: int):
+        self.alarm_id = alarm_id
+        self.dropped = 0
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue_size)
+
+    def offer(self, aggregate_id: UUID, frame: str) -> None:
+        if self.alarm_id is not None and self.alarm_id != aggregate_id:
+            return
+
+        # Drop the oldest frame so a slow viewer never stalls the ramp
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(frame)
+
+    async def next_frame(self, timeout: float) -> str | None:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class AlarmEventBroadcaster(EventHandler, LoggingMixin):
+    STREAMED_EVENTS = (
+        AlarmStarted,
+        BrightnessChangeRequested,
+        AlarmCompleted,
+        AlarmCancelled,
+    )
+
+    def __init__(self, max_queue_size: int = 64, heartbeat_seconds: float = 15.0):
+        self._max_queue_size = max_queue_size
+        self._heartbeat_seconds = heartbeat_seconds
+        self._subscriptions: set[EventSubscription] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def can_handle(self, event: DomainEvent) -> bool:
+        return bool(self._subscriptions) and isinstance(event, self.STREAMED_EVENTS)
+
+    async def handle(self, event: DomainEvent) -> None:
+        # Encoded once per event, then shared by every subscriber
+        frame = encode_sse_frame(event)
+        for subscription in tuple(self._subscriptions):
+            subscription.offer(event.aggregate_id, frame)
+
+    def subscribe(self, alarm_id: UUID | None = None) -> EventSubscription:
+        subscription = EventSubscription(alarm_id, self._max_queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        self._subscriptions.discard(subscription)
+        if subscription.dropped:
+            self.logger.debug(
+                "Subscriber dropped %d frame(s) due to backpressure",
+                subscription.dropped,
+            )
+
+    async def stream(self, alarm_id: UUID | None = None) -> AsyncIterator[str]:
+        subscription = self.subscribe(alarm_id)
+        try:
+            while True:
+                frame = await subscription.next_frame(self._heartbeat_seconds)
+                yield frame if frame is not None else _HEARTBEAT_FRAME
+        finally:
+            self.unsubscribe(subscription)
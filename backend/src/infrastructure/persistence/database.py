@@ -1,38 +1,189 @@
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
+from sqlalchemy import Connection, Engine, event, inspect, text
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Registers the tables on SQLModel.metadata before create_all runs
+from backend.src.infrastructure.persistence import models  # noqa: F401
+
+
+@dataclass(frozen=True)
+class SQLitePerformanceProfile:
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size_bytes: int = 128 * 1024 * 1024
+    cache_size_kib: int = 16 * 1024
+    busy_timeout_ms: int = 5000
+    pool_size: int = 8
+    max_overflow: int = 8
+
+    def pragmas(self) -> dict[str, str | int]:
+        # Negative cache_size is interpreted by SQLite as KiB instead of pages
+        return {
+            "journal_mode": self.journal_mode,
+            "synchronous": self.synchronous,
+            "mmap_size": self.mmap_size_bytes,
+            "cache_size": -self.cache_size_kib,
+            "busy_timeout": self.busy_timeout_ms,
+            "temp_store": "MEMORY",
+            "foreign_keys": "ON",
+        }
+
+
+DEFAULT_SQLITE_PROFILE = SQLitePerformanceProfile()
 
 
 class DatabaseConfig:
-    def __init__(self, database_url: str = "sqlite:///./data/alarms.db"):
+    def __init__(
+        self,
+        database_url: str = "sqlite:///./data/alarms.db",
+        sqlite_profile: SQLitePerformanceProfile | None = DEFAULT_SQLITE_PROFILE,
+    ):
         self.database_url = database_url
+        self.sqlite_profile = sqlite_profile if self.is_sqlite else None
+
+    # Engines are created on first use (the lifespan's create_tables_async), so
+    # importing this module neither touches the filesystem nor loads drivers.
+    @cached_property
+    def engine(self) -> Engine:
+        self._ensure_directory_exists()
+        engine = create_engine(self.database_url, echo=False, **self._engine_options())
+        if self.sqlite_profile is not None:
+            self._install_pragma_hook(engine, self.sqlite_profile)
+        return engine
 
+    @cached_property
+    def async_engine(self) -> AsyncEngine:
         self._ensure_directory_exists()
+        async_engine = create_async_engine(
+            self.async_database_url, echo=False, **self._engine_options()
+        )
+        if self.sqlite_profile is not None:
+            self._install_pragma_hook(async_engine.sync_engine, self.sqlite_profile)
+        return async_engine
+
+    @property
+    def is_sqlite(self) -> bool:
+        return self.database_url.startswith("sqlite")
 
-        self.engine = create_engine(
-            database_url,
-            connect_args={"check_same_thread": False}
-            if "sqlite" in database_url
-            else {},
-            echo=False,
-            pool_pre_ping=True,
+    @property
+    def async_database_url(self) -> str:
+        if self.database_url.startswith("sqlite://"):
+            return self.database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        return self.database_url
+
+    @property
+    def is_in_memory(self) -> bool:
+        return self.is_sqlite and (
+            ":memory:" in self.database_url or self.database_url == "sqlite://"
         )
 
+    def _engine_options(self) -> dict:
+        if not self.is_sqlite:
+            return {"pool_pre_ping": True}
+
+        options: dict = {"connect_args": {"check_same_thread": False}}
+
+        # A local file cannot drop a connection the way a network socket can,
+        # so the SELECT 1 issued by pool_pre_ping on every checkout is skipped.
+        if self.sqlite_profile is None:
+            options["pool_pre_ping"] = True
+        elif not self.is_in_memory:
+            options["pool_size"] = self.sqlite_profile.pool_size
+            options["max_overflow"] = self.sqlite_profile.max_overflow
+
+        return options
+
+    def _install_pragma_hook(
+        self, engine: Engine, profile: SQLitePerformanceProfile
+    ) -> None:
+        pragmas = profile.pragmas()
+        if self.is_in_memory:
+            pragmas.pop("journal_mode")
+            pragmas.pop("mmap_size")
+
+        @event.listens_for(engine, "connect")
+        def _apply_pragmas(dbapi_connection, _connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
     def _ensure_directory_exists(self):
-        if self.database_url.startswith("sqlite:///"):
+        if self.database_url.startswith("sqlite:///") and not self.is_in_memory:
             db_path = self.database_url.replace("sqlite:///", "")
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
     def create_tables(self):
-        SQLModel.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            _create_schema(connection)
+
+    async def create_tables_async(self):
+        async with self.async_engine.begin() as connection:
+            await connection.run_sync(_create_schema)
 
     def get_session(self) -> Generator[Session, None, None]:
         with Session(self.engine) as session:
             yield session
 
+    async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSession(self.async_engine, expire_on_commit=False) as session:
+            yield session
+
     def dispose(self):
-        self.engine.dispose()
+        if "engine" in self.__dict__:
+            self.engine.dispose()
+
+    async def dispose_async(self):
+        if "async_engine" in self.__dict__:
+            await self.async_engine.dispose()
+
+
+def _create_schema(connection: Connection) -> None:
+    SQLModel.metadata.create_all(connection)
+    _add_missing_columns(connection)
+    _backfill_alarm_changes(connection)
+
+
+def _add_missing_columns(connection: Connection) -> None:
+    # create_all never alters existing tables, so columns added to the models
+    # later are appended here (they must be nullable or carry a default).
+    inspector = inspect(connection)
+
+    for table in SQLModel.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        missing = [column for column in table.columns if column.name not in existing]
+
+        for column in missing:
+            column_ddl = CreateColumn(column).compile(dialect=connection.dialect)
+            connection.execute(
+                text(f"ALTER TABLE {table.name} ADD COLUMN {column_ddl}")
+            )
+
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+def _backfill_alarm_changes(connection: Connection) -> None:
+    # Alarms written before the change feed existed get a version so that a
+    # client syncing from version 0 still receives them.
+    connection.execute(
+        text(
+            "INSERT INTO alarm_changes (alarm_id, version, deleted) "
+            "SELECT id, "
+            "(SELECT coalesce(max(version), 0) FROM alarm_changes) "
+            "+ row_number() OVER (ORDER BY created_at, id), 0 "
+            "FROM alarms WHERE id NOT IN (SELECT alarm_id FROM alarm_changes)"
+        )
+    )
 
 
 db_config = DatabaseConfig()
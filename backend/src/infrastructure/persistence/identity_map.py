@@ -0,0 +1,34 @@
+from datetime import datetime
+from uuid import UUID
+
+from backend.src.domain.aggregates import SunriseAlarm
+
+
+class AlarmIdentityMap:
+    def __init__(self):
+        self._entries: dict[UUID, tuple[datetime, SunriseAlarm]] = {}
+
+    def get(self, alarm_id: UUID, updated_at: datetime) -> SunriseAlarm | None:
+        entry = self._entries.get(alarm_id)
+        if entry is None or entry[0] != updated_at:
+            return None
+        return entry[1]
+
+    def peek(self, alarm_id: UUID) -> tuple[datetime, SunriseAlarm] | None:
+        return self._entries.get(alarm_id)
+
+    def put(self, alarm: SunriseAlarm, updated_at: datetime) -> SunriseAlarm:
+        self._entries[alarm.id] = (updated_at, alarm)
+        return alarm
+
+    def invalidate(self, alarm_id: UUID) -> None:
+        self._entries.pop(alarm_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+alarm_identity_map = AlarmIdentityMap()
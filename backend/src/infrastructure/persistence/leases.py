@@ -0,0 +1,214 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from backend.src.domain.aggregates import SunriseAlarm
+from backend.src.domain.value_objects import AlarmLease, AlarmStatus
+from backend.src.infrastructure.persistence.identity_map import (
+    AlarmIdentityMap,
+    alarm_identity_map,
+)
+from backend.src.infrastructure.persistence.mappers import to_domain
+from backend.src.infrastructure.persistence.models import AlarmModel
+from backend.src.infrastructure.persistence.repository import (
+    _ALARM_COLUMNS,
+    _change_rows,
+    _IdentityMapped,
+    _record_changes_statement,
+)
+from backend.src.infrastructure.sound_profiles import SoundProfileRepository
+
+# Ramps last at most an hour (Duration is capped at 60 minutes), so a lease
+# that expired longer ago than that belongs to a sunrise that is already over.
+_TAKEOVER_WINDOW = timedelta(hours=1)
+
+_alarms = AlarmModel.__table__
+
+
+def _claim_statement(alarm_id: UUID, owner: str, now: datetime, expires_at: datetime):
+    # The status check and the write are one statement, so of several workers
+    # racing for the same due alarm exactly one sees a matched row. The fire
+    # instant is re-checked too: a worker whose in-memory copy predates a
+    # reschedule must not start the ramp at the old time.
+    return (
+        update(_alarms)
+        .where(_alarms.c.id == alarm_id)
+        .where(_alarms.c.status == AlarmStatus.SCHEDULED)
+        .where(_alarms.c.next_fire_at <= now.astimezone(UTC))
+        .values(
+            status=AlarmStatus.RUNNING,
+            current_step=0,
+            next_fire_at=None,
+            lease_owner=owner,
+            lease_expires_at=expires_at,
+            updated_at=now,
+        )
+        .returning(*_ALARM_COLUMNS)
+    )
+
+
+def _expires_at(now: datetime, duration: timedelta) -> datetime:
+    # Lease expiries are instants compared across workers, so they are kept in
+    # UTC; updated_at and the fire time still take the caller's local now.
+    return now.astimezone(UTC) + duration
+
+
+def _stale_condition(now: datetime):
+    # A released lease has no owner and is never taken over; only a worker that
+    # stopped heartbeating mid-ramp leaves an owned, expired lease behind.
+    now = now.astimezone(UTC)
+    return (
+        (_alarms.c.status == AlarmStatus.RUNNING)
+        & _alarms.c.lease_owner.is_not(None)
+        & (_alarms.c.lease_expires_at < now)
+        & (_alarms.c.lease_expires_at >= now - _TAKEOVER_WINDOW)
+    )
+
+
+class SQLiteAlarmLeaseStore(_IdentityMapped):
+    # Claimed and taken-over alarms go through the repository's identity map,
+    # so the ramp runs on the same aggregate the scheduler and the API hold.
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        sound_profiles: SoundProfileRepository,
+        identity_map: AlarmIdentityMap = alarm_identity_map,
+    ):
+        self._engine = engine
+        self._sound_profiles = sound_profiles
+        self._identity_map = identity_map
+
+    async def claim(
+        self, alarm_id: UUID, owner: str, now: datetime, duration: timedelta
+    ) -> tuple[AlarmLease, SunriseAlarm] | None:
+        expires_at = _expires_at(now, duration)
+        statement = _claim_statement(alarm_id, owner, now, expires_at)
+        cached = self._identity_map.peek(alarm_id)
+        async with self._engine.begin() as connection:
+            claimed = None
+            if cached is not None:
+                # Only matches while the row is still at the cached watermark;
+                # the attempt also takes the write lock, so the fallback below
+                # sees the very same row
+                watermark, alarm = cached
+                row = (
+                    await connection.execute(
+                        statement.where(_alarms.c.updated_at == watermark)
+                    )
+                ).first()
+                if row is not None:
+                    claimed = alarm, row.updated_at
+
+            if claimed is None:
+                # No or a stale cached copy: the row is handed out as the due
+                # alarm it was claimed as, with its current sound profile
+                row = (await connection.execute(statement)).first()
+                if row is None:
+                    return None
+                alarm = to_domain(row, self._sound_profiles, AlarmStatus.SCHEDULED)
+                claimed = alarm, row.updated_at
+
+            await self._record_change(connection, alarm_id)
+
+        alarm, updated_at = claimed
+        lease = AlarmLease(alarm_id=alarm_id, owner=owner, expires_at=expires_at)
+        return lease, self._identity_map.put(alarm, updated_at)
+
+    async def take_over_stale(
+        self, owner: str, now: datetime, duration: timedelta
+    ) -> list[tuple[AlarmLease, SunriseAlarm]]:
+        expires_at = _expires_at(now, duration)
+        async with self._engine.connect() as connection:
+            candidates = (
+                await connection.execute(
+                    select(_alarms.c.id).where(_stale_condition(now))
+                )
+            ).scalars()
+            candidate_ids = list(candidates)
+
+        taken_over = []
+        for alarm_id in candidate_ids:
+            # Re-checks staleness in the UPDATE itself: another worker may have
+            # taken the same lease over since the scan.
+            statement = (
+                update(_alarms)
+                .where(_alarms.c.id == alarm_id)
+                .where(_stale_condition(now))
+                .values(lease_owner=owner, lease_expires_at=expires_at, updated_at=now)
+                .returning(*_ALARM_COLUMNS)
+            )
+            async with self._engine.begin() as connection:
+                row = (await connection.execute(statement)).first()
+                if row is None:
+                    continue
+                await self._record_change(connection, alarm_id)
+
+            lease = AlarmLease(alarm_id=alarm_id, owner=owner, expires_at=expires_at)
+            taken_over.append((lease, self._resolve(row)))
+
+        return taken_over
+
+    async def renew(
+        self, lease: AlarmLease, alarm: SunriseAlarm, now: datetime, duration: timedelta
+    ) -> AlarmLease | None:
+        # Fails once the alarm was cancelled or deleted elsewhere, or another
+        # worker took the lease over, which tells the owner to stop its ramp.
+        expires_at = _expires_at(now, duration)
+        statement = (
+            update(_alarms)
+            .where(_alarms.c.id == lease.alarm_id)
+            .where(_alarms.c.lease_owner == lease.owner)
+            .where(_alarms.c.status == AlarmStatus.RUNNING)
+            .values(
+                lease_expires_at=expires_at,
+                current_step=alarm.current_step,
+                updated_at=now,
+            )
+            .returning(_alarms.c.updated_at)
+        )
+        async with self._engine.begin() as connection:
+            updated_at = (await connection.execute(statement)).scalar_one_or_none()
+            if updated_at is None:
+                return None
+
+        # Keeps the watermark current, so reads during the ramp are served the
+        # live aggregate instead of a copy mapped from the last heartbeat
+        self._identity_map.put(alarm, updated_at)
+
+        return AlarmLease(
+            alarm_id=lease.alarm_id, owner=lease.owner, expires_at=expires_at
+        )
+
+    async def release(
+        self, lease: AlarmLease, alarm: SunriseAlarm, now: datetime
+    ) -> bool:
+        statement = (
+            update(_alarms)
+            .where(_alarms.c.id == lease.alarm_id)
+            .where(_alarms.c.lease_owner == lease.owner)
+            .values(
+                status=alarm.status,
+                current_step=alarm.current_step,
+                # A recurring alarm is released re-armed for its next occurrence
+                next_fire_at=alarm.next_fire_at(now),
+                lease_owner=None,
+                lease_expires_at=None,
+                updated_at=now,
+            )
+            .returning(_alarms.c.updated_at)
+        )
+        async with self._engine.begin() as connection:
+            updated_at = (await connection.execute(statement)).scalar_one_or_none()
+            if updated_at is None:
+                return False
+            await self._record_change(connection, lease.alarm_id)
+
+        self._identity_map.put(alarm, updated_at)
+        return True
+
+    async def _record_change(self, connection: AsyncConnection, alarm_id: UUID):
+        await connection.execute(
+            _record_changes_statement(), _change_rows([alarm_id], False)
+        )
@@ -1,49 +1,105 @@
+from datetime import date, datetime
+
 from backend.src.domain.aggregates import SunriseAlarm
-from backend.src.domain.easing import ease_in_cubic, ease_in_quad, ease_linear
+from backend.src.domain.easing import EasingCurve, easing_registry
 from backend.src.domain.value_objects import (
+    AlarmStatus,
     BrightnessRange,
     Duration,
     EasingType,
+    Recurrence,
+    ScheduledTime,
     TransitionSteps,
 )
 from backend.src.infrastructure.persistence.models import AlarmModel
+from backend.src.infrastructure.sound_profiles import SoundProfileRepository
 
 
-_EASING_TO_ENUM = {
-    ease_linear: EasingType.LINEAR,
-    ease_in_quad: EasingType.EASE_IN_QUAD,
-    ease_in_cubic: EasingType.EASE_IN_CUBIC,
-}
+def to_row(alarm: SunriseAlarm, name: str = None) -> dict:
+    # Plain column dict for Core statements; skips the cost of building an
+    # AlarmModel (and its default factories) for every alarm in bulk writes.
+    easing = alarm.easing_function
+    now = datetime.now()
+    scheduled_time = alarm.scheduled_time
+    recurrence = alarm.recurrence
 
-_ENUM_TO_EASING = {
-    EasingType.LINEAR: ease_linear,
-    EasingType.EASE_IN_QUAD: ease_in_quad,
-    EasingType.EASE_IN_CUBIC: ease_in_cubic,
-}
+    return {
+        "id": alarm.id,
+        "name": name or alarm.room_name,
+        "room_name": alarm.room_name,
+        "scene_name": alarm.scene_name,
+        "duration_minutes": alarm._duration.minutes,
+        "brightness_start": alarm._brightness_range.start,
+        "brightness_end": alarm._brightness_range.end,
+        "steps_count": alarm._steps.count,
+        "sound_profile_name": alarm.sound_profile.key if alarm.sound_profile else None,
+        "easing_type": _legacy_easing_type(easing),
+        "easing_id": easing.id,
+        "easing_params": ",".join(map(repr, easing.params)) or None,
+        "status": alarm.status,
+        "current_step": alarm._current_step,
+        "scheduled_hour": scheduled_time.hour if scheduled_time else None,
+        "scheduled_minute": scheduled_time.minute if scheduled_time else None,
+        "recurrence_weekdays": recurrence.weekdays,
+        "timezone": recurrence.timezone,
+        "skip_dates": _format_skip_dates(recurrence.skip_dates),
+        "next_fire_at": alarm.next_fire_at(now),
+        "created_at": now,
+        "updated_at": now,
+    }
 
 
-def to_model(alarm: SunriseAlarm, name: str = None) -> AlarmModel:
-    easing_enum = _EASING_TO_ENUM.get(alarm._easing_function, EasingType.LINEAR)
-
-    return AlarmModel(
-        id=alarm.id,
-        name=name or alarm.room_name,
-        room_name=alarm.room_name,
-        scene_name=alarm.scene_name,
-        duration_minutes=alarm._duration.minutes,
-        brightness_start=alarm._brightness_range.start,
-        brightness_end=alarm._brightness_range.end,
-        steps_count=alarm._steps.count,
-        sound_profile_name=alarm.sound_profile.name if alarm.sound_profile else None,
-        easing_type=easing_enum,
-        status=alarm.status,
-        current_step=alarm._current_step,
+def _legacy_easing_type(easing: EasingCurve) -> EasingType:
+    # Still written for code that only knows the enum column
+    try:
+        return EasingType(easing.id)
+    except ValueError:
+        return EasingType.LINEAR
+
+
+def _to_easing(model: AlarmModel) -> EasingCurve:
+    if model.easing_id is None:
+        return easing_registry.curve(model.easing_type)
+
+    params = model.easing_params.split(",") if model.easing_params else ()
+    return easing_registry.curve(model.easing_id, *map(float, params))
+
+
+def _format_skip_dates(skip_dates: frozenset[date]) -> str | None:
+    if not skip_dates:
+        return None
+    return ",".join(sorted(day.isoformat() for day in skip_dates))
+
+
+def _to_recurrence(model: AlarmModel) -> Recurrence:
+    skip_dates = model.skip_dates.split(",") if model.skip_dates else ()
+    return Recurrence(
+        weekdays=model.recurrence_weekdays or 0,
+        timezone=model.timezone,
+        skip_dates=frozenset(date.fromisoformat(day) for day in skip_dates),
     )
 
 
-def to_domain(model: AlarmModel, sound_profile=None) -> SunriseAlarm:
-    easing_func = _ENUM_TO_EASING.get(model.easing_type, ease_linear)
+def _to_scheduled_time(model: AlarmModel) -> ScheduledTime | None:
+    if model.scheduled_hour is None or model.scheduled_minute is None:
+        return None
+    return ScheduledTime(hour=model.scheduled_hour, minute=model.scheduled_minute)
 
+
+def to_model(alarm: SunriseAlarm, name: str = None) -> AlarmModel:
+    return AlarmModel(**to_row(alarm, name))
+
+
+def to_domain(
+    model: AlarmModel,
+    sound_profiles: SoundProfileRepository,
+    status: AlarmStatus | None = None,
+) -> SunriseAlarm:
+    sound_profile = (
+        sound_profiles.find(model.sound_profile_name)
+        if model.sound_profile_name
+        else None
+    )
     alarm = SunriseAlarm(
         room_name=model.room_name,
         scene_name=model.scene_name,
@@ -52,12 +108,14 @@ def to_domain(model: AlarmModel, sound_profile=None) -> SunriseAlarm:
             start=model.brightness_start, end=model.brightness_end
         ),
         steps=TransitionSteps(count=model.steps_count),
-        easing_function=easing_func,
+        easing_function=_to_easing(model),
         sound_profile=sound_profile,
+        scheduled_time=_to_scheduled_time(model),
+        recurrence=_to_recurrence(model),
     )
 
     alarm._id = model.id
-    alarm._status = model.status
+    alarm._status = status or model.status
     alarm._current_step = model.current_step
 
     return alarm
@@ -1,13 +1,36 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
-from sqlmodel import Field, SQLModel
+from sqlalchemy import DateTime, TypeDecorator
+from sqlmodel import Field, Index, SQLModel
 
 from backend.src.domain.value_objects import AlarmStatus, EasingType
 
 
+class UTCDateTime(TypeDecorator):
+    # SQLite has no timezone-aware type: instants are stored as naive UTC so
+    # that they compare correctly in SQL, and come back aware.
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect):
+        if value is None or value.tzinfo is None:
+            return value
+        return value.astimezone(UTC).replace(tzinfo=None)
+
+    def process_result_value(self, value: datetime | None, dialect):
+        if value is None:
+            return None
+        return value.replace(tzinfo=UTC)
+
+
 class AlarmModel(SQLModel, table=True):
     __tablename__ = "alarms"
+    __table_args__ = (
+        Index("ix_alarms_status_next_fire_at", "status", "next_fire_at"),
+        Index("ix_alarms_created_at_id", "created_at", "id"),
+        Index("ix_alarms_status_lease_expires_at", "status", "lease_expires_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
 
@@ -22,10 +45,39 @@ class AlarmModel(SQLModel, table=True):
 
     sound_profile_name: str | None = Field(default=None, max_length=50)
 
+    # easing_type predates the registry and is only read for rows without an
+    # easing_id; params are comma-separated float reprs, which round-trip exactly
     easing_type: EasingType = Field(default=EasingType.LINEAR)
+    easing_id: str | None = Field(default=None, max_length=64)
+    easing_params: str | None = Field(default=None)
 
     status: AlarmStatus = Field(default=AlarmStatus.PENDING)
     current_step: int = Field(default=0)
 
+    scheduled_hour: int | None = Field(default=None, ge=0, le=23)
+    scheduled_minute: int | None = Field(default=None, ge=0, le=59)
+    # Bitmask, bit 0 is Monday; 0 fires once
+    recurrence_weekdays: int = Field(
+        default=0, sa_column_kwargs={"server_default": "0"}
+    )
+    timezone: str | None = Field(default=None, max_length=64)
+    # Comma-separated ISO dates
+    skip_dates: str | None = Field(default=None)
+    next_fire_at: datetime | None = Field(default=None, sa_type=UTCDateTime)
+
+    # Set while a worker drives the ramp; only SQLiteAlarmLeaseStore writes them
+    lease_owner: str | None = Field(default=None, max_length=100)
+    lease_expires_at: datetime | None = Field(default=None, sa_type=UTCDateTime)
+
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
+
+
+class AlarmChangeModel(SQLModel, table=True):
+    __tablename__ = "alarm_changes"
+
+    # One row per alarm id holding its latest change, so the feed stays
+    # bounded by the number of alarms rather than the number of writes.
+    alarm_id: UUID = Field(primary_key=True)
+    version: int = Field(index=True, unique=True)
+    deleted: bool = Field(default=False)
@@ -0,0 +1,114 @@
+from uuid import UUID
+
+from sqlalchemy import tuple_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.src.infrastructure.persistence.models import AlarmChangeModel, AlarmModel
+from backend.src.infrastructure.persistence.read_models import (
+    MAX_CHANGES_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    AlarmChanges,
+    AlarmCursor,
+    AlarmFilter,
+    AlarmPage,
+    AlarmSummary,
+)
+
+
+_SUMMARY_COLUMNS = (
+    AlarmModel.id,
+    AlarmModel.name,
+    AlarmModel.room_name,
+    AlarmModel.scene_name,
+    AlarmModel.status,
+    AlarmModel.scheduled_hour,
+    AlarmModel.scheduled_minute,
+    AlarmModel.next_fire_at,
+    AlarmModel.created_at,
+)
+
+
+class AlarmQueryService:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def list_page(
+        self,
+        alarm_filter: AlarmFilter = AlarmFilter(),
+        cursor: AlarmCursor | None = None,
+        limit: int = 50,
+    ) -> AlarmPage:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+        # Keyset on (created_at, id) served by ix_alarms_created_at_id, so each
+        # page costs O(limit) no matter how deep the client has paged.
+        statement = select(*_SUMMARY_COLUMNS).order_by(
+            AlarmModel.created_at, AlarmModel.id
+        )
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(AlarmModel.created_at, AlarmModel.id)
+                > tuple_(cursor.created_at, cursor.id)
+            )
+        statement = self._apply_filter(statement, alarm_filter).limit(limit + 1)
+
+        rows = (await self._session.exec(statement)).all()
+        summaries = [AlarmSummary(*row) for row in rows[:limit]]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = summaries[-1]
+            next_cursor = AlarmCursor(created_at=last.created_at, id=last.id).encode()
+
+        return AlarmPage(alarms=summaries, next_cursor=next_cursor)
+
+    async def list_changes(self, since: int = 0, limit: int = 500) -> AlarmChanges:
+        limit = max(1, min(limit, MAX_CHANGES_PAGE_SIZE))
+
+        # The outer join leaves the summary columns NULL for deleted alarms
+        statement = (
+            select(
+                AlarmChangeModel.version,
+                AlarmChangeModel.alarm_id,
+                AlarmChangeModel.deleted,
+                *_SUMMARY_COLUMNS,
+            )
+            .select_from(AlarmChangeModel)
+            .outerjoin(AlarmModel, AlarmModel.id == AlarmChangeModel.alarm_id)
+            .where(AlarmChangeModel.version > since)
+            .order_by(AlarmChangeModel.version)
+            .limit(limit + 1)
+        )
+        rows = (await self._session.exec(statement)).all()
+        page = rows[:limit]
+
+        upserted: list[AlarmSummary] = []
+        deleted: list[UUID] = []
+        for _version, alarm_id, is_deleted, *summary in page:
+            if is_deleted or summary[0] is None:
+                deleted.append(alarm_id)
+            else:
+                upserted.append(AlarmSummary(*summary))
+
+        return AlarmChanges(
+            upserted=upserted,
+            deleted=deleted,
+            version=page[-1].version if page else since,
+            has_more=len(rows) > limit,
+        )
+
+    def _apply_filter(self, statement, alarm_filter: AlarmFilter):
+        if alarm_filter.status is not None:
+            statement = statement.where(AlarmModel.status == alarm_filter.status)
+        if alarm_filter.room_name is not None:
+            statement = statement.where(AlarmModel.room_name == alarm_filter.room_name)
+        if alarm_filter.fire_from is not None:
+            statement = statement.where(
+                AlarmModel.next_fire_at >= alarm_filter.fire_from
+            )
+        if alarm_filter.fire_until is not None:
+            statement = statement.where(
+                AlarmModel.next_fire_at < alarm_filter.fire_until
+            )
+        return statement
@@ -0,0 +1,79 @@
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+from backend.src.domain.value_objects import AlarmStatus
+
+# Kept free of SQLAlchemy so the API can declare its schema without loading
+# the database stack at import time.
+MAX_PAGE_SIZE = 200
+MAX_CHANGES_PAGE_SIZE = 1000
+
+
+@dataclass
+class AlarmSummary:
+    id: UUID
+    name: str
+    room_name: str
+    scene_name: str
+    status: AlarmStatus
+    scheduled_hour: int | None
+    scheduled_minute: int | None
+    next_fire_at: datetime | None
+    created_at: datetime
+
+
+@dataclass
+class AlarmPage:
+    alarms: list[AlarmSummary]
+    next_cursor: str | None
+
+
+@dataclass
+class AlarmChanges:
+    upserted: list[AlarmSummary]
+    deleted: list[UUID]
+    version: int
+    has_more: bool
+
+
+@dataclass(frozen=True)
+class AlarmFilter:
+    status: AlarmStatus | None = None
+    room_name: str | None = None
+    fire_from: datetime | None = None
+    fire_until: datetime | None = None
+
+
+@dataclass(frozen=True)
+class AlarmCursor:
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.created_at.isoformat()}|{self.id.hex}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "AlarmCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, alarm_id = (
+                base64.urlsafe_b64decode(padded).decode().split("|", 1)
+            )
+            return cls(created_at=datetime.fromisoformat(created_at), id=UUID(alarm_id))
+        except ValueError as e:
+            raise ValueError(f"Invalid cursor: {token}") from e
+
+
+class AlarmQueries(Protocol):
+    async def list_page(
+        self,
+        alarm_filter: AlarmFilter = AlarmFilter(),
+        cursor: AlarmCursor | None = None,
+        limit: int = 50,
+    ) -> AlarmPage: ...
+
+    async def list_changes(self, since: int = 0, limit: int = 500) -> AlarmChanges: ...
@@ -1,50 +1,286 @@
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from itertools import batched
 from uuid import UUID
-from sqlmodel import Session, select
+
+from sqlalchemy import Insert, Row, Update, delete, func, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.src.domain.aggregates import SunriseAlarm
-from backend.src.infrastructure.persistence.mappers import to_domain, to_model
-from backend.src.infrastructure.persistence.models import AlarmModel
+from backend.src.domain.value_objects import AlarmStatus
+from backend.src.infrastructure.persistence.identity_map import (
+    AlarmIdentityMap,
+    alarm_identity_map,
+)
+from backend.src.infrastructure.persistence.mappers import to_domain, to_row
+from backend.src.infrastructure.persistence.models import AlarmChangeModel, AlarmModel
+from backend.src.infrastructure.sound_profiles import SoundProfileRepository
+from backend.src.shared.metrics import metrics, timed
+
+_OPERATION_SECONDS = metrics.histogram(
+    "repository_operation_seconds", "Alarm repository call latency", ["operation"]
+)
+_SAVE = _OPERATION_SECONDS.labels("save")
+_SAVE_MANY = _OPERATION_SECONDS.labels("save_many")
+_REFRESH_NEXT_FIRE = _OPERATION_SECONDS.labels("refresh_next_fire_at")
+_FIND_BY_ID = _OPERATION_SECONDS.labels("find_by_id")
+_FIND_ALL = _OPERATION_SECONDS.labels("find_all")
+_FIND_DUE = _OPERATION_SECONDS.labels("find_due_between")
+_DELETE_MANY = _OPERATION_SECONDS.labels("delete_many")
+_EXISTS = _OPERATION_SECONDS.labels("exists")
+
+# Stays well below SQLITE_MAX_VARIABLE_NUMBER for the IN (...) of delete_many
+_DELETE_BATCH_SIZE = 500
+# Rows per multi-row upsert; each row binds one variable per column
+_SAVE_BATCH_SIZE = 500
+
+# Lease columns are owned by SQLiteAlarmLeaseStore; a save never touches them
+_UPSERT_IMMUTABLE_COLUMNS = frozenset(
+    {"id", "created_at", "lease_owner", "lease_expires_at"}
+)
+
+# Plain rows instead of ORM entities: unchanged alarms are served from the
+# identity map, so building an AlarmModel per row would be wasted work.
+_ALARM_COLUMNS = tuple(AlarmModel.__table__.columns)
+
+
+def _upsert_statement() -> Insert:
+    table = AlarmModel.__table__
+    statement = sqlite_insert(table)
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={
+            column.name: statement.excluded[column.name]
+            for column in table.columns
+            if column.name not in _UPSERT_IMMUTABLE_COLUMNS
+        },
+        # A stale copy (e.g. from another worker's restore) must not move an
+        # alarm that a worker has already claimed back to scheduled.
+        where=~(
+            (table.c.status == AlarmStatus.RUNNING)
+            & (statement.excluded.status == AlarmStatus.SCHEDULED)
+        ),
+    )
+
+
+def _refresh_next_fire_statement(
+    alarm_id: UUID, next_fire_at: datetime | None, now: datetime
+) -> Update:
+    # Writes the derived column only, so an in-memory copy that predates an
+    # update made elsewhere cannot overwrite the rest of the row. Claimed rows
+    # and rows that already hold the value are left alone.
+    table = AlarmModel.__table__
+    return (
+        update(table)
+        .where(table.c.id == alarm_id)
+        .where(table.c.status == AlarmStatus.SCHEDULED)
+        .where(table.c.next_fire_at.is_distinct_from(next_fire_at))
+        .values(next_fire_at=next_fire_at, updated_at=now)
+        .returning(table.c.updated_at)
+    )
+
+
+def _record_changes_statement() -> Insert:
+    # Each executed row takes max(version) + 1; SQLite serialises writers, so
+    # versions are strictly increasing across processes as well.
+    changes = AlarmChangeModel.__table__
+    next_version = select(func.coalesce(func.max(changes.c.version), 0) + 1)
+    statement = sqlite_insert(changes).values(version=next_version.scalar_subquery())
+    return statement.on_conflict_do_update(
+        index_elements=[changes.c.alarm_id],
+        set_={
+            "version": statement.excluded.version,
+            "deleted": statement.excluded.deleted,
+        },
+    )
+
+
+def _change_rows(alarm_ids: Iterable[UUID], deleted: bool) -> list[dict]:
+    return [{"alarm_id": alarm_id, "deleted": deleted} for alarm_id in alarm_ids]
+
+
+def _find_by_id_statement(alarm_id: UUID):
+    return select(*_ALARM_COLUMNS).where(AlarmModel.id == alarm_id)
+
+
+def _find_all_statement():
+    return select(*_ALARM_COLUMNS)
 
 
-class SQLiteAlarmRepository:
-    def __init__(self, session: Session):
+def _due_between_statement(start: datetime, end: datetime):
+    # Served by ix_alarms_status_next_fire_at: equality on status, range on time
+    return (
+        select(*_ALARM_COLUMNS)
+        .where(AlarmModel.status == AlarmStatus.SCHEDULED)
+        .where(AlarmModel.next_fire_at >= start)
+        .where(AlarmModel.next_fire_at < end)
+        .order_by(AlarmModel.next_fire_at)
+    )
+
+
+def _delete_statement(alarm_ids: Iterable[UUID]):
+    return (
+        delete(AlarmModel).where(AlarmModel.id.in_(alarm_ids)).returning(AlarmModel.id)
+    )
+
+
+class _IdentityMapped:
+    _identity_map: AlarmIdentityMap
+    _sound_profiles: SoundProfileRepository
+
+    def _resolve(self, row: Row) -> SunriseAlarm:
+        cached = self._identity_map.get(row.id, row.updated_at)
+        if cached is not None:
+            return cached
+        alarm = to_domain(row, self._sound_profiles)
+        return self._identity_map.put(alarm, row.updated_at)
+
+    def _resolve_all(self, rows: Sequence[Row]) -> list[SunriseAlarm]:
+        return [self._resolve(row) for row in rows]
+
+    def _remember_saved(
+        self, alarms: list[SunriseAlarm], written: dict[UUID, datetime]
+    ) -> None:
+        # Rows the upsert guard skipped keep their stored state, so the
+        # in-memory copies of those are dropped instead of remembered
+        for alarm in alarms:
+            updated_at = written.get(alarm.id)
+            if updated_at is None:
+                self._identity_map.invalidate(alarm.id)
+            else:
+                self._identity_map.put(alarm, updated_at)
+
+    def _remember_refreshed(
+        self, refreshed: list[tuple[SunriseAlarm, datetime]]
+    ) -> None:
+        for alarm, updated_at in refreshed:
+            self._identity_map.put(alarm, updated_at)
+
+    def _forget(self, alarm_ids: Iterable[UUID]) -> None:
+        for alarm_id in alarm_ids:
+            self._identity_map.invalidate(alarm_id)
+
+
+class AsyncSQLiteAlarmRepository(_IdentityMapped):
+    def __init__(
+        self,
+        session: AsyncSession,
+        sound_profiles: SoundProfileRepository,
+        identity_map: AlarmIdentityMap = alarm_identity_map,
+    ):
         self._session = session
+        self._sound_profiles = sound_profiles
+        self._identity_map = identity_map
+
+    @timed(_SAVE)
+    async def save(self, alarm: SunriseAlarm) -> SunriseAlarm:
+        statement = (
+            _upsert_statement().values(**to_row(alarm)).returning(AlarmModel.updated_at)
+        )
+        try:
+            updated_at = (await self._session.exec(statement)).scalar_one_or_none()
+            if updated_at is not None:
+                await self._session.exec(
+                    _record_changes_statement(), params=_change_rows([alarm.id], False)
+                )
+            await self._session.commit()
+        except Exception:
+            # The cached aggregate may hold changes that never reached the row
+            self._identity_map.invalidate(alarm.id)
+            raise
+
+        if updated_at is None:
+            self._identity_map.invalidate(alarm.id)
+            return alarm
 
-    def save(self, alarm: SunriseAlarm) -> SunriseAlarm:
-        model = to_model(alarm)
+        return self._identity_map.put(alarm, updated_at)
 
-        existing = self._session.get(AlarmModel, alarm.id)
-        if existing:
-            for key, value in model.model_dump(exclude={"created_at"}).items():
-                setattr(existing, key, value)
-            self._session.add(existing)
-        else:
-            self._session.add(model)
+    @timed(_SAVE_MANY)
+    async def save_many(self, alarms: Iterable[SunriseAlarm]) -> int:
+        alarms = list(alarms)
+        if not alarms:
+            return 0
 
-        self._session.commit()
-        self._session.refresh(model if not existing else existing)
+        written: dict[UUID, datetime] = {}
+        for batch in batched(alarms, _SAVE_BATCH_SIZE):
+            statement = (
+                _upsert_statement()
+                .values([to_row(alarm) for alarm in batch])
+                .returning(AlarmModel.id, AlarmModel.updated_at)
+            )
+            written.update((await self._session.exec(statement)).all())
 
-        return to_domain(model if not existing else existing)
+        if written:
+            await self._session.exec(
+                _record_changes_statement(), params=_change_rows(written, False)
+            )
+        await self._session.commit()
+        self._remember_saved(alarms, written)
+        return len(written)
 
-    def find_by_id(self, alarm_id: UUID) -> SunriseAlarm | None:
-        model = self._session.get(AlarmModel, alarm_id)
-        if not model:
+    @timed(_REFRESH_NEXT_FIRE)
+    async def refresh_next_fire_at(self, alarms: Iterable[SunriseAlarm]) -> int:
+        now = datetime.now()
+        refreshed: list[tuple[SunriseAlarm, datetime]] = []
+        for alarm in alarms:
+            statement = _refresh_next_fire_statement(
+                alarm.id, alarm.next_fire_at(now), now
+            )
+            updated_at = (await self._session.exec(statement)).scalar_one_or_none()
+            if updated_at is not None:
+                refreshed.append((alarm, updated_at))
+
+        if refreshed:
+            await self._session.exec(
+                _record_changes_statement(),
+                params=_change_rows((alarm.id for alarm, _ in refreshed), False),
+            )
+        await self._session.commit()
+        self._remember_refreshed(refreshed)
+        return len(refreshed)
+
+    @timed(_FIND_BY_ID)
+    async def find_by_id(self, alarm_id: UUID) -> SunriseAlarm | None:
+        row = (await self._session.exec(_find_by_id_statement(alarm_id))).first()
+        if not row:
+            self._identity_map.invalidate(alarm_id)
             return None
-        return to_domain(model)
+        return self._resolve(row)
+
+    @timed(_FIND_ALL)
+    async def find_all(self) -> list[SunriseAlarm]:
+        rows = (await self._session.exec(_find_all_statement())).all()
+        return self._resolve_all(rows)
+
+    @timed(_FIND_DUE)
+    async def find_due_between(
+        self, start: datetime, end: datetime
+    ) -> list[SunriseAlarm]:
+        statement = _due_between_statement(start, end)
+        rows = (await self._session.exec(statement)).all()
+        return self._resolve_all(rows)
 
-    def find_all(self) -> list[SunriseAlarm]:
-        statement = select(AlarmModel)
-        models = self._session.exec(statement).all()
-        return [to_domain(model) for model in models]
+    async def delete(self, alarm_id: UUID) -> bool:
+        return await self.delete_many([alarm_id]) > 0
 
-    def delete(self, alarm_id: UUID) -> bool:
-        model = self._session.get(AlarmModel, alarm_id)
-        if not model:
-            return False
+    @timed(_DELETE_MANY)
+    async def delete_many(self, alarm_ids: Iterable[UUID]) -> int:
+        deleted: list[UUID] = []
+        for batch in batched(alarm_ids, _DELETE_BATCH_SIZE):
+            result = await self._session.exec(_delete_statement(batch))
+            deleted.extend(result.scalars())
 
-        self._session.delete(model)
-        self._session.commit()
-        return True
+        if deleted:
+            await self._session.exec(
+                _record_changes_statement(), params=_change_rows(deleted, True)
+            )
+        await self._session.commit()
+        self._forget(deleted)
+        return len(deleted)
 
-    def exists(self, alarm_id: UUID) -> bool:
-        return self._session.get(AlarmModel, alarm_id) is not None
+    @timed(_EXISTS)
+    async def exists(self, alarm_id: UUID) -> bool:
+        statement = select(AlarmModel.id).where(AlarmModel.id == alarm_id).limit(1)
+        return (await self._session.exec(statement)).first() is not None
@@ -0,0 +1,17 @@
+from .backends import (
+    FakeRoomCatalogBackend,
+    HueifyRoomCatalogBackend,
+    RoomCatalogBackend,
+)
+from .models import CatalogRoom, CatalogScene, RoomCatalogSnapshot
+from .service import RoomCatalog
+
+__all__ = [
+    "CatalogRoom",
+    "CatalogScene",
+    "FakeRoomCatalogBackend",
+    "HueifyRoomCatalogBackend",
+    "RoomCatalog",
+    "RoomCatalogBackend",
+    "RoomCatalogSnapshot",
+]
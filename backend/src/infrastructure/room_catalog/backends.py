@@ -0,0 +1,88 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Iterable
+
+from backend.src.infrastructure.room_catalog.models import CatalogRoom, CatalogScene
+
+
+class RoomCatalogBackend(ABC):
+    @abstractmethod
+    async def fetch_rooms(self) -> list[CatalogRoom]:
+        pass
+
+
+class HueifyRoomCatalogBackend(RoomCatalogBackend):
+    async def fetch_rooms(self) -> list[CatalogRoom]:
+        from hueify import RoomLookup, SceneLookup
+
+        groups, scenes = await asyncio.gather(
+            RoomLookup().get_all_entities(), SceneLookup().get_scenes()
+        )
+
+        scenes_by_group: dict[str, list[CatalogScene]] = defaultdict(list)
+        for scene in scenes:
+            scenes_by_group[str(scene.group_id)].append(
+                CatalogScene(id=str(scene.id), name=scene.name)
+            )
+
+        return [
+            CatalogRoom(
+                id=str(group.id),
+                name=group.name,
+                type=group.archetype.value.replace("_", " ").capitalize(),
+                scenes=tuple(
+                    sorted(scenes_by_group[str(group.id)], key=lambda s: s.name)
+                ),
+            )
+            for group in groups
+        ]
+
+
+DEFAULT_FAKE_ROOMS = (
+    CatalogRoom(
+        id="room-1",
+        name="Zimmer 1",
+        type="Bedroom",
+        scenes=(
+            CatalogScene(id="scene-1", name="Tageslichtwecker"),
+            CatalogScene(id="scene-2", name="Entspannen"),
+            CatalogScene(id="scene-3", name="Konzentrieren"),
+        ),
+    ),
+    CatalogRoom(
+        id="room-2",
+        name="Wohnzimmer",
+        type="Living room",
+        scenes=(
+            CatalogScene(id="scene-4", name="Gemütlich"),
+            CatalogScene(id="scene-5", name="Hell"),
+        ),
+    ),
+    CatalogRoom(
+        id="room-3",
+        name="Küche",
+        type="Kitchen",
+        scenes=(CatalogScene(id="scene-6", name="Kochen"),),
+    ),
+)
+
+
+class FakeRoomCatalogBackend(RoomCatalogBackend):
+    def __init__(
+        self,
+        rooms: Iterable[CatalogRoom] = DEFAULT_FAKE_ROOMS,
+        latency_seconds: float = 0.0,
+    ):
+        self.rooms = list(rooms)
+        self.latency_seconds = latency_seconds
+        self.failure: Exception | None = None
+        self.fetch_count = 0
+
+    async def fetch_rooms(self) -> list[CatalogRoom]:
+        self.fetch_count += 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        if self.failure is not None:
+            raise self.failure
+        return list(self.rooms)
@@ -0,0 +1,55 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class CatalogScene:
+    id: str
+    name: str
+
+
+@dataclass(frozen=True)
+class CatalogRoom:
+    id: str
+    name: str
+    type: str
+    scenes: tuple[CatalogScene, ...] = ()
+
+    def find_scene(self, scene_name: str) -> CatalogScene | None:
+        return next((scene for scene in self.scenes if scene.name == scene_name), None)
+
+
+@dataclass(frozen=True)
+class RoomCatalogSnapshot:
+    rooms: tuple[CatalogRoom, ...]
+    version: int
+    fetched_at: float | None = None
+    rooms_by_name: Mapping[str, CatalogRoom] = field(init=False, repr=False)
+    rooms_by_id: Mapping[str, CatalogRoom] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Indexed once per refresh so request-time lookups are plain dict hits
+        object.__setattr__(self, "rooms_by_name", {r.name: r for r in self.rooms})
+        object.__setattr__(self, "rooms_by_id", {r.id: r for r in self.rooms})
+
+    @classmethod
+    def empty(cls) -> "RoomCatalogSnapshot":
+        return cls(rooms=(), version=0)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.fetched_at is not None
+
+    def find_room(self, room_name: str) -> CatalogRoom | None:
+        return self.rooms_by_name.get(room_name)
+
+    def find_room_by_id(self, room_id: str) -> CatalogRoom | None:
+        return self.rooms_by_id.get(room_id)
+
+    def with_rooms(
+        self, rooms: Iterable[CatalogRoom], fetched_at: float
+    ) -> "RoomCatalogSnapshot":
+        rooms = tuple(sorted(rooms, key=lambda room: room.name))
+        # The version only moves when the content does, keeping ETags stable
+        version = self.version if rooms == self.rooms else self.version + 1
+        return RoomCatalogSnapshot(rooms=rooms, version=version, fetched_at=fetched_at)
@@ -0,0 +1,88 @@
+import asyncio
+import time
+from collections.abc import Callable
+
+from backend.src.infrastructure.room_catalog.backends import RoomCatalogBackend
+from backend.src.infrastructure.room_catalog.models import RoomCatalogSnapshot
+from backend.src.shared.logging import LoggingMixin
+
+
+class RoomCatalog(LoggingMixin):
+    def __init__(
+        self,
+        backend: RoomCatalogBackend,
+        max_age_seconds: float = 300.0,
+        retry_after_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._backend = backend
+        self._max_age_seconds = max_age_seconds
+        self._retry_after_seconds = retry_after_seconds
+        self._clock = clock
+        self._snapshot = RoomCatalogSnapshot.empty()
+        self._next_refresh_at = 0.0
+        self._refresh_task: asyncio.Task | None = None
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def snapshot(self) -> RoomCatalogSnapshot:
+        # Stale-while-revalidate: always answer from memory, refresh behind it
+        if self._clock() >= self._next_refresh_at:
+            self._schedule_refresh()
+        return self._snapshot
+
+    async def start(self, warmup_timeout_seconds: float = 2.0) -> None:
+        task = self._schedule_refresh()
+        if task is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(task), warmup_timeout_seconds)
+        except TimeoutError:
+            self.logger.warning(
+                f"Room catalog not loaded after {warmup_timeout_seconds}s, "
+                "continuing in the background"
+            )
+
+    async def stop(self) -> None:
+        task, self._refresh_task = self._refresh_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def refresh(self) -> RoomCatalogSnapshot:
+        try:
+            rooms = await self._backend.fetch_rooms()
+        except Exception as e:
+            self._next_refresh_at = self._clock() + self._retry_after_seconds
+            self.logger.warning(f"Room catalog refresh failed, serving stale data: {e}")
+            return self._snapshot
+
+        now = self._clock()
+        previous_version = self._snapshot.version
+        self._snapshot = self._snapshot.with_rooms(rooms, fetched_at=now)
+        self._next_refresh_at = now + self._max_age_seconds
+
+        if self._snapshot.version != previous_version:
+            self.logger.info(
+                f"Room catalog updated to version {self._snapshot.version} "
+                f"({len(self._snapshot.rooms)} room(s))"
+            )
+        return self._snapshot
+
+    def _schedule_refresh(self) -> asyncio.Task | None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return self._refresh_task
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        self._refresh_task = loop.create_task(self.refresh())
+        return self._refresh_task
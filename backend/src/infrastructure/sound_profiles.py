@@ -13,6 +13,7 @@ class SoundProfileRepository:
 
     def _initialize_profiles(self) -> None:
         self._profiles[SoundProfileName.PEACEFUL] = SoundProfile(
+            key=SoundProfileName.PEACEFUL,
             name="Peaceful Morning",
             wake_up_sound=AudioFile(self._wake_up_path / "wake-up-bowls.mp3"),
             get_up_sound=AudioFile(self._get_up_path / "get-up-blossom.mp3"),
@@ -20,6 +21,7 @@ class SoundProfileRepository:
         )
 
         self._profiles[SoundProfileName.ENERGETIC] = SoundProfile(
+            key=SoundProfileName.ENERGETIC,
             name="Energetic Start",
             wake_up_sound=AudioFile(self._wake_up_path / "wake-up-gong.mp3"),
             get_up_sound=AudioFile(self._get_up_path / "get-up-shake.mp3"),
@@ -27,6 +29,7 @@ class SoundProfileRepository:
         )
 
         self._profiles[SoundProfileName.NATURE] = SoundProfile(
+            key=SoundProfileName.NATURE,
             name="Nature Awakening",
             wake_up_sound=AudioFile(self._wake_up_path / "wake-up-jungle.mp3"),
             get_up_sound=AudioFile(self._get_up_path / "get-up-retreat.mp3"),
@@ -34,6 +37,7 @@ class SoundProfileRepository:
         )
 
         self._profiles[SoundProfileName.COSMIC] = SoundProfile(
+            key=SoundProfileName.COSMIC,
             name="Cosmic Journey",
             wake_up_sound=AudioFile(self._wake_up_path / "wake-up-galaxy.mp3"),
             get_up_sound=AudioFile(self._get_up_path / "get-up-aurora.mp3"),
@@ -41,6 +45,7 @@ class SoundProfileRepository:
         )
 
         self._profiles[SoundProfileName.MYSTICAL] = SoundProfile(
+            key=SoundProfileName.MYSTICAL,
             name="Mystical Morning",
             wake_up_sound=AudioFile(self._wake_up_path / "wake-up-mist.mp3"),
             get_up_sound=AudioFile(self._get_up_path / "get-up-wisdom.mp3"),
@@ -48,6 +53,7 @@ class SoundProfileRepository:
         )
 
         self._profiles[SoundProfileName.GENTLE] = SoundProfile(
+            key=SoundProfileName.GENTLE,
             name="Gentle Awakening",
             wake_up_sound=AudioFile(self._wake_up_path / "wake-up-cherry.mp3"),
             get_up_sound=AudioFile(self._get_up_path / "get-up-shimmer.mp3"),
@@ -59,8 +65,18 @@ class SoundProfileRepository:
             raise ValueError(f"Sound profile '{profile_name}' not found")
         return self._profiles[profile_name]
 
+    def find(self, key: str) -> SoundProfile | None:
+        profile = self._profiles.get(key)
+        if profile is not None:
+            return profile
+        # Rows written before the key was persisted hold the display name
+        return next(
+            (profile for profile in self._profiles.values() if profile.name == key),
+            None,
+        )
+
     def list_all(self) -> list[SoundProfile]:
         return list(self._profiles.values())
 
     def add_custom(self, profile: SoundProfile) -> None:
-        self._profiles[profile.name] = profile
+        self._profiles[profile.key] = profile
@@ -0,0 +1,120 @@
+import asyncio
+import functools
+import selectors
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import TypeVar
+
+import aiosqlite.core
+
+T = TypeVar("T")
+
+
+class _VirtualTimeSelector:
+    def __init__(self, selector: selectors.BaseSelector, loop: "VirtualTimeEventLoop"):
+        self._selector = selector
+        self._loop = loop
+
+    def select(self, timeout: float | None = None):
+        # Ready I/O is still served; waiting for the next timer is replaced by
+        # jumping the loop's clock straight to it.
+        events = self._selector.select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None or self._loop.has_thread_work():
+            # Blocks until a timer is added or another thread hands back its
+            # result through call_soon_threadsafe, which wakes the selector
+            return self._selector.select(None)
+
+        self._loop.advance(timeout)
+        return []
+
+    def __getattr__(self, name: str):
+        return getattr(self._selector, name)
+
+
+def _track_aiosqlite() -> None:
+    # aiosqlite queues each call to its connection thread and awaits a plain
+    # future, so the loop can only tell the call is in flight by wrapping it
+    execute = aiosqlite.core.Connection._execute
+    if getattr(execute, "_virtual_time_tracked", False):
+        return
+
+    @functools.wraps(execute)
+    async def tracked_execute(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        if not isinstance(loop, VirtualTimeEventLoop):
+            return await execute(self, fn, *args, **kwargs)
+        return await loop.track_thread_work(execute(self, fn, *args, **kwargs))
+
+    tracked_execute._virtual_time_tracked = True
+    aiosqlite.core.Connection._execute = tracked_execute
+
+
+# The loop's clock only moves when every task is waiting on a timer. asyncio
+# sleep, wait_for and call_later all run against loop.time(), so a seven
+# minute ramp completes as soon as its CPU work is done. While work handed to
+# another thread (run_in_executor, aiosqlite's connection thread) is in flight
+# the clock stands still and the loop waits for the result in real time, so
+# database flows see the same ordering on every run. Such work takes no
+# virtual time. Only sockets that are already readable are served first.
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    def __init__(self):
+        super().__init__()
+        self._virtual_time = 0.0
+        self._thread_work = 0
+        self._selector = _VirtualTimeSelector(self._selector, self)
+        _track_aiosqlite()
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        self._virtual_time += seconds
+
+    def has_thread_work(self) -> bool:
+        return self._thread_work > 0
+
+    async def track_thread_work(self, awaitable: Awaitable[T]) -> T:
+        self._thread_work += 1
+        try:
+            return await awaitable
+        finally:
+            self._thread_work -= 1
+
+    def run_in_executor(self, executor, func, *args):
+        future = super().run_in_executor(executor, func, *args)
+        self._thread_work += 1
+        future.add_done_callback(self._thread_work_done)
+        return future
+
+    def _thread_work_done(self, future: asyncio.Future) -> None:
+        self._thread_work -= 1
+
+
+class VirtualClock:
+    def __init__(self, loop: asyncio.AbstractEventLoop, start: datetime):
+        self._loop = loop
+        self._start = start
+        self._origin_ns = self.monotonic_ns()
+
+    def now(self) -> datetime:
+        return self.wall_time(self.monotonic_ns())
+
+    def monotonic_ns(self) -> int:
+        return round(self._loop.time() * 1_000_000_000)
+
+    def wall_time(self, monotonic_ns: int) -> datetime:
+        elapsed_us = (monotonic_ns - self._origin_ns) // 1000
+        return self._start + timedelta(microseconds=elapsed_us)
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+def run_in_virtual_time(
+    main: Callable[[VirtualClock], Awaitable[T]], start: datetime
+) -> T:
+    with asyncio.Runner(loop_factory=VirtualTimeEventLoop) as runner:
+        clock = VirtualClock(runner.get_loop(), start)
+        return runner.run(main(clock))
@@ -1,16 +1,31 @@
+import atexit
+import copy
 import logging
 import os
-from typing import ClassVar
-
-from dotenv import load_dotenv
-
-load_dotenv(override=True)
+import queue
+import sys
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, ClassVar
 
 _APP_NAME = "daylight_alarm"
 
+_DEFAULT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
 logger = logging.getLogger(_APP_NAME)
 logger.addHandler(logging.NullHandler())
 
+_log_context: ContextVar[Mapping[str, Any] | None] = ContextVar(
+    "log_context", default=None
+)
+
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
 
 def _configure_library_logging(level: str = "WARNING") -> None:
     log_level = getattr(logging, level.upper(), logging.WARNING)
@@ -26,6 +41,105 @@ def _auto_configure_from_environment() -> None:
 _auto_configure_from_environment()
 
 
+def load_environment() -> None:
+    # Reads .env at startup instead of as a side effect of importing logging
+    from dotenv import load_dotenv
+
+    load_dotenv(override=True)
+    _auto_configure_from_environment()
+
+
+def log_fields(**fields: Any) -> dict[str, Any]:
+    # Passed as extra=..., rendered as key=value after the message
+    return {"fields": fields}
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[dict[str, Any]]:
+    # The yielded dict may be updated in place (e.g. the current step), so a
+    # ramp does not need to re-enter the context on every step.
+    parent = _log_context.get()
+    context = {**parent, **fields} if parent else dict(fields)
+    token = _log_context.set(context)
+    try:
+        yield context
+    finally:
+        _log_context.reset(token)
+
+
+class _ContextQueueHandler(QueueHandler):
+    # Runs on the calling thread after the level check, so disabled log calls
+    # never pay for it. Unlike QueueHandler.prepare the traceback is kept apart
+    # from the message, which leaves the structured fields on the first line.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _TRACEBACK_FORMATTER.formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+
+        # Copied so later in-place updates of the context stay out of the record
+        context = _log_context.get()
+        if context:
+            record.context = dict(context)
+        return record
+
+
+class StructuredFormatter(logging.Formatter):
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        message = super().formatMessage(record)
+        context = getattr(record, "context", None)
+        fields = getattr(record, "fields", None)
+        if not context and not fields:
+            return message
+
+        merged = {**(context or {}), **(fields or {})}
+        rendered = " ".join(
+            f"{key}={value}" for key, value in merged.items() if value is not None
+        )
+        return f"{message} {rendered}" if rendered else message
+
+
+def start_queue_logging(*handlers: logging.Handler) -> None:
+    # Log records are only enqueued on the calling thread; formatting the
+    # final line and writing it happen on the listener thread.
+    global _listener, _queue_handler
+
+    if _listener is not None:
+        return
+
+    if not handlers:
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(StructuredFormatter(_DEFAULT_FORMAT))
+        handlers = (stream_handler,)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = _ContextQueueHandler(log_queue)
+    logger.addHandler(_queue_handler)
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_queue_logging)
+
+
+def stop_queue_logging() -> None:
+    global _listener, _queue_handler
+
+    if _listener is None:
+        return
+
+    logger.removeHandler(_queue_handler)
+    logger.propagate = True
+    # Drains everything still queued before the thread exits
+    _listener.stop()
+    _listener = None
+    _queue_handler = None
+
+
 class LoggingMixin:
     logger: ClassVar[logging.Logger] = None
 
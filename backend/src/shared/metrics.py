@@ -0,0 +1,358 @@
+import asyncio
+import inspect
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from functools import wraps
+from time import perf_counter
+from typing import Any
+
+from backend.src.shared.logging import LoggingMixin
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Label sets beyond this limit share one overflow series, keeping memory
+# bounded when a label value is unexpectedly unbounded.
+DEFAULT_MAX_SERIES = 64
+_OVERFLOW_LABEL_VALUE = "other"
+
+
+# Children are created once per label set and then updated with plain
+# attribute writes on the event loop thread: no locks and no allocation
+# beyond the float result of the addition itself.
+class CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class GaugeChild:
+    __slots__ = ("value", "_function")
+
+    def __init__(self):
+        self.value = 0.0
+        self._function: Callable[[], float] | None = None
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        # Evaluated at scrape time only, so the hot path never touches it
+        self._function = function
+
+    def read(self) -> float:
+        return self._function() if self._function is not None else self.value
+
+
+class HistogramChild:
+    __slots__ = ("bucket_bounds", "bucket_counts", "sum", "count")
+
+    def __init__(self, bucket_bounds: tuple[float, ...]):
+        self.bucket_bounds = bucket_bounds
+        self.bucket_counts = [0] * (len(bucket_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.bucket_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric(LoggingMixin, ABC):
+    type_name = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        max_series: int = DEFAULT_MAX_SERIES,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._max_series = max_series
+        self._children: dict[tuple[str, ...], Any] = {}
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is not None:
+            return child
+
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {values}"
+            )
+        if len(self._children) >= self._max_series:
+            overflow = (_OVERFLOW_LABEL_VALUE,) * len(self.labelnames)
+            if overflow not in self._children:
+                self.logger.warning(
+                    f"{self.name} exceeded {self._max_series} series, "
+                    f"folding further label sets into '{_OVERFLOW_LABEL_VALUE}'"
+                )
+            values = overflow
+            child = self._children.get(values)
+            if child is not None:
+                return child
+
+        child = self._children[values] = self._new_child()
+        return child
+
+    def _default_child(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels, use labels() first")
+        return self._children[()]
+
+    @abstractmethod
+    def _new_child(self):
+        pass
+
+    @abstractmethod
+    def samples(self) -> Iterable[tuple[str, dict[str, str], float]]:
+        pass
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default_child().inc(amount)
+
+    def samples(self):
+        for values, child in list(self._children.items()):
+            yield f"{self.name}_total", dict(zip(self.labelnames, values)), child.value
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default_child().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default_child().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default_child().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._default_child().set_function(function)
+
+    def samples(self):
+        for values, child in list(self._children.items()):
+            yield self.name, dict(zip(self.labelnames, values)), child.read()
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+        max_series: int = DEFAULT_MAX_SERIES,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, max_series)
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default_child().observe(value)
+
+    def samples(self):
+        for values, child in list(self._children.items()):
+            labels = dict(zip(self.labelnames, values))
+            cumulative = 0
+            for bound, count in zip(
+                (*child.bucket_bounds, math.inf), child.bucket_counts
+            ):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket",
+                    {**labels, "le": _format_value(bound)},
+                    cumulative,
+                )
+            yield f"{self.name}_sum", labels, child.sum
+            yield f"{self.name}_count", labels, child.count
+
+
+class MetricsRegistry:
+    def __init__(self, namespace: str = ""):
+        self._namespace = namespace
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def _register(self, metric_type, name, documentation, labelnames, **options):
+        full_name = f"{self._namespace}_{name}" if self._namespace else name
+        existing = self._metrics.get(full_name)
+        if existing is not None:
+            if not isinstance(existing, metric_type):
+                raise ValueError(
+                    f"Metric {full_name} is already a {existing.type_name}"
+                )
+            return existing
+
+        metric = metric_type(full_name, documentation, labelnames, **options)
+        self._metrics[full_name] = metric
+        return metric
+
+    def render_prometheus(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(
+                    f"{sample_name}{_format_labels(labels)} {_format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(str(value))}"' for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def timed(histogram: HistogramChild) -> Callable:
+    def decorator(function: Callable) -> Callable:
+        if inspect.iscoroutinefunction(function):
+
+            @wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                started = perf_counter()
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    histogram.observe(perf_counter() - started)
+
+            return async_wrapper
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            started = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.observe(perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+class EventLoopLagMonitor(LoggingMixin):
+    def __init__(self, registry: "MetricsRegistry", interval_seconds: float = 0.5):
+        self._interval_seconds = interval_seconds
+        self._lag = registry.histogram(
+            "event_loop_lag_seconds",
+            "How late the event loop woke up a sleeping task",
+        )
+        self._last_lag = registry.gauge(
+            "event_loop_lag_last_seconds", "Most recently measured event loop lag"
+        )
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval_seconds
+            await asyncio.sleep(self._interval_seconds)
+            lag = max(0.0, loop.time() - expected)
+            self._lag.observe(lag)
+            self._last_lag.set(lag)
+
+
+metrics = MetricsRegistry(namespace="daylight_alarm")
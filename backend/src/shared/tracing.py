@@ -0,0 +1,240 @@
+import itertools
+import json
+import queue
+import threading
+from contextvars import ContextVar
+from pathlib import Path
+from time import time_ns
+from typing import Any, Protocol
+from uuid import UUID
+
+from backend.src.shared.logging import LoggingMixin
+
+_span_ids = itertools.count(1)
+
+
+class Span:
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "name",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(
+        self,
+        trace_id: str,
+        parent_id: int | None,
+        name: str,
+        attributes: dict[str, Any],
+    ):
+        self.trace_id = trace_id
+        self.span_id = next(_span_ids)
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.error: str | None = None
+        self.end_ns = 0
+        self.start_ns = time_ns()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": f"{self.span_id:016x}",
+            "parent_id": f"{self.parent_id:016x}" if self.parent_id else None,
+            "name": self.name,
+            "start_unix_nano": self.start_ns,
+            "duration_ms": (self.end_ns - self.start_ns) / 1_000_000,
+            "attributes": {k: v for k, v in self.attributes.items() if v is not None},
+            "error": self.error,
+        }
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class _SpanScope:
+    __slots__ = ("_span", "_exporter", "_token")
+
+    def __init__(self, span: Span, exporter: SpanExporter):
+        self._span = span
+        self._exporter = exporter
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self._span.end_ns = time_ns()
+        if exc_type is not None:
+            self._span.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self._exporter.export(self._span)
+
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        return None
+
+
+_NOOP_SCOPE = _NoopScope()
+
+
+class Tracer:
+    def __init__(self, exporter: SpanExporter | None = None, sample_rate: float = 0.0):
+        self.configure(exporter, sample_rate)
+
+    def configure(self, exporter: SpanExporter | None, sample_rate: float) -> None:
+        self._exporter = exporter
+        self._sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self._enabled = exporter is not None and self._sample_rate > 0
+
+    @property
+    def recording(self) -> bool:
+        return _current_span.get() is not None
+
+    def is_sampled(self, trace_id: UUID) -> bool:
+        # Decided by the alarm id, so every span of one alarm shares the verdict
+        if not self._enabled:
+            return False
+        if self._sample_rate >= 1.0:
+            return True
+        return (trace_id.int % 10_000) < self._sample_rate * 10_000
+
+    def start_trace(self, name: str, trace_id: UUID, **attributes: Any):
+        if not self.is_sampled(trace_id):
+            return _NOOP_SCOPE
+        parent = _current_span.get()
+        parent_id = (
+            parent.span_id if parent and parent.trace_id == str(trace_id) else None
+        )
+        return _SpanScope(
+            Span(str(trace_id), parent_id, name, attributes), self._exporter
+        )
+
+    def span(self, name: str, **attributes: Any):
+        # Only records inside a sampled trace; otherwise a shared no-op scope
+        parent = _current_span.get()
+        if parent is None:
+            return _NOOP_SCOPE
+        return _SpanScope(
+            Span(parent.trace_id, parent.span_id, name, attributes), self._exporter
+        )
+
+    def shutdown(self) -> None:
+        if self._exporter is not None:
+            self._exporter.shutdown()
+
+
+class JsonlSpanExporter(LoggingMixin):
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = 5 * 1024 * 1024,
+        backup_count: int = 3,
+        batch_size: int = 256,
+        flush_interval_seconds: float = 1.0,
+    ):
+        self._path = path
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._queue: queue.SimpleQueue[Span | None] = queue.SimpleQueue()
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        # The event loop only enqueues; encoding and file I/O run on the worker
+        if self._worker is None:
+            self._start_worker()
+        self._queue.put(span)
+
+    def shutdown(self) -> None:
+        worker = self._worker
+        if worker is None:
+            return
+        self._queue.put(None)
+        worker.join(timeout=5.0)
+        self._worker = None
+
+    def _start_worker(self) -> None:
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._worker = threading.Thread(
+                target=self._run, name="span-exporter", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            batch: list[Span] = []
+            try:
+                first = self._queue.get(timeout=self._flush_interval_seconds)
+            except queue.Empty:
+                continue
+
+            if first is None:
+                running = False
+            else:
+                batch.append(first)
+
+            while running and len(batch) < self._batch_size:
+                try:
+                    span = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if span is None:
+                    running = False
+                else:
+                    batch.append(span)
+
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: list[Span]) -> None:
+        lines = "".join(
+            json.dumps(span.to_dict(), default=str, separators=(",", ":")) + "\n"
+            for span in batch
+        )
+        try:
+            if self._path.exists() and self._path.stat().st_size >= self._max_bytes:
+                self._rotate()
+            with self._path.open("a", encoding="utf-8") as file:
+                file.write(lines)
+        except OSError as e:
+            self.logger.warning(f"Dropped {len(batch)} span(s): {e}")
+
+    def _rotate(self) -> None:
+        for index in range(self._backup_count - 1, 0, -1):
+            source = self._path.with_name(f"{self._path.name}.{index}")
+            if source.exists():
+                source.replace(self._path.with_name(f"{self._path.name}.{index + 1}"))
+        if self._backup_count > 0:
+            self._path.replace(self._path.with_name(f"{self._path.name}.1"))
+        else:
+            self._path.unlink()
+
+
+tracer = Tracer()
@@ -0,0 +1,160 @@
+import argparse
+import asyncio
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from backend.src.application.alarm_scheduler import AlarmScheduler
+from backend.src.application.event_dispatcher import EventDispatcher
+from backend.src.application.use_cases import (
+    ScheduleAlarmUseCase,
+    TriggerScheduledAlarmUseCase,
+)
+from backend.src.domain.easing import ease_linear
+from backend.src.domain.value_objects import EVERY_DAY, SoundProfileName
+from backend.src.infrastructure.audio import AudioPlayer
+from backend.src.infrastructure.event_handlers import (
+    AlarmAudioContextRegistry,
+    AudioOnAlarmCancelledHandler,
+    AudioOnAlarmCompletedHandler,
+    AudioOnAlarmStartedHandler,
+    WaitRequestedHandler,
+)
+from backend.src.infrastructure.sound_profiles import SoundProfileRepository
+from backend.src.infrastructure.virtual_time import VirtualClock, run_in_virtual_time
+from benchmarks.fakes import CommandLog, FakeAudioStrategy, LatencyProfile
+
+_ASSETS_DIR = Path(__file__).parent.parent / "assets"
+
+_DAY_SECONDS = 24 * 3600
+_WARMUP_WEEKS = 2
+
+
+async def soak(clock: VirtualClock, args: argparse.Namespace) -> list[tuple]:
+    rng = random.Random(args.seed)
+    log = CommandLog()
+    audio_player = AudioPlayer(
+        _ASSETS_DIR,
+        default_strategy=FakeAudioStrategy(LatencyProfile(), log=log, rng=rng),
+    )
+    contexts = AlarmAudioContextRegistry()
+    dispatcher = EventDispatcher(
+        [
+            WaitRequestedHandler(clock),
+            AudioOnAlarmStartedHandler(audio_player, contexts),
+            AudioOnAlarmCompletedHandler(audio_player, contexts),
+            AudioOnAlarmCancelledHandler(audio_player, contexts),
+        ]
+    )
+    scheduler = AlarmScheduler(clock)
+    schedule = ScheduleAlarmUseCase(dispatcher, scheduler, audio_handlers=[contexts])
+    profiles = SoundProfileRepository(_ASSETS_DIR)
+
+    async def create(name: str, weekdays: list[int]):
+        return await schedule.execute(
+            room_name=name,
+            hour=rng.randrange(24),
+            minute=rng.randrange(60),
+            duration_minutes=args.duration,
+            easing=ease_linear,
+            sound_profile=profiles.get(rng.choice(list(SoundProfileName))),
+            weekdays=weekdays,
+        )
+
+    for i in range(args.recurring):
+        mask = rng.randrange(1, EVERY_DAY + 1)
+        await create(f"Recurring {i}", [day for day in range(7) if mask >> day & 1])
+
+    runner = asyncio.create_task(
+        scheduler.run(TriggerScheduledAlarmUseCase(dispatcher).execute)
+    )
+
+    samples = []
+    for day in range(args.days):
+        # Daily churn: one-shot alarms, a quarter of them cancelled (terminal
+        # event) and a quarter deleted (no event, only the aggregate goes away)
+        for i in range(args.one_shots):
+            alarm = await create(f"Day {day} #{i}", [])
+            roll = rng.random()
+            if roll < 0.25:
+                alarm.cancel()
+                scheduler.unregister_alarm(alarm.id)
+                await dispatcher.dispatch_all(alarm.collect_events())
+            elif roll < 0.5:
+                scheduler.unregister_alarm(alarm.id)
+        del alarm
+
+        await clock.sleep(_DAY_SECONDS)
+
+        if (day + 1) % 7 == 0:
+            gc.collect()
+            current, _ = tracemalloc.get_traced_memory()
+            samples.append(
+                (day + 1, current, len(contexts), len(scheduler.get_active_alarms()))
+            )
+
+    runner.cancel()
+    await asyncio.gather(runner, return_exceptions=True)
+    print(f"{log.audio_commands} audio command(s) sent")
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Soak the audio handlers over simulated months of recurring and "
+            "one-shot alarms. Exits non-zero if memory or registries keep growing."
+        )
+    )
+    parser.add_argument("--days", type=int, default=120)
+    parser.add_argument("--recurring", type=int, default=20)
+    parser.add_argument("--one-shots", type=int, default=20, help="per day")
+    parser.add_argument("--duration", type=int, default=7, help="ramp minutes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--max-growth-kib",
+        type=float,
+        default=256.0,
+        help="allowed traced memory growth after the warm-up weeks",
+    )
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    samples = run_in_virtual_time(lambda clock: soak(clock, args), datetime(2026, 1, 5))
+    elapsed = time.perf_counter() - started
+    tracemalloc.stop()
+
+    print(f"Simulated {args.days} day(s) in {elapsed:.1f} s wall time")
+    print(f"{'day':>5} {'traced KiB':>11} {'audio contexts':>15} {'scheduled':>10}")
+    for day, current, contexts, scheduled in samples:
+        print(f"{day:>5} {current / 1024:>11.1f} {contexts:>15} {scheduled:>10}")
+
+    failures: list[str] = []
+    if len(samples) > _WARMUP_WEEKS:
+        baseline = samples[_WARMUP_WEEKS - 1][1]
+        growth_kib = (max(sample[1] for sample in samples) - baseline) / 1024
+        print(f"growth after warm-up: {growth_kib:.1f} KiB")
+        if growth_kib > args.max_growth_kib:
+            failures.append(
+                f"memory grew {growth_kib:.1f} KiB (budget {args.max_growth_kib})"
+            )
+
+    # Recurring alarms keep their entry; a day's one-shots may still be pending
+    bound = args.recurring + args.one_shots
+    if any(contexts > bound for _, _, contexts, _ in samples):
+        failures.append(f"audio contexts exceeded {bound}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import argparse
+import dataclasses
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from backend.src.domain.aggregates import SunriseAlarm
+from backend.src.domain.events import DomainEvent
+from backend.src.domain.value_objects import Duration, ScheduledTime, TransitionSteps
+
+# Retained bytes per event, batch lists included. On CPython 3.13 slotted
+# events sharing one EventTime per batch keep about 176 B, the unslotted
+# baseline about 213 B; a change that gives the saving back fails the run.
+_DEFAULT_BUDGET_BYTES_PER_EVENT = 200
+
+
+def _ramp(steps: int) -> SunriseAlarm:
+    alarm = SunriseAlarm(
+        room_name="Bench",
+        duration=Duration(minutes=60),
+        steps=TransitionSteps(count=steps),
+        scheduled_time=ScheduledTime(hour=7, minute=0),
+    )
+    alarm.trigger()
+    alarm.collect_events()
+    return alarm
+
+
+_unslotted_types: dict[type, tuple[type, tuple[str, ...]]] = {}
+
+
+def _unslotted(event: DomainEvent):
+    # The event as it was before slotting: a __dict__ per instance and its own
+    # datetime instead of the batch's shared EventTime
+    entry = _unslotted_types.get(type(event))
+    if entry is None:
+        fields = [
+            (field.name, field.type)
+            for field in dataclasses.fields(event)
+            if field.name != "time"
+        ]
+        unslotted_type = dataclasses.make_dataclass(
+            f"Unslotted{type(event).__name__}",
+            [*fields, ("occurred_at", datetime)],
+            frozen=True,
+        )
+        entry = _unslotted_types[type(event)] = (
+            unslotted_type,
+            tuple(name for name, _ in fields),
+        )
+
+    unslotted_type, names = entry
+    values = {name: getattr(event, name) for name in names}
+    return unslotted_type(**values, occurred_at=datetime.now())
+
+
+def _run(alarm: SunriseAlarm, retained: list | None, baseline: bool = False) -> int:
+    # Same shape as TriggerScheduledAlarmUseCase: one step, one batch
+    events = 0
+    while not alarm.is_finished:
+        alarm.progress_step()
+        batch = alarm.collect_events()
+        if baseline:
+            batch = [_unslotted(event) for event in batch]
+        events += len(batch)
+        if retained is not None:
+            retained.append(batch)
+    return events
+
+
+def retained_bytes(steps: int, baseline: bool = False) -> tuple[int, int, int]:
+    # What a consumer that keeps every event (e.g. a recorder) pays per step
+    alarm = _ramp(steps)
+    retained: list = []
+    if baseline:
+        # Builds the unslotted types outside the measurement
+        _run(_ramp(1), None, baseline)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    events = _run(alarm, retained, baseline)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    return events, size, blocks
+
+
+def transient_peak(steps: int) -> int:
+    # Events dropped after each batch, as the dispatcher does
+    alarm = _ramp(steps)
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    _run(alarm, None)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - baseline
+
+
+def step_time(steps: int, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        alarm = _ramp(steps)
+        started = time.perf_counter()
+        _run(alarm, None)
+        best = min(best, time.perf_counter() - started)
+    return best / steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Memory allocated by domain events over one long sunrise ramp"
+    )
+    parser.add_argument("--steps", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=_DEFAULT_BUDGET_BYTES_PER_EVENT,
+        help="retained bytes per event",
+    )
+    args = parser.parse_args()
+
+    events, size, blocks = retained_bytes(args.steps)
+    _, baseline_size, baseline_blocks = retained_bytes(args.steps, baseline=True)
+    print(f"{args.steps} steps, {events} events")
+    print(f"{'retained':<12}{'B/event':>10}{'blocks/event':>14}")
+    for label, label_size, label_blocks in (
+        ("unslotted", baseline_size, baseline_blocks),
+        ("slotted", size, blocks),
+    ):
+        print(f"{label:<12}{label_size / events:>10.0f}{label_blocks / events:>14.2f}")
+    print(f"saved: {1 - size / baseline_size:.0%} of the unslotted baseline")
+    print(f"transient peak: {transient_peak(args.steps) / 1024:.1f} KiB")
+    print(f"step + collect: {step_time(args.steps, args.repeats) * 1e6:.2f} us/step")
+
+    per_event = size / events
+    if per_event > args.budget:
+        print(f"FAIL: {per_event:.0f} B/event exceeds the {args.budget:.0f} B budget")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import asyncio
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from backend.src.domain.value_objects import AudioFile, Brightness
+from backend.src.infrastructure.audio.ports import AudioPlayerStrategy
+
+
+class SimulatedFailure(ConnectionError):
+    pass
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    # Log-normal by default: most calls are quick, a few are very slow, which
+    # is what bridge and SoCo round-trips look like over Wi-Fi.
+    median_ms: float = 0.0
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+    distribution: str = "lognormal"
+
+    def sample_seconds(self, rng: random.Random) -> float:
+        if self.median_ms <= 0:
+            return 0.0
+        if self.distribution == "fixed" or self.jitter <= 0:
+            return self.median_ms / 1000
+        if self.distribution == "uniform":
+            spread = self.median_ms * self.jitter
+            return max(0.0, rng.uniform(-spread, spread) + self.median_ms) / 1000
+        return rng.lognormvariate(0.0, self.jitter) * self.median_ms / 1000
+
+    def fails(self, rng: random.Random) -> bool:
+        return self.failure_rate > 0 and rng.random() < self.failure_rate
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyProfile":
+        # "median_ms[:jitter[:failure_rate[:distribution]]]", e.g. "40:0.5:0.01"
+        parts = spec.split(":")
+        return cls(
+            median_ms=float(parts[0]) if parts[0] else 0.0,
+            jitter=float(parts[1]) if len(parts) > 1 else 0.0,
+            failure_rate=float(parts[2]) if len(parts) > 2 else 0.0,
+            distribution=parts[3] if len(parts) > 3 else "lognormal",
+        )
+
+
+@dataclass
+class CommandLog:
+    # room -> loop.time() at which each set_brightness call was issued
+    brightness_issued_at: dict[str, list[float]] = field(default_factory=dict)
+    scenes_activated: int = 0
+    brightness_commands: int = 0
+    audio_commands: int = 0
+    failures: int = 0
+
+    @property
+    def commands_sent(self) -> int:
+        return self.scenes_activated + self.brightness_commands + self.audio_commands
+
+
+class FakeRoomService:
+    def __init__(
+        self,
+        latency: LatencyProfile,
+        log: CommandLog | None = None,
+        rng: random.Random | None = None,
+    ):
+        self.latency = latency
+        self.log = log if log is not None else CommandLog()
+        self._rng = rng or random.Random()
+
+    async def activate_scene(self, room_name: str, scene_name: str) -> None:
+        self.log.scenes_activated += 1
+        await self._round_trip()
+
+    async def set_brightness(self, room_name: str, brightness: Brightness) -> None:
+        issued_at = asyncio.get_running_loop().time()
+        self.log.brightness_issued_at.setdefault(room_name, []).append(issued_at)
+        self.log.brightness_commands += 1
+        await self._round_trip()
+
+    async def _round_trip(self) -> None:
+        await asyncio.sleep(self.latency.sample_seconds(self._rng))
+        if self.latency.fails(self._rng):
+            self.log.failures += 1
+            raise SimulatedFailure("Simulated bridge failure")
+
+
+class FakeAudioStrategy(AudioPlayerStrategy):
+    def __init__(
+        self,
+        latency: LatencyProfile,
+        playback_seconds: float = 0.0,
+        log: CommandLog | None = None,
+        rng: random.Random | None = None,
+        sounds_directory: Path = Path("assets"),
+    ):
+        super().__init__(sounds_directory)
+        self.latency = latency
+        self.playback_seconds = playback_seconds
+        self.log = log if log is not None else CommandLog()
+        self._rng = rng or random.Random()
+
+    async def play(self, audio_file: AudioFile) -> None:
+        # Mirrors PygameStrategy, which only returns once playback has ended
+        self.log.audio_commands += 1
+        await self._round_trip()
+        await asyncio.sleep(self.playback_seconds)
+
+    async def stop(self) -> None:
+        self.log.audio_commands += 1
+        await self._round_trip()
+
+    async def set_volume(self, volume: int) -> None:
+        self.log.audio_commands += 1
+        await self._round_trip()
+
+    def _resolve_audio_file(self, relative_path) -> AudioFile:
+        # Nothing is played, so the file does not have to exist
+        return relative_path
+
+    async def _round_trip(self) -> None:
+        await asyncio.sleep(self.latency.sample_seconds(self._rng))
+        if self.latency.fails(self._rng):
+            self.log.failures += 1
+            raise SimulatedFailure("Simulated speaker failure")
@@ -0,0 +1,398 @@
+import argparse
+import asyncio
+import gc
+import json
+import random
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from backend.src.application.alarm_scheduler import AlarmScheduler
+from backend.src.application.event_dispatcher import EventDispatcher
+from backend.src.application.use_cases import (
+    ScheduleAlarmUseCase,
+    TriggerScheduledAlarmUseCase,
+)
+from backend.src.domain.aggregates import SunriseAlarm
+from backend.src.domain.clock import Clock, system_clock
+from backend.src.domain.easing import EasingCurve, easing_registry
+from backend.src.domain.value_objects import SoundProfileName
+from backend.src.infrastructure.audio import AudioPlayer
+from backend.src.infrastructure.event_handlers import (
+    AlarmAudioContextRegistry,
+    AlarmStartedHandler,
+    AudioOnAlarmCancelledHandler,
+    AudioOnAlarmCompletedHandler,
+    AudioOnAlarmStartedHandler,
+    BrightnessChangeRequestedHandler,
+    WaitRequestedHandler,
+)
+from backend.src.infrastructure.sound_profiles import SoundProfileRepository
+from backend.src.infrastructure.virtual_time import VirtualClock, VirtualTimeEventLoop
+from benchmarks.fakes import (
+    CommandLog,
+    FakeAudioStrategy,
+    FakeRoomService,
+    LatencyProfile,
+)
+from benchmarks.ramp_timing import _percentiles, _probe_loop_lag
+
+_ASSETS_DIR = Path(__file__).parent.parent / "assets"
+
+_DEFAULT_EASINGS = (
+    "linear,ease_in_cubic,ease_out_cubic,gamma:2.2,cubic_bezier:0.42:0:0.58:1"
+)
+
+
+@dataclass(frozen=True)
+class FleetConfig:
+    alarms: int
+    durations: tuple[int, ...]
+    steps: tuple[int, ...]
+    easings: tuple[str, ...]
+    spread_minutes: int
+    hue_latency: LatencyProfile
+    audio_latency: LatencyProfile
+    with_sound: bool
+    real_time: bool
+    seed: int
+    lag_probe_interval: float = 0.01
+
+
+class _BusyPeriodLoop(VirtualTimeEventLoop):
+    # In virtual time the clock stands still while callbacks run, so lag can
+    # not be probed. What can be measured is how long the loop stays busy
+    # before it goes idle: in real time, a timer falling due at the start of
+    # such a stretch fires that much late.
+    def __init__(self):
+        super().__init__()
+        self.busy_ms: list[float] = []
+        self._idle_at = time.perf_counter()
+
+    def advance(self, seconds: float) -> None:
+        self.busy_ms.append((time.perf_counter() - self._idle_at) * 1000)
+        super().advance(seconds)
+        self._idle_at = time.perf_counter()
+
+
+def _parse_ints(spec: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in spec.split(","))
+
+
+def _parse_easing(spec: str) -> EasingCurve:
+    # "gamma:2.2" -> easing_registry.curve("gamma", 2.2)
+    easing_id, *params = spec.split(":")
+    return easing_registry.curve(easing_id, *(float(param) for param in params))
+
+
+async def run_fleet(config: FleetConfig, clock: Clock) -> dict:
+    loop = asyncio.get_running_loop()
+    rng = random.Random(config.seed)
+    log = CommandLog()
+    tracing_memory = tracemalloc.is_tracing()
+    if tracing_memory:
+        gc.collect()
+        memory_baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+    room_service = FakeRoomService(config.hue_latency, log, rng)
+    audio_player = AudioPlayer(
+        _ASSETS_DIR,
+        default_strategy=FakeAudioStrategy(
+            config.audio_latency, 0.0, log, rng, _ASSETS_DIR
+        ),
+    )
+    audio_contexts = AlarmAudioContextRegistry()
+    dispatcher = EventDispatcher(
+        [
+            AlarmStartedHandler(room_service),
+            BrightnessChangeRequestedHandler(room_service),
+            WaitRequestedHandler(clock),
+            AudioOnAlarmStartedHandler(audio_player, audio_contexts),
+            AudioOnAlarmCompletedHandler(audio_player, audio_contexts),
+            AudioOnAlarmCancelledHandler(audio_player, audio_contexts),
+        ]
+    )
+    scheduler = AlarmScheduler(clock)
+    schedule = ScheduleAlarmUseCase(
+        dispatcher, scheduler, audio_handlers=[audio_contexts]
+    )
+    trigger = TriggerScheduledAlarmUseCase(dispatcher)
+
+    profiles = SoundProfileRepository(_ASSETS_DIR)
+    easings = [_parse_easing(spec) for spec in config.easings]
+
+    # Everything fires from the next full minute on, spread over whole minutes
+    now = clock.now()
+    first_fire = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    expected_start: dict[str, float] = {}
+    alarms: list[SunriseAlarm] = []
+    for i in range(config.alarms):
+        fire_at = first_fire + timedelta(
+            minutes=rng.randrange(config.spread_minutes + 1)
+        )
+        alarm = await schedule.execute(
+            room_name=f"Room {i}",
+            hour=fire_at.hour,
+            minute=fire_at.minute,
+            duration_minutes=rng.choice(config.durations),
+            easing=rng.choice(easings),
+            sound_profile=(
+                profiles.get(rng.choice(list(SoundProfileName)))
+                if config.with_sound
+                else None
+            ),
+            steps=rng.choice(config.steps),
+        )
+        fires_in = alarm.next_fire_at(now) - now.astimezone(UTC)
+        expected_start[alarm.room_name] = loop.time() + fires_in.total_seconds()
+        alarms.append(alarm)
+
+    if tracing_memory:
+        gc.collect()
+        memory_scheduled, _ = tracemalloc.get_traced_memory()
+
+    finished = asyncio.Event()
+    errors: dict[str, int] = {}
+    pending = len(alarms)
+    # Measured from the first fire on, so the wait for it does not count
+    started: tuple[float, float] | None = None
+
+    async def on_due(alarm: SunriseAlarm) -> None:
+        nonlocal pending, started
+        if started is None:
+            started = (time.perf_counter(), time.process_time())
+        try:
+            await trigger.execute(alarm)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            errors[error] = errors.get(error, 0) + 1
+        pending -= 1
+        if pending == 0:
+            finished.set()
+
+    # A probe in virtual time would wake up for every simulated 10 ms and cost
+    # more than the ramps themselves
+    lag_samples: list[float] = []
+    background = [asyncio.create_task(scheduler.run(on_due))]
+    if config.real_time:
+        background.append(
+            asyncio.create_task(_probe_loop_lag(config.lag_probe_interval, lag_samples))
+        )
+    await finished.wait()
+    wall_seconds = time.perf_counter() - started[0]
+    cpu_seconds = time.process_time() - started[1]
+    if tracing_memory:
+        _, memory_peak = tracemalloc.get_traced_memory()
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+
+    lateness_ms: list[float] = []
+    for alarm in alarms:
+        started_at = expected_start[alarm.room_name]
+        step_seconds = alarm.duration.seconds / alarm.steps.count
+        issued = log.brightness_issued_at.get(alarm.room_name, [])
+        lateness_ms.extend(
+            (issued_at - (started_at + step * step_seconds)) * 1000
+            for step, issued_at in enumerate(issued)
+        )
+
+    results = {
+        "ramps_completed": len(alarms) - sum(errors.values()),
+        "errors": errors,
+        "steps": log.brightness_commands,
+        # Step rate the fleet asks for while every ramp is running at once
+        "offered_steps_per_second": sum(
+            alarm.steps.count / alarm.duration.seconds for alarm in alarms
+        ),
+        "step_lateness_ms": _percentiles(lateness_ms),
+        "wall_seconds": wall_seconds,
+        "cpu_seconds": cpu_seconds,
+    }
+    if isinstance(loop, _BusyPeriodLoop):
+        results["loop_busy_ms"] = _percentiles(loop.busy_ms)
+    else:
+        results["event_loop_lag_ms"] = _percentiles(lag_samples)
+    if tracing_memory:
+        results["scheduled_bytes"] = memory_scheduled - memory_baseline
+        results["peak_bytes"] = memory_peak - memory_baseline
+    return results
+
+
+def _run_once(config: FleetConfig) -> dict:
+    if config.real_time:
+        return asyncio.run(run_fleet(config, system_clock))
+
+    # Starting just before a minute boundary keeps the wait for it short
+    with asyncio.Runner(loop_factory=_BusyPeriodLoop) as runner:
+        clock = VirtualClock(runner.get_loop(), datetime(2026, 1, 5, 6, 59, 55))
+        return runner.run(run_fleet(config, clock))
+
+
+def run(config: FleetConfig, measure_memory: bool) -> dict:
+    results = _run_once(config)
+    if measure_memory:
+        # Separate pass: tracemalloc slows everything down several times, which
+        # would spoil the CPU and lag figures of the timed pass
+        tracemalloc.start()
+        try:
+            traced = _run_once(config)
+        finally:
+            tracemalloc.stop()
+        results["scheduled_bytes"] = traced["scheduled_bytes"]
+        results["peak_bytes"] = traced["peak_bytes"]
+
+    results["steps_per_second"] = results["steps"] / results["wall_seconds"]
+    results["cpu_us_per_step"] = results["cpu_seconds"] / results["steps"] * 1e6
+    results["cpu_ms_per_alarm"] = results["cpu_seconds"] / config.alarms * 1000
+    if not config.real_time:
+        # Virtual time only costs CPU, so the measured rate is what one core
+        # can sustain; above 1.0 the same load would run late in real time
+        results["load"] = (
+            results["offered_steps_per_second"] / results["steps_per_second"]
+        )
+    return results
+
+
+def _print_table(sweep: list[tuple[int, dict]], real_time: bool) -> None:
+    lag_key = "event_loop_lag_ms" if real_time else "loop_busy_ms"
+    print(
+        f"{'alarms':>7} {'steps/s':>10} {'offered':>9} {'load':>6} "
+        f"{'cpu us/step':>12} {'cpu ms/alarm':>13} {'KiB/alarm':>10} "
+        f"{'peak KiB/alarm':>15} {'lag p99 ms':>11} {'lag max ms':>11} "
+        f"{'late p99 ms':>12} {'failed':>7}"
+    )
+    for alarms, results in sweep:
+        lag = results[lag_key]
+        memory = (
+            f"{results['scheduled_bytes'] / alarms / 1024:>10.2f} "
+            f"{results['peak_bytes'] / alarms / 1024:>15.2f}"
+            if "peak_bytes" in results
+            else f"{'-':>10} {'-':>15}"
+        )
+        load = f"{results['load']:>6.2f}" if "load" in results else f"{'-':>6}"
+        print(
+            f"{alarms:>7} {results['steps_per_second']:>10.0f} "
+            f"{results['offered_steps_per_second']:>9.1f} {load} "
+            f"{results['cpu_us_per_step']:>12.1f} "
+            f"{results['cpu_ms_per_alarm']:>13.2f} {memory} "
+            f"{lag.get('p99', 0.0):>11.2f} {lag.get('max', 0.0):>11.2f} "
+            f"{results['step_lateness_ms'].get('p99', 0.0):>12.1f} "
+            f"{alarms - results['ramps_completed']:>7}"
+        )
+        for error, count in results["errors"].items():
+            print(f"        {count} x {error}")
+
+
+def _estimate_capacity(sweep: list[tuple[int, dict]]) -> None:
+    # Per-step cost grows with the fleet (more timers, bigger heaps), so the
+    # largest run gives the most conservative figure
+    alarms, results = max(sweep, key=lambda entry: entry[0])
+    offered_per_alarm = results["offered_steps_per_second"] / alarms
+    capacity = results["steps_per_second"] / offered_per_alarm
+    print(
+        f"estimated capacity: ~{capacity:.0f} concurrent ramp(s) per core at "
+        f"{offered_per_alarm:.3f} steps/s each (from the {alarms}-alarm run)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Drive a fleet of concurrent sunrise ramps through the scheduler, "
+            "use cases and dispatcher against fake Hue and audio backends. "
+            "Runs in virtual time unless --real-time is given, in which case "
+            "every run waits for the next full minute and lasts as long as "
+            "its longest ramp."
+        )
+    )
+    parser.add_argument(
+        "--alarms",
+        type=_parse_ints,
+        default=(100, 250, 500, 1000),
+        help="comma-separated fleet sizes to sweep",
+    )
+    parser.add_argument(
+        "--durations", type=_parse_ints, default=(7, 15, 30), help="ramp minutes"
+    )
+    parser.add_argument("--steps", type=_parse_ints, default=(70, 100, 300))
+    parser.add_argument(
+        "--easings",
+        default=_DEFAULT_EASINGS,
+        help="comma-separated easing ids, parameters after colons",
+    )
+    parser.add_argument(
+        "--spread-minutes",
+        type=int,
+        default=0,
+        help="spread fire times over this many minutes (0: all at once)",
+    )
+    parser.add_argument(
+        "--hue-latency",
+        type=LatencyProfile.parse,
+        default=LatencyProfile(median_ms=40, jitter=0.5),
+        help="median_ms[:jitter[:failure_rate[:lognormal|uniform|fixed]]]",
+    )
+    parser.add_argument(
+        "--audio-latency",
+        type=LatencyProfile.parse,
+        default=LatencyProfile(median_ms=120, jitter=0.5),
+        help="same format as --hue-latency",
+    )
+    parser.add_argument("--with-sound", action="store_true")
+    parser.add_argument("--real-time", action="store_true")
+    parser.add_argument(
+        "--memory",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="repeat each run under tracemalloc to measure memory per alarm",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output", type=Path, default=None, help="also write the sweep as JSON"
+    )
+    args = parser.parse_args()
+
+    easings = tuple(args.easings.split(","))
+    for spec in easings:
+        _parse_easing(spec)
+
+    sweep: list[tuple[int, dict]] = []
+    for alarms in args.alarms:
+        config = FleetConfig(
+            alarms=alarms,
+            durations=args.durations,
+            steps=args.steps,
+            easings=easings,
+            spread_minutes=args.spread_minutes,
+            hue_latency=args.hue_latency,
+            audio_latency=args.audio_latency,
+            with_sound=args.with_sound,
+            real_time=args.real_time,
+            seed=args.seed,
+        )
+        print(f"Running {alarms} alarm(s)...", flush=True)
+        sweep.append((alarms, run(config, args.memory)))
+
+    _print_table(sweep, args.real_time)
+    if not args.real_time:
+        _estimate_capacity(sweep)
+
+    if args.output is not None:
+        report = {
+            "benchmark": "fleet_simulation",
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "config": {**asdict(config), "alarms": list(args.alarms)},
+            "sweep": [
+                {"alarms": alarms, "results": results} for alarms, results in sweep
+            ],
+        }
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).parent.parent
+
+# Only needed once the app starts up, an alarm plays sound or talks to the
+# bridge; importing any of them from backend.main is a startup regression.
+_DEFERRED_MODULES = (
+    "pygame",
+    "soco",
+    "hypercorn",
+    "hueify",
+    "dotenv",
+    "aiosqlite",
+    "sqlmodel",
+    "sqlalchemy",
+)
+
+_PROBE = """
+import sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(elapsed)
+print(",".join(name for name in {deferred!r} if name in sys.modules))
+"""
+
+
+def _run_probe(module: str, importtime: bool) -> subprocess.CompletedProcess:
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", _PROBE.format(module=module, deferred=_DEFERRED_MODULES)]
+
+    env = {**os.environ, "PYTHONPATH": str(_REPO_ROOT)}
+    return subprocess.run(
+        command, capture_output=True, text=True, check=True, cwd=_REPO_ROOT, env=env
+    )
+
+
+def measure(module: str, runs: int) -> tuple[float, list[str]]:
+    # Fresh interpreters, best of N: the minimum is the least noisy estimate
+    timings: list[float] = []
+    loaded: list[str] = []
+    for _ in range(runs):
+        elapsed, modules = _run_probe(module, importtime=False).stdout.splitlines()
+        timings.append(float(elapsed))
+        loaded = [name for name in modules.split(",") if name]
+    return min(timings), loaded
+
+
+def slowest_imports(module: str, limit: int) -> list[tuple[int, str]]:
+    stderr = _run_probe(module, importtime=True).stderr
+    cumulative: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.removeprefix("import time:").split("|")
+        name = name.strip()
+        cumulative[name] = max(cumulative.get(name, 0), int(cumulative_us))
+    return sorted(((us, name) for name, us in cumulative.items()), reverse=True)[:limit]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Cold import time of the API and which heavy integrations it loads. "
+            "Exits non-zero when a deferred module is imported, or when over "
+            "--budget if one is given."
+        )
+    )
+    parser.add_argument("--module", default="backend.main")
+    # FastAPI alone takes about half a second to import and timings on shared
+    # hosts swing by a few hundred milliseconds, so by default the time is only
+    # reported and the deferred-module check is the guard
+    parser.add_argument("--budget", type=float, default=None, help="seconds")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    best, loaded = measure(args.module, args.runs)
+    print(f"import {args.module}: best of {args.runs} = {best * 1000:.0f} ms")
+    print("Slowest imports (cumulative, -X importtime inflates these):")
+    for cumulative_us, name in slowest_imports(args.module, args.top):
+        print(f"  {cumulative_us / 1000:>8.1f} ms  {name}")
+
+    failures: list[str] = []
+    if args.budget is not None and best > args.budget:
+        failures.append(f"{best:.3f}s exceeds the {args.budget:.3f}s budget")
+    if loaded:
+        failures.append(f"deferred module(s) imported eagerly: {', '.join(loaded)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
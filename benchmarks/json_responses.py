@@ -0,0 +1,126 @@
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from backend.serialization import FastJSONResponse, orjson
+from backend.src.domain.value_objects import AlarmStatus
+from backend.src.infrastructure.audio import RegisteredSound
+from backend.src.infrastructure.persistence.read_models import AlarmPage, AlarmSummary
+
+# The payloads are built in memory so the numbers isolate response encoding
+# from SQLite; both apps serve exactly the same objects.
+
+
+def _build_page(alarm_count: int) -> AlarmPage:
+    now = datetime.now().replace(microsecond=0)
+    return AlarmPage(
+        alarms=[
+            AlarmSummary(
+                id=uuid4(),
+                name=f"Alarm {i}",
+                room_name=f"Room {i % 5}",
+                scene_name="Tageslichtwecker",
+                status=AlarmStatus.SCHEDULED,
+                scheduled_hour=i % 24,
+                scheduled_minute=i % 60,
+                next_fire_at=now + timedelta(minutes=i),
+                created_at=now,
+            )
+            for i in range(alarm_count)
+        ],
+        next_cursor="MjAyNi0xMC0xOVQwNzowMDowMHw",
+    )
+
+
+def _build_sounds(sound_count: int) -> list[RegisteredSound]:
+    return [
+        RegisteredSound(
+            name=f"sound-{i}",
+            relative_path=f"wake_up_sounds/sound-{i}.mp3",
+            category="wake_up_sounds",
+        )
+        for i in range(sound_count)
+    ]
+
+
+def _default_app(page: AlarmPage, sounds: list[RegisteredSound]) -> FastAPI:
+    app = FastAPI(default_response_class=JSONResponse)
+
+    @app.get("/alarms", response_model=AlarmPage)
+    async def list_alarms() -> AlarmPage:
+        return page
+
+    @app.get("/sounds", response_model=list[RegisteredSound])
+    def list_sounds() -> list[RegisteredSound]:
+        return sounds
+
+    return app
+
+
+def _fast_app(page: AlarmPage, sounds: list[RegisteredSound]) -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get("/alarms", response_model=AlarmPage)
+    async def list_alarms() -> FastJSONResponse:
+        return FastJSONResponse(page)
+
+    @app.get("/sounds", response_model=list[RegisteredSound])
+    def list_sounds() -> FastJSONResponse:
+        return FastJSONResponse(sounds)
+
+    return app
+
+
+async def _requests_per_second(app: FastAPI, path: str, seconds: float) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        (await c.get(path)).raise_for_status()
+
+        count = 0
+        started = time.perf_counter()
+        while (elapsed := time.perf_counter() - started) < seconds:
+            (await c.get(path)).raise_for_status()
+            count += 1
+    return count / elapsed
+
+
+async def run(alarm_count: int, sound_count: int, seconds: float) -> None:
+    page = _build_page(alarm_count)
+    sounds = _build_sounds(sound_count)
+    apps = {"default": _default_app(page, sounds), "fast": _fast_app(page, sounds)}
+
+    encoder = "orjson" if orjson is not None else "pydantic_core"
+    print(f"{alarm_count} alarms, {sound_count} sounds, encoder: {encoder}")
+
+    for path in ("/alarms", "/sounds"):
+        results = {
+            label: await _requests_per_second(app, path, seconds)
+            for label, app in apps.items()
+        }
+        print(
+            f"{path:<8} "
+            + "  ".join(f"{label}={rps:>8.1f} req/s" for label, rps in results.items())
+            + f"  speedup x{results['fast'] / results['default']:.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="List endpoint requests/s: FastAPI default vs FastJSONResponse"
+    )
+    parser.add_argument("--alarms", type=int, default=200)
+    parser.add_argument("--sounds", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.alarms, args.sounds, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+from backend.src.application.event_dispatcher import EventDispatcher
+from backend.src.application.use_cases import TriggerScheduledAlarmUseCase
+from backend.src.domain.aggregates import SunriseAlarm
+from backend.src.domain.clock import Clock, system_clock
+from backend.src.domain.value_objects import (
+    Duration,
+    ScheduledTime,
+    SoundProfileName,
+    TransitionSteps,
+)
+from backend.src.infrastructure.audio import AudioPlayer
+from backend.src.infrastructure.event_handlers import (
+    AlarmAudioContextRegistry,
+    AlarmStartedHandler,
+    AudioOnAlarmCancelledHandler,
+    AudioOnAlarmCompletedHandler,
+    AudioOnAlarmStartedHandler,
+    BrightnessChangeRequestedHandler,
+    WaitRequestedHandler,
+)
+from backend.src.infrastructure.sound_profiles import SoundProfileRepository
+from backend.src.infrastructure.virtual_time import run_in_virtual_time
+from backend.src.shared.tracing import JsonlSpanExporter, tracer
+from benchmarks.fakes import (
+    CommandLog,
+    FakeAudioStrategy,
+    FakeRoomService,
+    LatencyProfile,
+)
+
+_ASSETS_DIR = Path(__file__).parent.parent / "assets"
+
+
+@dataclass(frozen=True)
+class RampTimingConfig:
+    ramps: int
+    duration_minutes: int
+    steps: int
+    hue_latency: LatencyProfile
+    audio_latency: LatencyProfile
+    playback_seconds: float
+    with_sound: bool
+    real_time: bool
+    seed: int
+    lag_probe_interval: float = 0.01
+    trace_file: str | None = None
+
+
+@dataclass
+class _RampOutcome:
+    room_name: str
+    started_at: float
+    finished_at: float | None = None
+    error: str | None = None
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+    return {
+        "count": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": cuts[49],
+        "p90": cuts[89],
+        "p99": cuts[98],
+        "max": ordered[-1],
+    }
+
+
+async def _probe_loop_lag(interval: float, samples: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append((loop.time() - expected) * 1000)
+
+
+async def run_ramps(config: RampTimingConfig, clock: Clock) -> dict:
+    loop = asyncio.get_running_loop()
+    rng = random.Random(config.seed)
+    log = CommandLog()
+
+    room_service = FakeRoomService(config.hue_latency, log, rng)
+    audio_player = AudioPlayer(
+        _ASSETS_DIR,
+        default_strategy=FakeAudioStrategy(
+            config.audio_latency, config.playback_seconds, log, rng, _ASSETS_DIR
+        ),
+    )
+    audio_contexts = AlarmAudioContextRegistry()
+    dispatcher = EventDispatcher(
+        [
+            AlarmStartedHandler(room_service),
+            BrightnessChangeRequestedHandler(room_service),
+            WaitRequestedHandler(clock),
+            AudioOnAlarmStartedHandler(audio_player, audio_contexts),
+            AudioOnAlarmCompletedHandler(audio_player, audio_contexts),
+            AudioOnAlarmCancelledHandler(audio_player, audio_contexts),
+        ]
+    )
+    use_case = TriggerScheduledAlarmUseCase(dispatcher)
+
+    sound_profile = (
+        SoundProfileRepository(_ASSETS_DIR).get(SoundProfileName.PEACEFUL)
+        if config.with_sound
+        else None
+    )
+    now = clock.now()
+    alarms = [
+        SunriseAlarm(
+            room_name=f"Room {i}",
+            duration=Duration(minutes=config.duration_minutes),
+            steps=TransitionSteps(count=config.steps),
+            sound_profile=sound_profile,
+            scheduled_time=ScheduledTime(hour=now.hour, minute=now.minute),
+            clock=clock,
+        )
+        for i in range(config.ramps)
+    ]
+    for alarm in alarms:
+        audio_contexts.register_alarm(alarm)
+
+    async def run_ramp(alarm: SunriseAlarm) -> _RampOutcome:
+        outcome = _RampOutcome(alarm.room_name, started_at=loop.time())
+        try:
+            await use_case.execute(alarm)
+            outcome.finished_at = loop.time()
+        except Exception as e:
+            outcome.error = f"{type(e).__name__}: {e}"
+        return outcome
+
+    lag_samples: list[float] = []
+    probe = asyncio.create_task(_probe_loop_lag(config.lag_probe_interval, lag_samples))
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    outcomes = await asyncio.gather(*(run_ramp(alarm) for alarm in alarms))
+    wall_seconds = time.perf_counter() - wall_started
+    cpu_seconds = time.process_time() - cpu_started
+    probe.cancel()
+
+    expected_seconds = config.duration_minutes * 60
+    step_seconds = expected_seconds / config.steps
+    lateness_ms: list[float] = []
+    for outcome in outcomes:
+        issued = log.brightness_issued_at.get(outcome.room_name, [])
+        lateness_ms.extend(
+            (issued_at - (outcome.started_at + step * step_seconds)) * 1000
+            for step, issued_at in enumerate(issued)
+        )
+
+    completed = [outcome for outcome in outcomes if outcome.error is None]
+    drift_seconds = [
+        outcome.finished_at - outcome.started_at - expected_seconds
+        for outcome in completed
+    ]
+    errors: dict[str, int] = {}
+    for outcome in outcomes:
+        if outcome.error is not None:
+            errors[outcome.error] = errors.get(outcome.error, 0) + 1
+
+    return {
+        "ramps_completed": len(completed),
+        "ramps_failed": len(outcomes) - len(completed),
+        "errors": errors,
+        "step_lateness_ms": _percentiles(lateness_ms),
+        "total_drift_seconds": _percentiles(drift_seconds),
+        "commands": {
+            "sent": log.commands_sent,
+            "scenes_activated": log.scenes_activated,
+            "brightness": log.brightness_commands,
+            "audio": log.audio_commands,
+            "failures": log.failures,
+        },
+        "event_loop_lag_ms": _percentiles(lag_samples),
+        "wall_seconds": wall_seconds,
+        "cpu_seconds": cpu_seconds,
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(config: RampTimingConfig) -> dict:
+    if config.trace_file is not None:
+        tracer.configure(JsonlSpanExporter(Path(config.trace_file)), sample_rate=1.0)
+
+    if config.real_time:
+        results = asyncio.run(run_ramps(config, system_clock))
+    else:
+        results = run_in_virtual_time(
+            lambda clock: run_ramps(config, clock), datetime.now()
+        )
+    tracer.shutdown()
+
+    return {
+        "benchmark": "ramp_timing",
+        "revision": _git_revision(),
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        "config": asdict(config),
+        "results": results,
+    }
+
+
+def _print_summary(report: dict) -> None:
+    results = report["results"]
+    print(
+        f"{results['ramps_completed']} ramp(s) completed, "
+        f"{results['ramps_failed']} failed, "
+        f"{results['commands']['sent']} command(s) sent"
+    )
+    for key in ("step_lateness_ms", "total_drift_seconds", "event_loop_lag_ms"):
+        stats = results[key]
+        if stats["count"]:
+            print(
+                f"  {key:<20} p50={stats['p50']:>9.2f}  p90={stats['p90']:>9.2f}  "
+                f"p99={stats['p99']:>9.2f}  max={stats['max']:>9.2f}"
+            )
+    for error, count in results["errors"].items():
+        print(f"  {count} x {error}")
+    print(f"  wall={results['wall_seconds']:.2f}s  cpu={results['cpu_seconds']:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Ramp timing accuracy against fake Hue and audio backends. Runs in "
+            "virtual time unless --real-time is given; event-loop lag is only "
+            "meaningful in real time."
+        )
+    )
+    parser.add_argument("--ramps", type=int, default=20)
+    parser.add_argument("--duration", type=int, default=7, help="ramp minutes")
+    parser.add_argument("--steps", type=int, default=70)
+    parser.add_argument(
+        "--hue-latency",
+        type=LatencyProfile.parse,
+        default=LatencyProfile(median_ms=40, jitter=0.5),
+        help="median_ms[:jitter[:failure_rate[:lognormal|uniform|fixed]]]",
+    )
+    parser.add_argument(
+        "--audio-latency",
+        type=LatencyProfile.parse,
+        default=LatencyProfile(median_ms=120, jitter=0.5),
+        help="same format as --hue-latency",
+    )
+    parser.add_argument(
+        "--playback-seconds",
+        type=float,
+        default=0.0,
+        help="how long the fake audio strategy blocks in play()",
+    )
+    parser.add_argument("--with-sound", action="store_true")
+    parser.add_argument("--real-time", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--trace-file",
+        default=None,
+        help="Record every ramp as a trace into this JSONL file",
+    )
+    parser.add_argument("--output", type=Path, default=Path("ramp_timing.json"))
+    args = parser.parse_args()
+
+    config = RampTimingConfig(
+        ramps=args.ramps,
+        duration_minutes=args.duration,
+        steps=args.steps,
+        hue_latency=args.hue_latency,
+        audio_latency=args.audio_latency,
+        playback_seconds=args.playback_seconds,
+        with_sound=args.with_sound,
+        real_time=args.real_time,
+        seed=args.seed,
+        trace_file=args.trace_file,
+    )
+    report = run(config)
+    args.output.write_text(json.dumps(report, indent=2))
+
+    _print_summary(report)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
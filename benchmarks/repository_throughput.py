@@ -0,0 +1,93 @@
+import argparse
+import asyncio
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from backend.src.domain.aggregates import SunriseAlarm
+from backend.src.infrastructure.persistence.database import (
+    DEFAULT_SQLITE_PROFILE,
+    DatabaseConfig,
+    SQLitePerformanceProfile,
+)
+from backend.src.infrastructure.persistence.repository import (
+    AsyncSQLiteAlarmRepository,
+)
+from backend.src.infrastructure.sound_profiles import SoundProfileRepository
+
+_ASSETS_DIR = Path(__file__).parent.parent / "assets"
+
+
+async def _measure(
+    operation: Callable[[], Awaitable[object]], iterations: int
+) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await operation()
+    elapsed = time.perf_counter() - started
+    return iterations / elapsed if elapsed > 0 else float("inf")
+
+
+async def run_profile(
+    label: str,
+    profile: SQLitePerformanceProfile | None,
+    alarm_count: int,
+    list_iterations: int,
+) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_config = DatabaseConfig(
+            f"sqlite:///{Path(tmp_dir) / 'bench.db'}", sqlite_profile=profile
+        )
+        await db_config.create_tables_async()
+
+        alarms = [SunriseAlarm(room_name=f"Room {i}") for i in range(alarm_count)]
+        alarm_iter = iter(alarms)
+        id_iter = iter([alarm.id for alarm in alarms])
+
+        async for session in db_config.get_async_session():
+            repository = AsyncSQLiteAlarmRepository(
+                session, SoundProfileRepository(_ASSETS_DIR)
+            )
+
+            results = {
+                "save": await _measure(
+                    lambda: repository.save(next(alarm_iter)), alarm_count
+                ),
+                "find_by_id": await _measure(
+                    lambda: repository.find_by_id(next(id_iter)), alarm_count
+                ),
+                "find_all": await _measure(repository.find_all, list_iterations),
+            }
+
+        await db_config.dispose_async()
+
+    print(
+        f"{label:<10} "
+        + "  ".join(f"{name}={ops:>10.1f} ops/s" for name, ops in results.items())
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Repository throughput with and without the SQLite profile"
+    )
+    parser.add_argument("--alarms", type=int, default=1000)
+    parser.add_argument("--list-iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.alarms} alarms, {args.list_iterations} find_all iterations")
+    baseline = asyncio.run(
+        run_profile("default", None, args.alarms, args.list_iterations)
+    )
+    tuned = asyncio.run(
+        run_profile("tuned", DEFAULT_SQLITE_PROFILE, args.alarms, args.list_iterations)
+    )
+
+    for name in baseline:
+        print(f"{name:<12} speedup x{tuned[name] / baseline[name]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
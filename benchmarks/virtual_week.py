@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from backend.src.application.alarm_scheduler import AlarmScheduler
+from backend.src.application.event_dispatcher import EventDispatcher
+from backend.src.application.use_cases import TriggerScheduledAlarmUseCase
+from backend.src.domain.aggregates import SunriseAlarm
+from backend.src.domain.clock import Clock, system_clock
+from backend.src.domain.events import DomainEvent
+from backend.src.domain.value_objects import (
+    EVERY_DAY,
+    Duration,
+    Recurrence,
+    ScheduledTime,
+    TransitionSteps,
+)
+from backend.src.infrastructure.event_handlers import EventHandler, WaitRequestedHandler
+from backend.src.infrastructure.virtual_time import run_in_virtual_time
+
+
+class RecordingHandler(EventHandler):
+    def __init__(self, clock: Clock):
+        self._clock = clock
+        self.records: list[tuple[datetime, DomainEvent]] = []
+
+    def can_handle(self, event: DomainEvent) -> bool:
+        return True
+
+    async def handle(self, event: DomainEvent) -> None:
+        self.records.append((self._clock.now(), event))
+
+
+def _build_alarms(
+    clock: Clock, count: int, duration_minutes: int, steps: int, seed: int
+) -> list[SunriseAlarm]:
+    rng = random.Random(seed)
+    return [
+        SunriseAlarm(
+            room_name=f"Room {i}",
+            duration=Duration(minutes=duration_minutes),
+            steps=TransitionSteps(count=steps),
+            scheduled_time=ScheduledTime(
+                hour=rng.randrange(24), minute=rng.randrange(60)
+            ),
+            # Random non-empty weekday mask, so most alarms fire several times
+            recurrence=Recurrence(weekdays=rng.randrange(1, EVERY_DAY + 1)),
+            clock=clock,
+        )
+        for i in range(count)
+    ]
+
+
+async def simulate(
+    clock: Clock,
+    alarm_count: int,
+    days: int,
+    duration_minutes: int,
+    steps: int,
+    seed: int,
+) -> RecordingHandler:
+    recorder = RecordingHandler(clock)
+    dispatcher = EventDispatcher([recorder, WaitRequestedHandler(clock)])
+    scheduler = AlarmScheduler(clock)
+    for alarm in _build_alarms(clock, alarm_count, duration_minutes, steps, seed):
+        scheduler.register_alarm(alarm)
+
+    scheduler_task = asyncio.create_task(
+        scheduler.run(TriggerScheduledAlarmUseCase(dispatcher).execute)
+    )
+    await clock.sleep(days * 24 * 3600)
+    scheduler_task.cancel()
+    return recorder
+
+
+def _relative_trace(recorder: RecordingHandler) -> list[tuple[str, int]]:
+    # Event type plus whole seconds since that alarm's first event, which is
+    # what must match between virtual and real time.
+    first_seen: dict = {}
+    trace = []
+    for at, event in recorder.records:
+        started = first_seen.setdefault(event.aggregate_id, event.occurred_at)
+        trace.append(
+            (type(event).__name__, round((event.occurred_at - started).total_seconds()))
+        )
+    return trace
+
+
+async def _single_ramp(clock: Clock, steps: int) -> RecordingHandler:
+    recorder = RecordingHandler(clock)
+    dispatcher = EventDispatcher([recorder, WaitRequestedHandler(clock)])
+    now = clock.now()
+    alarm = SunriseAlarm(
+        room_name="Compare",
+        duration=Duration(minutes=1),
+        steps=TransitionSteps(count=steps),
+        scheduled_time=ScheduledTime(hour=now.hour, minute=now.minute),
+        clock=clock,
+    )
+    await TriggerScheduledAlarmUseCase(dispatcher).execute(alarm)
+    return recorder
+
+
+def compare_with_real_time(steps: int) -> None:
+    print(f"Running a one-minute ramp with {steps} steps in real time...")
+    real = _relative_trace(asyncio.run(_single_ramp(system_clock, steps)))
+    virtual = _relative_trace(
+        run_in_virtual_time(lambda clock: _single_ramp(clock, steps), datetime.now())
+    )
+    print(f"virtual trace matches real time: {real == virtual}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Simulate days of scheduled sunrise alarms in virtual time"
+    )
+    parser.add_argument("--alarms", type=int, default=50)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--duration", type=int, default=7, help="ramp minutes")
+    parser.add_argument("--steps", type=int, default=70)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--compare-real",
+        action="store_true",
+        help="also run a one-minute ramp in real time and compare the traces",
+    )
+    args = parser.parse_args()
+
+    start = datetime(2026, 1, 5)
+    started = time.perf_counter()
+    recorder = run_in_virtual_time(
+        lambda clock: simulate(
+            clock, args.alarms, args.days, args.duration, args.steps, args.seed
+        ),
+        start,
+    )
+    elapsed = time.perf_counter() - started
+
+    counts = Counter(type(event).__name__ for _, event in recorder.records)
+    last_event_at = recorder.records[-1][0] if recorder.records else start
+    print(
+        f"Simulated {args.days} day(s) with {args.alarms} alarm(s) "
+        f"in {elapsed * 1000:.1f} ms wall time"
+    )
+    print(f"last event at {last_event_at:%Y-%m-%d %H:%M:%S} (virtual)")
+    for name, count in sorted(counts.items()):
+        print(f"  {name:<28} {count}")
+
+    late = [
+        event
+        for handled_at, event in recorder.records
+        if abs((handled_at - event.occurred_at) / timedelta(seconds=1)) > 1e-6
+    ]
+    print(f"events handled later than they occurred: {len(late)}")
+
+    if args.compare_real:
+        compare_with_real_time(steps=4)
+
+
+if __name__ == "__main__":
+    main()